@@ -0,0 +1,291 @@
+"""Generates synthetic SPIIR LIGO_LW XML Documents for benchmarking.
+
+Each document contains a postcoh table with a configurable number of rows, as well as
+sngl_inspiral, coinc_event, coinc_event_map and coinc_inspiral tables describing one
+coincidence, and optionally REAL8FrequencySeries PSDs and COMPLEX8TimeSeries SNR
+series (one per sngl_inspiral row) in the same layout written by the SPIIR pipeline.
+Documents are named <IFOS>_<GPS>_<N>_<ROWS>.xml, as SPIIR trigger files are.
+
+Usage:
+    python benchmarks/generate.py /tmp/spiir-bench --n-files 10 --n-rows 100000
+    python benchmarks/generate.py /tmp/spiir-bench --ilwdchar --n-psds 2 --n-snrs 3
+"""
+import argparse
+import gzip
+import io
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+import ligo.lw.lsctables
+import ligo.lw.table
+
+from spiir.io.ligolw import write_ligolw_tables
+
+
+IFOS = ["H1", "L1", "V1", "K1"]
+
+GPS_START = 1187000000
+
+
+def _random_columns(
+    table: str, n: int, rng: np.random.Generator
+) -> Dict[str, np.ndarray]:
+    # fill every column of a table's schema with random values of its type
+    validcolumns = ligo.lw.lsctables.TableByName[table].validcolumns
+    data = {}
+    for key, coltype in validcolumns.items():
+        name = ligo.lw.table.Column.ColumnName(key)
+        if coltype in ("int_4s", "int_8s"):
+            data[name] = rng.integers(0, 1024, n).astype(
+                np.int32 if coltype == "int_4s" else np.int64
+            )
+        elif coltype in ("real_4", "real_8"):
+            data[name] = rng.random(n).astype(
+                np.float32 if coltype == "real_4" else np.float64
+            )
+        else:
+            data[name] = np.full(n, "", dtype=object)
+    return data
+
+
+def generate_tables(
+    n_rows: int,
+    ifos: List[str],
+    gps: int,
+    rng: np.random.Generator,
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """Generates the columns of a postcoh table with n_rows rows, and of the sngl and
+    coinc tables describing a single coincidence between each ifo."""
+    end_time = gps + np.sort(rng.random(n_rows)) * 1000
+    postcoh = _random_columns("postcoh", n_rows, rng)
+    postcoh.update({
+        "event_id": np.arange(n_rows, dtype=np.int64),
+        "process_id": np.zeros(n_rows, dtype=np.int64),
+        "end_time": end_time.astype(np.int32),
+        "end_time_ns": ((end_time % 1) * 1e9).astype(np.int32),
+        "far": (10 ** rng.uniform(-12, -2, n_rows)).astype(np.float32),
+        "cohsnr": rng.uniform(4, 20, n_rows).astype(np.float32),
+        "is_background": (rng.random(n_rows) < 0.9).astype(np.int32),
+        "ifos": rng.choice(["".join(ifos), *ifos[:2]], n_rows).astype(object),
+        "pivotal_ifo": rng.choice(ifos, n_rows).astype(object),
+        "skymap_fname": np.full(n_rows, "", dtype=object),
+    })
+
+    n_sngl = len(ifos)
+    sngl_inspiral = _random_columns("sngl_inspiral", n_sngl, rng)
+    sngl_inspiral.update({
+        "event_id": np.arange(n_sngl, dtype=np.int64),
+        "process_id": np.ones(n_sngl, dtype=np.int64),
+        "ifo": np.array(ifos, dtype=object),
+        "end_time": np.full(n_sngl, gps, dtype=np.int32),
+        "snr": rng.uniform(4, 20, n_sngl).astype(np.float32),
+    })
+
+    coinc_event = {
+        "coinc_event_id": np.array([1], dtype=np.int64),
+        "coinc_def_id": np.array([0], dtype=np.int64),
+        "process_id": np.array([1], dtype=np.int64),
+        "time_slide_id": np.array([0], dtype=np.int64),
+        "instruments": np.array([",".join(ifos)], dtype=object),
+        "nevents": np.array([n_sngl], dtype=np.int32),
+        "likelihood": np.array([0.], dtype=np.float64),
+    }
+    coinc_event_map = {
+        "coinc_event_id": np.ones(n_sngl, dtype=np.int64),
+        "event_id": np.arange(n_sngl, dtype=np.int64),
+        "table_name": np.full(n_sngl, "sngl_inspiral", dtype=object),
+    }
+    coinc_inspiral = _random_columns("coinc_inspiral", 1, rng)
+    coinc_inspiral.update({
+        "coinc_event_id": np.array([1], dtype=np.int64),
+        "end_time": np.array([gps], dtype=np.int32),
+        "ifos": np.array([",".join(ifos)], dtype=object),
+    })
+
+    return {
+        "sngl_inspiral": sngl_inspiral,
+        "coinc_event": coinc_event,
+        "coinc_event_map": coinc_event_map,
+        "coinc_inspiral": coinc_inspiral,
+        "postcoh": postcoh,
+    }
+
+
+def _format_array(values: np.ndarray, indent: str) -> str:
+    # format a 2D array as the rows of a space delimited LIGO_LW Array Stream
+    buffer = io.StringIO()
+    np.savetxt(buffer, values, fmt="%.16g", delimiter=" ", newline=" \n" + indent)
+    return indent + buffer.getvalue().rstrip(" \n\t")
+
+
+def format_psd(ifo: str, gps: int, length: int, rng: np.random.Generator) -> str:
+    """Formats a random REAL8FrequencySeries PSD as a LIGO_LW element."""
+    df = 0.03125
+    values = np.column_stack([np.arange(length) * df, rng.random(length) * 1e-40])
+    return (
+        '\t<LIGO_LW Name="REAL8FrequencySeries">\n'
+        f'\t\t<Time Name="epoch" Type="GPS">{gps}</Time>\n'
+        '\t\t<Param Name="f0:param" Type="real_8" Unit="s^-1">0</Param>\n'
+        '\t\t<Array Name="PSD:array" Type="real_8" Unit="s strain^2">\n'
+        f'\t\t\t<Dim Name="Frequency" Scale="{df}" Start="0" Unit="s^-1">'
+        f"{length}</Dim>\n"
+        '\t\t\t<Dim Name="Frequency,Real">2</Dim>\n'
+        '\t\t\t<Stream Delimiter=" " Type="Local">\n'
+        f"{_format_array(values, chr(9) * 4)}\n"
+        "\t\t\t</Stream>\n"
+        "\t\t</Array>\n"
+        f'\t\t<Param Name="instrument:param" Type="lstring">{ifo}</Param>\n'
+        "\t</LIGO_LW>\n"
+    )
+
+
+def format_snr_series(
+    event_id: int,
+    gps: int,
+    length: int,
+    ilwdchar: bool,
+    rng: np.random.Generator,
+) -> str:
+    """Formats a random COMPLEX8TimeSeries SNR series as a LIGO_LW element."""
+    dt = 0.00048828125
+    values = np.column_stack([np.arange(length) * dt, rng.normal(0, 4, (length, 2))])
+    event_id_param = (
+        f'<Param Name="event_id:param" Type="ilwd:char">'
+        f"sngl_inspiral:event_id:{event_id}</Param>"
+        if ilwdchar
+        else f'<Param Name="event_id:param" Type="int_8s">{event_id}</Param>'
+    )
+    return (
+        '\t<LIGO_LW Name="COMPLEX8TimeSeries">\n'
+        f'\t\t<Time Name="epoch" Type="GPS">{gps}.{rng.integers(0, 10**9):09d}</Time>\n'
+        '\t\t<Param Name="f0:param" Type="real_8" Unit="s^-1">0</Param>\n'
+        '\t\t<Array Name="snr:array" Type="real_8" Unit="">\n'
+        f'\t\t\t<Dim Name="Time" Scale="{dt}" Start="0" Unit="s">{length}</Dim>\n'
+        '\t\t\t<Dim Name="Time,Real,Imaginary">3</Dim>\n'
+        '\t\t\t<Stream Delimiter=" " Type="Local">\n'
+        f"{_format_array(values, chr(9) * 4)}\n"
+        "\t\t\t</Stream>\n"
+        "\t\t</Array>\n"
+        f"\t\t{event_id_param}\n"
+        "\t</LIGO_LW>\n"
+    )
+
+
+def generate_document(
+    path: os.PathLike,
+    n_rows: int = 10_000,
+    ilwdchar: bool = False,
+    n_psds: int = 2,
+    n_snrs: int = 2,
+    psd_length: int = 32769,
+    snr_length: int = 351,
+    gps: int = GPS_START,
+    seed: Optional[int] = None,
+):
+    """Writes a synthetic SPIIR LIGO_LW XML Document to path, which is gzip
+    compressed if path ends with ".gz".
+
+    Parameters
+    ----------
+    path: PathLike
+        The path to write the document to.
+    n_rows: int
+        The number of rows in the postcoh table.
+    ilwdchar: bool
+        Whether to write IDs as legacy ilwd:char strings.
+    n_psds: int
+        The number of PSDs (one per ifo, at most 4).
+    n_snrs: int
+        The number of SNR series (one per sngl_inspiral row, at most 4).
+    psd_length: int
+        The number of frequency bins of each PSD.
+    snr_length: int
+        The number of samples of each SNR series.
+    gps: int
+        The GPS time of the document.
+    seed: int | None = None
+        The seed of the random number generator.
+    """
+    rng = np.random.default_rng(seed)
+    ifos = IFOS[:max(n_psds, n_snrs, 2)]
+    tables = generate_tables(n_rows, ifos, gps, rng)
+
+    buffer = io.BytesIO()
+    write_ligolw_tables(buffer, tables, ilwdchar_compat=ilwdchar, compress=False)
+    text = buffer.getvalue().decode("utf-8")
+    text = text[:text.rindex("</LIGO_LW>")]
+
+    parts = [text]
+    parts += [format_psd(ifo, gps, psd_length, rng) for ifo in ifos[:n_psds]]
+    parts += [
+        format_snr_series(i, gps, snr_length, ilwdchar, rng) for i in range(n_snrs)
+    ]
+    parts.append("</LIGO_LW>\n")
+
+    data = "".join(parts).encode("utf-8")
+    if str(path).endswith(".gz"):
+        data = gzip.compress(data, compresslevel=3)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def generate_documents(
+    directory: os.PathLike,
+    n_files: int = 1,
+    n_rows: int = 10_000,
+    compress: bool = False,
+    seed: Optional[int] = None,
+    **kwargs,
+) -> List[Path]:
+    """Writes n_files synthetic SPIIR LIGO_LW XML Documents to a directory, and returns
+    their paths. See generate_document for the remaining keyword arguments."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    paths = []
+    for i in range(n_files):
+        gps = GPS_START + 1000 * i
+        ifos = "".join(IFOS[:max(kwargs.get("n_psds", 2), kwargs.get("n_snrs", 2), 2)])
+        path = directory / f"{ifos}_{gps}_{i}_{n_rows}.xml{'.gz' if compress else ''}"
+        generate_document(
+            path, n_rows, gps=gps, seed=int(rng.integers(2**32)), **kwargs
+        )
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory")
+    parser.add_argument("--n-files", type=int, default=1)
+    parser.add_argument("--n-rows", type=int, default=10_000)
+    parser.add_argument("--ilwdchar", action="store_true")
+    parser.add_argument("--n-psds", type=int, default=2)
+    parser.add_argument("--n-snrs", type=int, default=2)
+    parser.add_argument("--psd-length", type=int, default=32769)
+    parser.add_argument("--snr-length", type=int, default=351)
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    paths = generate_documents(
+        args.directory,
+        n_files=args.n_files,
+        n_rows=args.n_rows,
+        compress=args.gzip,
+        seed=args.seed,
+        ilwdchar=args.ilwdchar,
+        n_psds=args.n_psds,
+        n_snrs=args.n_snrs,
+        psd_length=args.psd_length,
+        snr_length=args.snr_length,
+    )
+    for path in paths:
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
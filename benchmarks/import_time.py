@@ -0,0 +1,69 @@
+"""Benchmarks the time taken to import spiir.io.ligolw in a fresh interpreter.
+
+Heavy optional dependencies (pandas, gwpy, astropy and lal.series) should only be
+imported on first use, so this script exits with a non-zero status if any of them are
+imported by spiir.io.ligolw, or if the median import time exceeds --max-seconds.
+
+Usage:
+    python benchmarks/import_time.py --repeat 5 --max-seconds 1.0
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+
+LAZY_MODULES = ("pandas", "gwpy", "astropy", "lal.series")
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+duration = time.perf_counter() - start
+print(json.dumps({{"seconds": duration, "modules": sorted(sys.modules)}}))
+"""
+
+
+def time_import(module: str) -> dict:
+    """Imports a module in a fresh Python interpreter and returns the import duration
+    in seconds and the names of all modules that were imported."""
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(module=module)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="spiir.io.ligolw")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-seconds", type=float, default=None)
+    args = parser.parse_args()
+
+    results = [time_import(args.module) for _ in range(args.repeat)]
+    seconds = [result["seconds"] for result in results]
+    eager = sorted(
+        name for name in LAZY_MODULES
+        if any(name in result["modules"] for result in results)
+    )
+
+    print(json.dumps({
+        "module": args.module,
+        "repeat": args.repeat,
+        "median_seconds": statistics.median(seconds),
+        "min_seconds": min(seconds),
+        "eager_imports": eager,
+    }, indent=4))
+
+    if eager:
+        sys.exit(f"{args.module} eagerly imports {', '.join(eager)}.")
+    if args.max_seconds is not None and statistics.median(seconds) > args.max_seconds:
+        sys.exit(f"{args.module} took longer than {args.max_seconds}s to import.")
+
+
+if __name__ == "__main__":
+    main()
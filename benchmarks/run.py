@@ -0,0 +1,293 @@
+"""Benchmarks the throughput and peak memory of the spiir.io.ligolw loaders.
+
+Each benchmark is run in a fresh Python interpreter over the same LIGO_LW XML
+Documents, either from an existing directory or generated with benchmarks/generate.py,
+and the results (including the import time of spiir.io.ligolw) are written as JSON so
+that they can be compared between revisions. If a baseline is given with --compare,
+this script exits with a non-zero status if any benchmark is slower than the baseline
+by more than --tolerance.
+
+Usage:
+    python benchmarks/run.py --n-files 4 --n-rows 100000 --output results.json
+    python benchmarks/run.py --directory /path/to/zerolags --cases load_ligolw_tables
+    python benchmarks/run.py --compare results.json --tolerance 0.25
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from generate import generate_documents
+from import_time import time_import
+
+
+def _load_xmldoc(paths: List[str]):
+    from spiir.io.ligolw import load_ligolw_xmldoc
+
+    return [load_ligolw_xmldoc(path) for path in paths]
+
+
+def _load_postcoh_xmldoc(paths: List[str]):
+    from spiir.io.ligolw import load_ligolw_xmldoc
+
+    return [
+        load_ligolw_xmldoc(path, tables=["postcoh"], arrays=[], columnar=True)
+        for path in paths
+    ]
+
+
+def _load_tables(paths: List[str]):
+    from spiir.io.ligolw import load_ligolw_tables
+
+    return load_ligolw_tables(paths, "postcoh")
+
+
+def _load_compat_xmldocs(paths: List[str]):
+    # strip_ilwdchar is benchmarked on documents loaded without ilwdchar conversion
+    from spiir.io.ligolw import load_ligolw_xmldoc
+
+    return [load_ligolw_xmldoc(path, ilwdchar_compat=False) for path in paths]
+
+
+def _strip_ilwdchar(xmldocs: list):
+    from spiir.io.ligolw import strip_ilwdchar
+
+    return [strip_ilwdchar(xmldoc) for xmldoc in xmldocs]
+
+
+def _get_psd_instruments(paths: List[str]) -> List[Tuple[str, str]]:
+    # documents may hold multiple arrays, so each PSD is read by its instrument
+    from spiir.io.ligolw import load_ligolw_psds
+
+    return [(path, ifo) for path in paths for ifo in load_ligolw_psds(path).columns]
+
+
+def _load_frequency_series(psds: List[Tuple[str, str]]):
+    from spiir.io.ligolw import load_ligolw_frequency_series
+
+    return [
+        load_ligolw_frequency_series(path, name="PSD", instrument=ifo)
+        for path, ifo in psds
+    ]
+
+
+def _load_psds(paths: List[str]):
+    from spiir.io.ligolw import load_ligolw_psds
+
+    return [load_ligolw_psds(path) for path in paths]
+
+
+def _load_snr_series(paths: List[str]):
+    from spiir.io.ligolw import load_all_ligolw_snr_series
+
+    return [load_all_ligolw_snr_series(path, ilwdchar_compat=True) for path in paths]
+
+
+def _load_snr_array(paths: List[str]):
+    from spiir.io.ligolw import load_ligolw_snr_array
+
+    return [load_ligolw_snr_array(path) for path in paths]
+
+
+def _load_snr_tensor(paths: List[str]):
+    from spiir.io.ligolw import load_ligolw_snr_array, load_ligolw_snr_tensor
+
+    ifos = load_ligolw_snr_array(paths[0]).ifos
+    return load_ligolw_snr_tensor(paths, sorted(set(ifos)))
+
+
+# each benchmark is an optional setup function, whose output is passed to the timed
+# function (which otherwise receives the document paths)
+CASES: Dict[str, Tuple[Callable, Callable]] = {
+    "load_ligolw_xmldoc": (None, _load_xmldoc),
+    "load_ligolw_xmldoc[postcoh,columnar]": (None, _load_postcoh_xmldoc),
+    "load_ligolw_tables": (None, _load_tables),
+    "strip_ilwdchar": (_load_compat_xmldocs, _strip_ilwdchar),
+    "load_ligolw_frequency_series": (_get_psd_instruments, _load_frequency_series),
+    "load_ligolw_psds": (None, _load_psds),
+    "load_all_ligolw_snr_series": (None, _load_snr_series),
+    "load_ligolw_snr_array": (None, _load_snr_array),
+    "load_ligolw_snr_tensor": (None, _load_snr_tensor),
+}
+
+# the benchmarks whose throughput is also measured in postcoh rows per second
+ROW_CASES = {
+    "load_ligolw_xmldoc",
+    "load_ligolw_xmldoc[postcoh,columnar]",
+    "load_ligolw_tables",
+    "strip_ilwdchar",
+}
+
+
+def run_case(case: str, paths: List[str], repeat: int) -> dict:
+    """Runs a benchmark in the current interpreter and returns the duration of each
+    repeat in seconds, as well as its peak traced and resident memory in bytes."""
+    setup, func = CASES[case]
+    seconds = []
+    for _ in range(repeat):
+        state = setup(paths) if setup is not None else paths
+        start = time.perf_counter()
+        func(state)
+        seconds.append(time.perf_counter() - start)
+        del state
+
+    # memory is traced in a separate run as tracing slows down allocations
+    state = setup(paths) if setup is not None else paths
+    tracemalloc.start()
+    func(state)
+    _, peak_traced = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # ru_maxrss is in kilobytes on Linux, but in bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return {
+        "seconds": seconds,
+        "peak_traced_bytes": peak_traced,
+        "peak_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale,
+    }
+
+
+def benchmark(case: str, paths: List[str], repeat: int, n_rows: int) -> dict:
+    """Runs a benchmark in a fresh Python interpreter and summarises its results."""
+    output = subprocess.run(
+        [sys.executable, __file__, "--worker", case, "--repeat", str(repeat), *paths],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+
+    median = statistics.median(result["seconds"])
+    size = sum(os.path.getsize(path) for path in paths)
+    summary = {
+        "median_seconds": median,
+        "min_seconds": min(result["seconds"]),
+        "files_per_second": len(paths) / median,
+        "mb_per_second": size / 1e6 / median,
+        "peak_traced_bytes": result["peak_traced_bytes"],
+        "peak_rss_bytes": result["peak_rss_bytes"],
+    }
+    if case in ROW_CASES:
+        summary["rows_per_second"] = n_rows / median
+    return summary
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Returns a description of each benchmark that is slower than its baseline."""
+    regressions = []
+    for case, result in results["benchmarks"].items():
+        before = baseline.get("benchmarks", {}).get(case, {})
+        if "median_seconds" not in before or "median_seconds" not in result:
+            continue
+        ratio = result["median_seconds"] / before["median_seconds"]
+        if ratio > 1 + tolerance:
+            regressions.append(f"{case} is {ratio:.2f}x slower than the baseline.")
+    return regressions
+
+
+def _count_rows(paths: List[str]) -> int:
+    from spiir.io.ligolw import load_ligolw_table_columns
+
+    return sum(
+        len(load_ligolw_table_columns(path, "postcoh", ["event_id"])["event_id"])
+        for path in paths
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", help=argparse.SUPPRESS)
+    parser.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--directory", default=None)
+    parser.add_argument("--cases", nargs="+", default=list(CASES), choices=list(CASES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--n-files", type=int, default=4)
+    parser.add_argument("--n-rows", type=int, default=10_000)
+    parser.add_argument("--ilwdchar", action="store_true")
+    parser.add_argument("--n-psds", type=int, default=2)
+    parser.add_argument("--n-snrs", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--compare", default=None)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        print(json.dumps(run_case(args.worker, args.paths, args.repeat)))
+        return
+
+    with tempfile.TemporaryDirectory(prefix="spiir-bench-") as tmpdir:
+        if args.directory is not None:
+            paths = sorted(
+                str(path) for path in Path(args.directory).iterdir()
+                if path.name.endswith((".xml", ".xml.gz"))
+            )
+        else:
+            paths = [str(path) for path in generate_documents(
+                tmpdir,
+                n_files=args.n_files,
+                n_rows=args.n_rows,
+                seed=args.seed,
+                ilwdchar=args.ilwdchar,
+                n_psds=args.n_psds,
+                n_snrs=args.n_snrs,
+            )]
+
+        n_rows = _count_rows(paths)
+        imports = [time_import("spiir.io.ligolw") for _ in range(args.repeat)]
+        results = {
+            "metadata": {
+                "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "numpy": np.__version__,
+                "directory": args.directory,
+                "n_files": len(paths),
+                "n_rows": n_rows,
+                "bytes": sum(os.path.getsize(path) for path in paths),
+                "ilwdchar": args.ilwdchar,
+                "n_psds": args.n_psds,
+                "n_snrs": args.n_snrs,
+                "repeat": args.repeat,
+            },
+            "import": {
+                "median_seconds": statistics.median(r["seconds"] for r in imports),
+                "min_seconds": min(r["seconds"] for r in imports),
+            },
+            "benchmarks": {},
+        }
+        for case in args.cases:
+            try:
+                result = benchmark(case, paths, args.repeat, n_rows)
+            except subprocess.CalledProcessError as exc:
+                result = {"error": exc.stderr.strip().splitlines()[-1]}
+            results["benchmarks"][case] = result
+            print(f"{case}: {results['benchmarks'][case]}", file=sys.stderr)
+
+    output = json.dumps(results, indent=4)
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+
+    if args.compare is not None:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            sys.exit("\n".join(regressions))
+
+
+if __name__ == "__main__":
+    main()
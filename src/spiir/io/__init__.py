@@ -1 +1,5 @@
 from . import ligolw
+from .archive import TriggerArchive, pack_trigger_archive
+from .catalog import TriggerFileCatalog, parse_trigger_filename
+from .follow import TriggerFileFollower
+from .sqlite import TriggerDatabase
@@ -0,0 +1,750 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import Executor
+from functools import partial
+from os import PathLike
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .catalog import _scan_trigger_files, parse_trigger_filename
+from .ligolw.ligolw import _get_null_column
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .ligolw import SNRSeriesArray
+
+
+logger = logging.getLogger(__name__)
+
+
+_VERSION = 1
+
+
+def _get_psds(xmldoc) -> Tuple[List[str], List[float], List[float], List[np.ndarray]]:
+    # get the ifo, f0, frequency step and values of every REAL8FrequencySeries PSD
+    from ligo.lw import ligolw
+    import ligo.lw.param
+
+    ifos, f0s, dfs, values = [], [], [], []
+    for elem in xmldoc.getElementsByTagName(ligolw.LIGO_LW.tagName):
+        if not elem.hasAttribute("Name") or elem.Name != "REAL8FrequencySeries":
+            continue
+        ifo = ligo.lw.param.get_param(elem, "instrument").value
+        array, = elem.getElementsByTagName(ligolw.Array.tagName)
+        if len(array.array[1]) == 0:
+            # empty PSDs are ignored, as in load_ligolw_psds
+            logger.debug("Ignoring empty PSD for %s.", ifo)
+            continue
+        dim = array.getElementsByTagName(ligolw.Dim.tagName)[0]
+        ifos.append(ifo)
+        f0s.append(ligo.lw.param.get_param(elem, "f0").value)
+        dfs.append(dim.Scale)
+        values.append(np.array(array.array[1], dtype=np.float64))
+    return ifos, f0s, dfs, values
+
+
+def _get_column_dtype(table: str, name: str) -> np.dtype:
+    # the NumPy dtype of a column in its table's validcolumns, or object if unknown
+    import ligo.lw.lsctables
+    import ligo.lw.table
+    import ligo.lw.types
+
+    table_name = ligo.lw.table.Table.TableName(table)
+    table_class = ligo.lw.lsctables.TableByName.get(table_name)
+    validcolumns = table_class.validcolumns if table_class is not None else {}
+    coltypes = {
+        ligo.lw.table.Column.ColumnName(column): coltype
+        for column, coltype in validcolumns.items()
+    }
+    return np.dtype(ligo.lw.types.ToNumPyType.get(coltypes.get(name), object))
+
+
+def _load_archive_file(
+    path: str,
+    table: str,
+    columns: Optional[List[str]],
+    ilwdchar_compat: bool,
+    psds: bool,
+    snrs: bool,
+) -> Optional[Dict[str, Any]]:
+    # load the table, PSDs and SNR series of a single file in one parse, returning
+    # None if it cannot be read. Columns that are missing from the file's table are
+    # filled with null values, such that every file has the same columns.
+    from ligo.lw import ligolw
+    import ligo.lw.table
+
+    from .ligolw import (
+        get_ligolw_snr_array_from_xmldoc,
+        get_ligolw_table_columns_from_xmldoc,
+        load_ligolw_xmldoc,
+    )
+
+    tables = [table] + (["sngl_inspiral"] if snrs and table != "sngl_inspiral" else [])
+    arrays = (["PSD"] if psds else []) + (["snr"] if snrs else [])
+    selected_columns = {"sngl_inspiral": ["event_id", "ifo"]}
+    if columns is not None:
+        selected_columns[table] = columns
+    elif table == "sngl_inspiral":
+        del selected_columns[table]
+
+    try:
+        xmldoc = load_ligolw_xmldoc(
+            path,
+            ilwdchar_compat,
+            tables=tables,
+            arrays=arrays,
+            columns=selected_columns,
+            columnar=True,
+        )
+        ligolw_table = ligo.lw.table.Table.get_table(xmldoc, name=table)
+        names = ligolw_table.columnnames
+        if columns is not None:
+            names = [name for name in columns if name in names]
+        data = get_ligolw_table_columns_from_xmldoc(xmldoc, table, names)
+        data = {name: np.array(values) for name, values in data.items()}
+        if columns is not None:
+            array = getattr(ligolw_table, "array", None)
+            length = len(array) if array is not None else len(ligolw_table)
+            data = {
+                name: data[name] if name in data else _get_null_column(
+                    length, _get_column_dtype(table, name)
+                )
+                for name in columns
+            }
+        result = {
+            "table": data,
+            "psds": _get_psds(xmldoc) if psds else ([], [], [], []),
+            "snrs": None,
+        }
+        if snrs and any(
+            getattr(array, "Name", None) == "snr"
+            for array in xmldoc.getElementsByTagName(ligolw.Array.tagName)
+        ):
+            result["snrs"] = get_ligolw_snr_array_from_xmldoc(xmldoc)
+        xmldoc.unlink()
+    except Exception as exc:
+        logger.warning("Failed to read %s in %s: %s", table, path, exc)
+        return None
+    return result
+
+
+def _save_column(path: Path, values: np.ndarray) -> str:
+    # save a column as a .npy file, where string columns are stored as fixed-width
+    # unicode arrays (which can be memory-mapped) unless they contain null values
+    values = np.asarray(values)
+    kind = "array"
+    if values.dtype == object:
+        if any(value is None for value in values):
+            kind = "pickle"
+        else:
+            kind = "str"
+            values = values.astype(str)
+    np.save(path, values, allow_pickle=kind == "pickle")
+    return kind
+
+
+def _offsets(lengths: Iterable[int]) -> np.ndarray:
+    # the start offset of each of a sequence of blocks, and the end of the last block
+    return np.concatenate([[0], np.cumsum(list(lengths), dtype=np.int64)])
+
+
+def _write_batch(
+    directory: Path,
+    table: str,
+    files: List[Tuple[str, int, int]],
+    results: List[Dict[str, Any]],
+):
+    # write the tables, PSDs and SNR series of a batch of files as .npy arrays
+    from .ligolw.ligolw import _concatenate_table_columns
+
+    directory.mkdir()
+    data = _concatenate_table_columns([result["table"] for result in results], table)
+    meta = {"table": table, "names": list(data.keys()), "kinds": []}
+    for i, values in enumerate(data.values()):
+        meta["kinds"].append(_save_column(directory / f"column_{i}.npy", values))
+    n_rows = [len(next(iter(result["table"].values()), ())) for result in results]
+    meta["n_rows"] = int(sum(n_rows))
+    meta["n_files"] = len(files)
+
+    # index rows by GPS end time, sorted within the batch
+    if "end_time" in data and "end_time_ns" in data:
+        gps = data["end_time"] + data["end_time_ns"] * 1e-9
+        order = np.argsort(gps, kind="stable")
+        np.save(directory / "gps.npy", gps[order])
+        np.save(directory / "gps_order.npy", order.astype(np.int64))
+
+    # index rows by event_id, sorted within the batch, unless it has null values
+    names = meta["names"]
+    if "event_id" in names and meta["kinds"][names.index("event_id")] != "pickle":
+        event_ids = np.asarray(data["event_id"])
+        if event_ids.dtype == object:
+            event_ids = event_ids.astype(str)
+        order = np.argsort(event_ids, kind="stable")
+        np.save(directory / "event_ids.npy", event_ids[order])
+        np.save(directory / "event_order.npy", order.astype(np.int64))
+
+    paths, sizes, mtimes = zip(*files)
+    arrays = {
+        "file_paths": np.array(paths, dtype=str),
+        "file_sizes": np.array(sizes, dtype=np.int64),
+        "file_mtimes": np.array(mtimes, dtype=np.int64),
+        "row_offsets": _offsets(n_rows),
+    }
+
+    # PSDs and SNR series are stored as contiguous arrays with offsets per series
+    psds = [result["psds"] for result in results]
+    psd_values = [values for _, _, _, file_values in psds for values in file_values]
+    arrays.update({
+        "psd_offsets": _offsets(len(ifos) for ifos, _, _, _ in psds),
+        "psd_ifos": np.array([ifo for ifos, *_ in psds for ifo in ifos], dtype=str),
+        "psd_f0": np.array([f0 for _, f0s, *_ in psds for f0 in f0s], dtype=np.float64),
+        "psd_df": np.array([df for *_, dfs, _ in psds for df in dfs], dtype=np.float64),
+        "psd_value_offsets": _offsets(len(values) for values in psd_values),
+        "psd_values": np.concatenate(psd_values or [np.empty(0, dtype=np.float64)]),
+    })
+
+    snrs = [result["snrs"] for result in results if result["snrs"] is not None]
+    snr_values = [row for snr in snrs for row in snr.snr]
+    arrays.update({
+        "snr_offsets": _offsets(
+            len(result["snrs"].event_ids) if result["snrs"] is not None else 0
+            for result in results
+        ),
+        "snr_event_ids": np.concatenate(
+            [snr.event_ids for snr in snrs] or [np.empty(0, dtype=np.int64)]
+        ),
+        "snr_ifos": np.array([ifo for snr in snrs for ifo in snr.ifos], dtype=str),
+        "snr_epochs": np.concatenate(
+            [snr.epochs for snr in snrs] or [np.empty(0, dtype=np.float64)]
+        ),
+        "snr_dt": np.repeat(
+            [snr.times[1] if len(snr.times) > 1 else 0. for snr in snrs],
+            [len(snr.event_ids) for snr in snrs],
+        ).astype(np.float64),
+        "snr_lengths": np.concatenate(
+            [snr.lengths for snr in snrs] or [np.empty(0, dtype=np.int64)]
+        ),
+        "snr_value_offsets": _offsets(len(values) for values in snr_values),
+        "snr_values": np.concatenate(
+            snr_values or [np.empty(0, dtype=np.complex64)]
+        ).astype(np.complex64, copy=False),
+    })
+
+    for name, values in arrays.items():
+        np.save(directory / f"{name}.npy", values)
+    with open(directory / "meta.json", "w") as f:
+        json.dump(meta, f)
+
+
+class _Batch:
+    # a memory-mapped batch of an archive, whose arrays are opened when first used
+    def __init__(self, directory: Path):
+        self.directory = directory
+        with open(directory / "meta.json") as f:
+            self.meta = json.load(f)
+        self.names = self.meta["names"]
+        self.n_rows = self.meta["n_rows"]
+        self.n_files = self.meta["n_files"]
+        self._arrays = {}
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        array = self._arrays.get(name)
+        if array is None:
+            array = self._arrays[name] = np.load(
+                self.directory / f"{name}.npy", mmap_mode="r"
+            )
+        return array
+
+    def has_gps(self) -> bool:
+        return (self.directory / "gps.npy").exists()
+
+    def has_event_ids(self) -> bool:
+        return (self.directory / "event_ids.npy").exists()
+
+    def find(self, event_id: Any) -> np.ndarray:
+        # the batch rows with the given event_id, with a binary search if indexed
+        if not self.has_event_ids():
+            return np.flatnonzero(self.column("event_id", slice(None)) == event_id)
+        sorted_ids = self["event_ids"]
+        value = np.asarray(event_id)
+        if (sorted_ids.dtype.kind == "U") != (value.dtype.kind == "U"):
+            return np.empty(0, dtype=np.int64)  # string and numeric IDs never match
+        lo = np.searchsorted(sorted_ids, value, "left")
+        hi = np.searchsorted(sorted_ids, value, "right")
+        return np.asarray(self["event_order"][lo:hi])
+
+    def column(self, name: str, rows: Union[slice, np.ndarray]) -> np.ndarray:
+        if name not in self.names:
+            # columns of other batches that are missing from this batch are null
+            if isinstance(rows, slice):
+                length = len(range(self.n_rows)[rows])
+            else:
+                length = len(rows)
+            return _get_null_column(length, _get_column_dtype(self.meta["table"], name))
+        i = self.names.index(name)
+        kind = self.meta["kinds"][i]
+        if kind == "pickle":
+            # object columns with null values cannot be memory-mapped
+            values = self._arrays.get(name)
+            if values is None:
+                values = self._arrays[name] = np.load(
+                    self.directory / f"column_{i}.npy", allow_pickle=True
+                )
+            return values[rows]
+        values = np.asarray(self[f"column_{i}"][rows])
+        return values.astype(object) if kind == "str" else values
+
+
+class TriggerArchive:
+    """A packed, append-only archive of SPIIR trigger files with random access by row,
+    GPS time and event.
+
+    Many small LIGO_LW XML Documents are packed into a single directory of batches,
+    where each call to append writes one or more new batches without modifying the
+    existing ones. Each batch stores the rows of a table (e.g. postcoh) as one typed
+    .npy array per column, the PSDs and complex SNR series of each file as contiguous
+    arrays with per-series offsets, and the rows sorted by their GPS end time. Arrays
+    are stored uncompressed and memory-mapped when read, such that fetching a single
+    event only reads the pages that hold it, without parsing or reading the rest.
+
+    Every row is addressed by its global row index (in the order files were appended),
+    and the file it was read from by its global file_index, which is used to look up
+    the PSDs and SNR series of the same document.
+
+    Parameters
+    ----------
+    directory: str | PathLike
+        The archive directory, which is created if it does not exist.
+    table: str
+        The name of the LIGO_LW Table stored in the archive.
+
+    Examples
+    --------
+        >> archive = TriggerArchive("/path/to/archive.spiir")
+        >> archive.append("/path/to/zerolags", n_jobs=8)
+        >> df = archive.query(1187008800, 1187009000)
+        >> event = archive.get_event(df.index[0])
+        >> event["psds"]["H1"], event["snrs"].snr
+    """
+    def __init__(self, directory: Union[str, PathLike], table: str = "postcoh"):
+        self.directory = Path(directory)
+        self._meta_path = self.directory / "meta.json"
+        if self._meta_path.exists():
+            with open(self._meta_path) as f:
+                self._meta = json.load(f)
+            if self._meta["table"] != table:
+                raise ValueError(
+                    f"Archive {self.directory} stores {self._meta['table']} tables, "
+                    f"not {table}."
+                )
+        else:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._meta = {"version": _VERSION, "table": table, "batches": []}
+            self._save_meta()
+        self.table = table
+        self._open_batches()
+
+    def __len__(self) -> int:
+        return int(self._row_offsets[-1])
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({str(self.directory)!r}, table={self.table!r}, "
+            f"files={self.n_files}, rows={len(self)})"
+        )
+
+    def _save_meta(self):
+        fd, tmp = tempfile.mkstemp(prefix=".meta.", suffix=".json", dir=self.directory)
+        with os.fdopen(fd, "w") as f:
+            json.dump(self._meta, f)
+        os.replace(tmp, self._meta_path)
+
+    def _open_batches(self):
+        self._batches = [
+            _Batch(self.directory / name) for name in self._meta["batches"]
+        ]
+        self._row_offsets = _offsets(batch.n_rows for batch in self._batches)
+        self._file_offsets = _offsets(batch.n_files for batch in self._batches)
+        self._file_index = None
+
+    @property
+    def n_files(self) -> int:
+        """The number of files packed into the archive."""
+        return int(self._file_offsets[-1])
+
+    @property
+    def columns(self) -> List[str]:
+        """The names of the columns of the table stored in the archive, i.e. the union
+        of the columns of every batch (in the order they were first packed)."""
+        names = (name for batch in self._batches for name in batch.names)
+        return list(dict.fromkeys(names))
+
+    @property
+    def files(self) -> List[str]:
+        """The path of every packed file, in the order they were appended."""
+        return [
+            path for batch in self._batches for path in batch["file_paths"].tolist()
+        ]
+
+    def _get_file_states(self) -> Dict[str, Tuple[int, int]]:
+        # the (size, mtime_ns) of every packed file by path
+        states = {}
+        for batch in self._batches:
+            for path, size, mtime in zip(
+                batch["file_paths"].tolist(),
+                batch["file_sizes"].tolist(),
+                batch["file_mtimes"].tolist(),
+            ):
+                states[path] = (size, mtime)
+        return states
+
+    def append(
+        self,
+        paths: Union[str, PathLike, Iterable[Union[str, PathLike]]],
+        columns: Optional[List[str]] = None,
+        ilwdchar_compat: bool = True,
+        psds: bool = True,
+        snrs: bool = True,
+        recursive: bool = True,
+        batch_size: int = 1000,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> int:
+        """Packs the LIGO_LW XML Documents at the given paths (or the trigger files in
+        the given directory, by GPS time) that are not already in the archive into new
+        batches, and returns the number of files that were packed.
+
+        Files are parsed once each (in parallel with n_jobs or an executor), and
+        files that fail to parse are skipped individually with a warning so that they
+        can be packed by a later call. Files that were modified after they were packed
+        are also skipped with a warning, as existing batches are never rewritten.
+
+        Each batch stores the union of the columns of its files (or the given columns),
+        where columns that are missing from a file are filled with null values (NaN
+        for floating point columns and None otherwise), and rows are read with the
+        columns of every batch in the same way (see read).
+
+        Parameters
+        ----------
+        paths: str | PathLike | Iterable[str | PathLike]
+            A directory of trigger files, or a path or list of paths to documents.
+        columns: list[str] | None = None
+            A optional list of column names to pack from the table. If None, every
+            column of each file is packed.
+        ilwdchar_compat: bool
+            Whether to add ilwdchar conversion compatibility.
+        psds: bool
+            Whether to pack the REAL8FrequencySeries PSDs of each document.
+        snrs: bool
+            Whether to pack the complex SNR series of each document.
+        recursive: bool
+            Whether to also pack trigger files in subdirectories of a directory.
+        batch_size: int
+            The maximum number of files in each new batch, which bounds the memory used.
+        n_jobs: int | None = None
+            The number of worker processes used to parse documents in parallel.
+        executor: Executor | None = None
+            An optional existing executor to parse documents with.
+
+        Returns
+        -------
+        int
+            The number of files that were packed into the archive.
+        """
+        from .ligolw.ligolw import _map_paths
+
+        if isinstance(paths, (str, PathLike)) and os.path.isdir(paths):
+            entries = _scan_trigger_files(paths, recursive)
+            paths = sorted(
+                (entry.path for entry in entries),
+                key=lambda path: parse_trigger_filename(path)[1],
+            )
+        elif isinstance(paths, (str, PathLike)):
+            paths = [paths]
+
+        states = self._get_file_states()
+        new = []
+        for path in paths:
+            path = os.path.abspath(os.fspath(path))
+            try:
+                stat = os.stat(path)
+            except OSError as exc:
+                logger.warning("Skipping %s, as it cannot be read: %s", path, exc)
+                continue
+            state = states.get(path)
+            if state is None:
+                new.append((path, stat.st_size, stat.st_mtime_ns))
+                states[path] = (stat.st_size, stat.st_mtime_ns)
+            elif state != (stat.st_size, stat.st_mtime_ns):
+                logger.warning("Skipping %s, as it was modified after packing.", path)
+
+        load = partial(
+            _load_archive_file,
+            table=self.table,
+            columns=columns,
+            ilwdchar_compat=ilwdchar_compat,
+            psds=psds,
+            snrs=snrs,
+        )
+        n_packed = 0
+        for start in range(0, len(new), batch_size):
+            files = new[start:start + batch_size]
+            results = _map_paths(load, [path for path, _, _ in files], n_jobs, executor)
+            packed = [
+                (file, result) for file, result in zip(files, results)
+                if result is not None
+            ]
+            if not packed:
+                continue
+            files, results = (list(items) for items in zip(*packed))
+
+            # write to a temporary directory so batches are never partially visible
+            name = f"batch_{len(self._meta['batches']):06d}"
+            tmpdir = Path(tempfile.mkdtemp(prefix=f".{name}.", dir=self.directory))
+            try:
+                _write_batch(tmpdir / name, self.table, files, results)
+                if (self.directory / name).exists():
+                    # remove a batch left behind by an interrupted append
+                    shutil.rmtree(self.directory / name)
+                os.rename(tmpdir / name, self.directory / name)
+            finally:
+                shutil.rmtree(tmpdir, ignore_errors=True)
+
+            self._meta["batches"].append(name)
+            self._save_meta()
+            self._open_batches()
+            n_packed += len(files)
+            logger.debug("Packed %d files into %s.", len(files), self.directory / name)
+
+        return n_packed
+
+    def _locate(self, offsets: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        # the batch of each global index given the global offset of each batch
+        if len(indices) > 0 and (indices.min() < 0 or indices.max() >= offsets[-1]):
+            raise IndexError(f"Index out of range for archive of length {offsets[-1]}.")
+        return np.searchsorted(offsets, indices, side="right") - 1
+
+    def _get_file(self, file_index: int) -> Tuple[_Batch, int]:
+        b = int(self._locate(self._file_offsets, np.array([file_index]))[0])
+        return self._batches[b], file_index - int(self._file_offsets[b])
+
+    def read(
+        self,
+        rows: Optional[Union[int, slice, Iterable[int]]] = None,
+        columns: Optional[List[str]] = None,
+        df: bool = True,
+    ) -> Union[pd.DataFrame, Dict[str, np.ndarray]]:
+        """Reads rows of the table by their global row index from the memory-mapped
+        batches, with a file_index column referencing the file each row was read from.
+        Columns that are missing from the batch of a row are null (NaN or None).
+
+        Parameters
+        ----------
+        rows: int | slice | Iterable[int] | None = None
+            The global row indices to read, in order. If None, every row is read.
+        columns: list[str] | None = None
+            A optional list of column names to read. If None, every column is read.
+        df: bool
+            If True returns a pd.DataFrame indexed by the global row index, otherwise
+            returns a dictionary of column arrays.
+
+        Returns
+        -------
+        pd.DataFrame | dict[str, np.ndarray]
+        """
+        if rows is None:
+            rows = np.arange(len(self))
+        elif isinstance(rows, slice):
+            rows = np.arange(len(self))[rows]
+        else:
+            rows = np.atleast_1d(np.asarray(rows, dtype=np.int64))
+            rows = np.where(rows < 0, rows + len(self), rows)
+        columns = self.columns if columns is None else list(columns)
+
+        # read the rows of each batch in batch order, then restore the requested order
+        batches = self._locate(self._row_offsets, rows)
+        order = np.argsort(batches, kind="stable")
+        bounds = np.searchsorted(batches[order], np.arange(len(self._batches) + 1))
+        pieces = {name: [] for name in ["file_index", *columns]}
+        for b, batch in enumerate(self._batches):
+            if bounds[b] == bounds[b + 1]:
+                continue
+            local = rows[order[bounds[b]:bounds[b + 1]]] - self._row_offsets[b]
+            # slices of contiguous rows are read without a copy of the index
+            if len(local) > 1 and np.all(np.diff(local) == 1):
+                local = slice(int(local[0]), int(local[-1]) + 1)
+            for name in columns:
+                pieces[name].append(batch.column(name, local))
+            if isinstance(local, slice):
+                positions = np.arange(local.start, local.stop)
+            else:
+                positions = local
+            file_index = np.searchsorted(batch["row_offsets"], positions, side="right")
+            pieces["file_index"].append(file_index - 1 + self._file_offsets[b])
+
+        inverse = np.empty(len(rows), dtype=np.int64)
+        inverse[order] = np.arange(len(rows))
+        data = {}
+        for name, values in pieces.items():
+            if values:
+                data[name] = np.concatenate(values)[inverse]
+            elif name == "file_index":
+                data[name] = np.empty(0, dtype=np.int64)
+            else:
+                data[name] = np.empty(0, dtype=object)
+
+        if df:
+            import pandas as pd
+
+            return pd.DataFrame(data, index=pd.Index(rows, name="row"))
+        return data
+
+    def query(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        columns: Optional[List[str]] = None,
+        df: bool = True,
+    ) -> Union[pd.DataFrame, Dict[str, np.ndarray]]:
+        """Reads every row with a GPS end time in [start, end), sorted by end time,
+        with a binary search over the GPS index of each batch (see read)."""
+        gps, rows = [], []
+        for b, batch in enumerate(self._batches):
+            if not batch.has_gps():
+                raise ValueError(f"{self.table} table has no end_time column.")
+            sorted_gps = batch["gps"]
+            lo = 0 if start is None else np.searchsorted(sorted_gps, start, "left")
+            hi = len(sorted_gps) if end is None else np.searchsorted(
+                sorted_gps, end, "left"
+            )
+            gps.append(np.asarray(sorted_gps[lo:hi]))
+            rows.append(np.asarray(batch["gps_order"][lo:hi]) + self._row_offsets[b])
+
+        gps = np.concatenate(gps or [np.empty(0)])
+        rows = np.concatenate(rows or [np.empty(0, dtype=np.int64)])
+        return self.read(rows[np.argsort(gps, kind="stable")], columns, df)
+
+    def find(
+        self,
+        event_id: Any,
+        path: Optional[Union[str, PathLike]] = None,
+    ) -> np.ndarray:
+        """Returns the global row indices of every row with the given event_id, or
+        only the row read from the given file path, as event IDs are only unique
+        within a single file. Rows are found with a binary search over the event_id
+        index of each batch, rather than by reading every event_id column."""
+        if path is None:
+            rows = [
+                batch.find(event_id) + self._row_offsets[b]
+                for b, batch in enumerate(self._batches)
+            ]
+            return np.concatenate(rows or [np.empty(0, dtype=np.int64)])
+
+        if self._file_index is None:
+            self._file_index = {path: i for i, path in enumerate(self.files)}
+        file_index = self._file_index.get(os.path.abspath(os.fspath(path)))
+        if file_index is None:
+            raise KeyError(f"{path} is not packed in the archive.")
+        batch, f = self._get_file(file_index)
+        start, stop = (int(i) for i in batch["row_offsets"][f:f + 2])
+        event_ids = batch.column("event_id", slice(start, stop))
+        b = self._batches.index(batch)
+        return np.flatnonzero(event_ids == event_id) + start + self._row_offsets[b]
+
+    def get_psds(
+        self, file_index: int, df: bool = True
+    ) -> Union[pd.DataFrame, Tuple[np.ndarray, np.ndarray]]:
+        """Reads the PSDs of a packed file, as in load_ligolw_psds."""
+        batch, f = self._get_file(file_index)
+        start, stop = (int(i) for i in batch["psd_offsets"][f:f + 2])
+        ifos = batch["psd_ifos"][start:stop].tolist()
+        value_offsets = batch["psd_value_offsets"]
+        values = [
+            np.array(batch["psd_values"][value_offsets[i]:value_offsets[i + 1]])
+            for i in range(start, stop)
+        ]
+
+        frequencies = np.empty(0, dtype=np.float64)
+        if values:
+            frequencies = batch["psd_f0"][start] + batch["psd_df"][start] * np.arange(
+                len(values[0])
+            )
+        if any(len(psd) != len(frequencies) for psd in values):
+            raise ValueError(f"PSDs of file {file_index} have different frequencies.")
+        data = np.array(values, dtype=np.float64).reshape(len(ifos), len(frequencies))
+
+        if df:
+            import pandas as pd
+
+            index = pd.Index(frequencies, name="frequency")
+            return pd.DataFrame(data.T, index=index, columns=ifos)
+        return frequencies, data
+
+    def get_snr_array(
+        self, file_index: int, df: bool = False
+    ) -> Union[SNRSeriesArray, pd.DataFrame]:
+        """Reads the SNR series of a packed file, as in load_ligolw_snr_array."""
+        from .ligolw import SNRSeriesArray
+
+        batch, f = self._get_file(file_index)
+        start, stop = (int(i) for i in batch["snr_offsets"][f:f + 2])
+        lo, hi = (int(i) for i in batch["snr_value_offsets"][[start, stop]])
+        num = (hi - lo) // (stop - start) if stop > start else 0
+        delta_t = float(batch["snr_dt"][start]) if stop > start else 0.
+        data = SNRSeriesArray(
+            event_ids=np.array(batch["snr_event_ids"][start:stop]),
+            ifos=batch["snr_ifos"][start:stop].astype(object),
+            epochs=np.array(batch["snr_epochs"][start:stop]),
+            times=np.arange(num) * delta_t,
+            snr=np.array(batch["snr_values"][lo:hi]).reshape(stop - start, num),
+            lengths=np.array(batch["snr_lengths"][start:stop]),
+        )
+        return data.to_frame() if df else data
+
+    def get_event(self, row: int) -> Dict[str, Any]:
+        """Reads a single row of the table by its global row index, together with the
+        PSDs and SNR series of the file it was read from.
+
+        Returns
+        -------
+        dict[str, Any]
+            A dictionary with the row as a pd.Series ("row"), the path of its file
+            ("path"), its PSDs as a pd.DataFrame ("psds"), and its SNR series as an
+            SNRSeriesArray ("snrs").
+        """
+        row = self.read([row]).iloc[0]
+        file_index = int(row["file_index"])
+        batch, f = self._get_file(file_index)
+        return {
+            "row": row,
+            "path": str(batch["file_paths"][f]),
+            "psds": self.get_psds(file_index),
+            "snrs": self.get_snr_array(file_index),
+        }
+
+
+def pack_trigger_archive(
+    paths: Union[str, PathLike, Iterable[Union[str, PathLike]]],
+    directory: Union[str, PathLike],
+    table: str = "postcoh",
+    **kwargs,
+) -> TriggerArchive:
+    """Packs a directory (or list) of SPIIR trigger files into a TriggerArchive,
+    creating it if it does not exist, and returns the archive. See
+    TriggerArchive.append for the remaining keyword arguments.
+
+    Examples
+    --------
+        >> archive = pack_trigger_archive("/path/to/zerolags", "zerolags.spiir")
+    """
+    archive = TriggerArchive(directory, table)
+    archive.append(paths, **kwargs)
+    return archive
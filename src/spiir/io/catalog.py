@@ -0,0 +1,319 @@
+import logging
+import os
+import re
+import tempfile
+from os import PathLike
+from pathlib import Path
+from typing import Pattern, Union, Optional, Dict, List, Iterable, Tuple
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+# trigger file names are formatted as <IFOS>_<GPS>_<...>.xml (e.g. H1L1_1186643089_412_557.xml)
+# or <IFOS>_<TAG>_<GPS>_<...>.xml when tagged (e.g. H1L1_zerolag_1186643089_412.xml)
+FILENAME_PATTERN = re.compile(
+    r"^(?P<ifos>(?:[A-Z]\d)+)(?:_(?P<tag>[A-Za-z][A-Za-z0-9-]*))*_(?P<gps>\d+)(?:_.*)?"
+    r"\.xml(?:\.gz)?$"
+)
+
+_COLUMNS = {
+    "path": str,
+    "ifos": str,
+    "gps": np.int64,
+    "size": np.int64,
+    "mtime_ns": np.int64,
+    "n_rows": np.int64,
+    "min_end_time": np.float64,
+    "max_end_time": np.float64,
+}
+
+
+def parse_trigger_filename(
+    path: Union[str, PathLike],
+    pattern: Optional[Union[str, Pattern]] = None,
+) -> Optional[Tuple[str, int]]:
+    """Parses the interferometers and GPS time of a trigger file from its file name
+    (e.g. "H1L1_1186643089_412_557.xml" or "H1L1_zerolag_1186643089_412.xml" are parsed
+    as ("H1L1", 1186643089)), or returns None if the file name does not follow the
+    <IFOS>_<GPS>_<...>.xml or <IFOS>_<TAG>_<GPS>_<...>.xml conventions.
+
+    A custom regular expression can be given as pattern, which must have a named gps
+    group and may have a named ifos group (otherwise the ifos are parsed as "").
+    """
+    match = _get_pattern(pattern).match(os.path.basename(os.fspath(path)))
+    if match is None:
+        return None
+    ifos = match.groupdict().get("ifos") or ""
+    return ifos, int(match.group("gps"))
+
+
+def _get_pattern(pattern: Optional[Union[str, Pattern]] = None) -> Pattern:
+    # compile a custom file name pattern, which must have a named gps group
+    if pattern is None:
+        return FILENAME_PATTERN
+    pattern = re.compile(pattern)
+    if "gps" not in pattern.groupindex:
+        raise ValueError(f"File name pattern {pattern.pattern} has no named gps group.")
+    return pattern
+
+
+def _get_file_stats(path: str, table: str = "postcoh") -> Tuple[int, float, float]:
+    # read the number of rows and the min/max end_time of a trigger file's table
+    from .ligolw import load_ligolw_table_columns
+
+    data = load_ligolw_table_columns(path, table, columns=["end_time", "end_time_ns"])
+    if len(data["end_time"]) == 0:
+        return 0, np.nan, np.nan
+    end_time = data["end_time"] + data["end_time_ns"] * 1e-9
+    return len(end_time), float(end_time.min()), float(end_time.max())
+
+
+def _scan_trigger_files(
+    directory: Union[str, PathLike],
+    recursive: bool = True,
+    pattern: Optional[Union[str, Pattern]] = None,
+) -> Iterable[os.DirEntry]:
+    # yield every trigger file in the directory (and its subdirectories)
+    pattern = _get_pattern(pattern)
+    directories = [directory]
+    while directories:
+        path = directories.pop()
+        try:
+            entries = os.scandir(path)
+        except FileNotFoundError:
+            if path is directory:
+                raise
+            continue  # the subdirectory was removed after it was listed
+        with entries:
+            for entry in entries:
+                if entry.is_dir() and recursive:
+                    directories.append(entry.path)
+                elif entry.is_file() and pattern.match(entry.name):
+                    yield entry
+
+
+class TriggerFileCatalog:
+    """A persistent GPS time index over a directory of SPIIR trigger files.
+
+    The directory is scanned for files named <IFOS>_<GPS>_<...>.xml or
+    <IFOS>_<TAG>_<GPS>_<...>.xml (or .xml.gz, or any custom pattern), and the
+    interferometers, GPS time, size and modification time of each file are recorded
+    in a catalog sorted by GPS time, which is saved alongside the files. If stats is
+    True, the number of rows and the min/max end_time of the table in each file are
+    also recorded, which requires each file to be parsed once.
+
+    Each file is considered to span from its min_end_time to its max_end_time if
+    known, otherwise from its GPS time to its GPS time plus duration, and interval
+    queries are answered with a binary search over the sorted start times. If neither
+    stats nor duration are known, a file may hold triggers at any time after its GPS
+    time, so queries return every file that starts before the end of the interval.
+    When new files land in the directory, refresh only indexes the files that were
+    added or modified.
+
+    Parameters
+    ----------
+    directory: str | PathLike
+        The directory containing the trigger files, which are recorded by their
+        absolute paths.
+    path: str | PathLike | None = None
+        The catalog file, which defaults to .spiir_catalog.npz in the directory.
+    recursive: bool
+        Whether to also index trigger files in subdirectories.
+    stats: bool
+        Whether to record the row count and min/max end_time of each file's table.
+    duration: float | None = None
+        The number of seconds each file spans from its GPS time, which bounds the span
+        of files without stats. If None, the span of files without stats is unbounded.
+    table: str
+        The name of the LIGO_LW Table used for the row count and end_time stats.
+    refresh: bool
+        Whether to refresh the catalog with the current directory contents on load.
+    pattern: str | re.Pattern | None = None
+        An optional regular expression that the names of trigger files must match,
+        with a named gps group (see parse_trigger_filename).
+
+    Examples
+    --------
+        >> catalog = TriggerFileCatalog("/path/to/triggers", duration=1000)
+        >> paths = catalog.query(1186642800, 1186643100, ifos="H1L1")
+        >> df = load_ligolw_tables(paths, "postcoh")
+        >> catalog.refresh()  # index newly created files
+    """
+    def __init__(
+        self,
+        directory: Union[str, PathLike],
+        path: Optional[Union[str, PathLike]] = None,
+        recursive: bool = True,
+        stats: bool = False,
+        table: str = "postcoh",
+        refresh: bool = True,
+        duration: Optional[float] = None,
+        pattern: Optional[Union[str, Pattern]] = None,
+    ):
+        self.directory = Path(directory).resolve()
+        self.path = Path(path) if path is not None else self.directory / ".spiir_catalog.npz"
+        self.recursive = recursive
+        self.stats = stats
+        self.table = table
+        self.duration = duration
+        self.pattern = _get_pattern(pattern)
+
+        self._data = {name: np.empty(0, dtype=dtype) for name, dtype in _COLUMNS.items()}
+        if self.path.exists():
+            self.load()
+        if refresh:
+            self.refresh()
+
+    def __len__(self) -> int:
+        return len(self._data["path"])
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.directory)!r}, files={len(self)})"
+
+    @property
+    def paths(self) -> List[str]:
+        """The paths of every indexed file, sorted by GPS time."""
+        return self._data["path"].tolist()
+
+    @property
+    def start(self) -> np.ndarray:
+        """The GPS start time of every indexed file."""
+        start = self._data["min_end_time"]
+        return np.where(np.isnan(start), self._data["gps"], start)
+
+    @property
+    def stop(self) -> np.ndarray:
+        """The GPS stop time of every indexed file, which is infinite if unknown."""
+        stop = self._data["max_end_time"]
+        duration = np.inf if self.duration is None else self.duration
+        return np.where(np.isnan(stop), self._data["gps"] + duration, stop)
+
+    def refresh(self, save: bool = True) -> Tuple[int, int, int]:
+        """Updates the catalog with any files that have been added to, modified in, or
+        removed from the directory, and returns the number of each of them."""
+        known = {path: i for i, path in enumerate(self._data["path"])}
+        keep = np.zeros(len(self), dtype=bool)
+        new = []
+        n_modified = 0
+        for entry in _scan_trigger_files(self.directory, self.recursive, self.pattern):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # the file was removed after it was listed
+            i = known.get(entry.path)
+            if i is not None:
+                if (
+                    self._data["size"][i] == stat.st_size
+                    and self._data["mtime_ns"][i] == stat.st_mtime_ns
+                ):
+                    keep[i] = True
+                    continue
+                n_modified += 1
+
+            ifos, gps = parse_trigger_filename(entry.name, self.pattern)
+            n_rows, min_end_time, max_end_time = -1, np.nan, np.nan
+            if self.stats:
+                try:
+                    n_rows, min_end_time, max_end_time = _get_file_stats(
+                        entry.path, self.table
+                    )
+                except Exception as exc:
+                    logger.warning(
+                        "Failed to read %s table in %s: %s", self.table, entry.path, exc
+                    )
+            new.append((
+                entry.path, ifos, gps, stat.st_size, stat.st_mtime_ns,
+                n_rows, min_end_time, max_end_time,
+            ))
+
+        n_removed = len(self) - int(keep.sum()) - n_modified
+        if new or not keep.all():
+            data = {name: values[keep] for name, values in self._data.items()}
+            for name, values in zip(_COLUMNS, zip(*new) if new else [[]] * len(_COLUMNS)):
+                data[name] = np.concatenate(
+                    [data[name], np.array(values, dtype=_COLUMNS[name])]
+                )
+            order = np.argsort(data["gps"], kind="stable")
+            self._data = {name: values[order] for name, values in data.items()}
+            if save:
+                self.save()
+
+        n_added = len(new) - n_modified
+        logger.debug(
+            "Refreshed catalog with %d added, %d modified, %d removed files.",
+            n_added, n_modified, n_removed,
+        )
+        return n_added, n_modified, n_removed
+
+    def query(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        ifos: Optional[Union[str, Iterable[str]]] = None,
+    ) -> List[str]:
+        """Returns the paths of all files that overlap the GPS time interval [start, end),
+        and optionally only those with the given interferometer combination(s).
+
+        Parameters
+        ----------
+        start: float | None = None
+            The GPS start time of the interval. If None, the interval is unbounded.
+        end: float | None = None
+            The GPS end time of the interval. If None, the interval is unbounded.
+        ifos: str | Iterable[str] | None = None
+            The interferometer combination(s) of the files to return (e.g. "H1L1").
+
+        Returns
+        -------
+        list[str]
+            The paths of every matching file, sorted by GPS time.
+        """
+        starts, stops = self.start, self.stop
+        order = np.argsort(starts, kind="stable")
+        starts, stops = starts[order], stops[order]
+
+        # binary search for the files that start before the end of the interval and
+        # may stop after its start, given the longest span of any file
+        lo, hi = 0, len(starts)
+        if end is not None:
+            hi = int(np.searchsorted(starts, end, side="left"))
+        if start is not None and len(starts) > 0:
+            max_span = float((stops - starts).max())
+            lo = int(np.searchsorted(starts, start - max_span, side="left"))
+
+        index = order[lo:hi]
+        mask = np.ones(len(index), dtype=bool)
+        if start is not None:
+            mask &= stops[lo:hi] >= start
+        if ifos is not None:
+            ifos = [ifos] if isinstance(ifos, str) else list(ifos)
+            mask &= np.isin(self._data["ifos"][index], ifos)
+        return self._data["path"][np.sort(index[mask])].tolist()
+
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        """Returns the catalog as a dictionary of column arrays."""
+        return {name: values.copy() for name, values in self._data.items()}
+
+    def save(self):
+        """Writes the catalog to its file path."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(
+            prefix=f".{self.path.name}.", suffix=".npz", dir=self.path.parent
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **self._data)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def load(self):
+        """Reads the catalog from its file path."""
+        with np.load(self.path) as data:
+            self._data = {
+                name: data[name].astype(dtype) for name, dtype in _COLUMNS.items()
+            }
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+from concurrent.futures import Executor
+from functools import partial
+from os import PathLike
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Pattern, Tuple, Union
+)
+
+import numpy as np
+
+from .catalog import _get_pattern, _scan_trigger_files, parse_trigger_filename
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+
+class TriggerFileFollower:
+    """Follows a live directory of SPIIR trigger files and incrementally ingests new
+    arrivals into an in-memory columnar buffer with bounded retention.
+
+    Each poll scans the directory for files named <IFOS>_<GPS>_<...>.xml or
+    <IFOS>_<TAG>_<GPS>_<...>.xml (e.g. H1L1_zerolag_1186643089_412.xml, or .xml.gz),
+    or any custom pattern, and compares their size and modification time against the
+    files that have already been ingested, such that only new (or modified) files are
+    parsed. The rows of each newly ingested file are appended to the buffer and
+    returned as a delta, which is also passed to the callback (if provided). Detection
+    is polling based, so it works on any plain local or network filesystem.
+
+    If window is given, rows with an end_time more than window seconds before the
+    latest end_time seen are evicted from the buffer, and if max_rows is given, the
+    oldest ingested rows are evicted until the buffer holds at most max_rows rows.
+
+    Files modified within min_age seconds are deferred to a later poll so that files
+    still being written are not ingested, and files that fail to parse are skipped
+    until they are modified again. The rows of a modified file replace its previous
+    rows in the buffer, but are delivered to consumers in full as a new delta.
+
+    Parameters
+    ----------
+    directory: str | PathLike
+        The directory the trigger files are written to.
+    table: str
+        The name of the LIGO_LW Table to read from each document.
+    columns: list[str] | None = None
+        A optional list of column names to filter and read in from the table. The
+        end_time and end_time_ns columns are always read if window is given.
+    window: float | None = None
+        The number of seconds of end_time to retain in the buffer. If None, rows are
+        not evicted by end_time.
+    max_rows: int | None = None
+        The maximum number of rows to retain in the buffer. If None, rows are not
+        evicted by count.
+    where: list[tuple[str, str, Any]] | None = None
+        An optional list of (column, operator, value) predicates that every ingested
+        row must satisfy, as in load_ligolw_table_columns.
+    ilwdchar_compat: bool
+        Whether to add ilwdchar conversion compatibility.
+    recursive: bool
+        Whether to also follow trigger files in subdirectories.
+    backfill: bool
+        Whether to ingest the files already in the directory on the first poll, or only
+        the files that arrive afterwards.
+    min_age: float
+        The number of seconds since a file was last modified before it is ingested.
+    interval: float
+        The number of seconds to wait between each poll when following.
+    callback: Callable | None = None
+        An optional function called with each non-empty delta as it is ingested.
+    df: bool
+        If True, deltas and the buffer are returned as pd.DataFrames, otherwise as
+        dictionaries of column arrays.
+    n_jobs: int | None = None
+        The number of worker processes used to parse new files in parallel.
+    executor: Executor | None = None
+        An optional existing executor used to parse new files in parallel.
+    pattern: str | re.Pattern | None = None
+        An optional regular expression that the names of trigger files must match,
+        with a named gps group (see parse_trigger_filename).
+
+    Examples
+    --------
+        >> follower = TriggerFileFollower("/path/to/zerolags", window=3600, min_age=1)
+        >> for delta in follower.follow():
+        ..     print(f"Ingested {len(delta)} new triggers, {len(follower)} buffered.")
+    """
+    def __init__(
+        self,
+        directory: Union[str, PathLike],
+        table: str = "postcoh",
+        columns: Optional[List[str]] = None,
+        window: Optional[float] = None,
+        max_rows: Optional[int] = None,
+        where: Optional[List[Tuple[str, str, Any]]] = None,
+        ilwdchar_compat: bool = True,
+        recursive: bool = True,
+        backfill: bool = True,
+        min_age: float = 0.,
+        interval: float = 1.,
+        callback: Optional[Callable] = None,
+        df: bool = True,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        pattern: Optional[Union[str, Pattern]] = None,
+    ):
+        self.directory = Path(directory)
+        self.table = table
+        self.window = window
+        self.max_rows = max_rows
+        self.recursive = recursive
+        self.min_age = min_age
+        self.interval = interval
+        self.callback = callback
+        self.df = df
+        self.n_jobs = n_jobs
+        self.executor = executor
+        self.pattern = _get_pattern(pattern)
+
+        if columns is not None and window is not None:
+            columns = list(columns)
+            columns += [
+                name for name in ("end_time", "end_time_ns") if name not in columns
+            ]
+        self.columns = columns
+        self.where = where
+        self.ilwdchar_compat = ilwdchar_compat
+
+        # the (size, mtime_ns) of every ingested (or unreadable) file by path
+        self._seen: Dict[str, Tuple[int, int]] = {}
+        # the ingested rows of each file in ingestion order, as (path, columns, times)
+        self._chunks: List[Tuple[str, Dict[str, np.ndarray], np.ndarray]] = []
+        self._latest = -np.inf
+
+        if not backfill:
+            for entry, state in self._scan():
+                self._seen[entry.path] = state
+
+    def __len__(self) -> int:
+        return sum(len(times) for _, _, times in self._chunks)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({str(self.directory)!r}, "
+            f"files={len(self._seen)}, rows={len(self)})"
+        )
+
+    def _scan(self) -> Iterator[Tuple[os.DirEntry, Tuple[int, int]]]:
+        # yield each trigger file and its (size, mtime_ns), skipping any removed files
+        for entry in _scan_trigger_files(self.directory, self.recursive, self.pattern):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # the file was removed after it was listed
+            yield entry, (stat.st_size, stat.st_mtime_ns)
+
+    def _find_new_files(self) -> List[Tuple[str, Tuple[int, int]]]:
+        # return the path and (size, mtime_ns) of each new or modified file, by GPS time
+        now = time.time_ns()
+        new = []
+        for entry, state in self._scan():
+            if self._seen.get(entry.path) == state:
+                continue
+            if now - state[1] < self.min_age * 1e9:
+                continue  # the file may still be being written
+            new.append((entry.path, state))
+        return sorted(
+            new, key=lambda item: parse_trigger_filename(item[0], self.pattern)[1]
+        )
+
+    def _evict(self):
+        # drop rows outside the retention window, then the oldest rows over max_rows
+        if self.window is not None and self._chunks:
+            cutoff = self._latest - self.window
+            chunks = []
+            for path, data, times in self._chunks:
+                if len(times) == 0 or times.max() < cutoff:
+                    continue
+                if times.min() < cutoff:
+                    mask = times >= cutoff
+                    data = {name: values[mask] for name, values in data.items()}
+                    times = times[mask]
+                chunks.append((path, data, times))
+            self._chunks = chunks
+
+        if self.max_rows is not None:
+            excess = len(self) - self.max_rows
+            while excess > 0 and self._chunks:
+                path, data, times = self._chunks[0]
+                if len(times) <= excess:
+                    self._chunks.pop(0)
+                    excess -= len(times)
+                else:
+                    data = {name: values[excess:] for name, values in data.items()}
+                    self._chunks[0] = (path, data, times[excess:])
+                    excess = 0
+
+    def _format(
+        self, data: Dict[str, np.ndarray]
+    ) -> Union[pd.DataFrame, Dict[str, np.ndarray]]:
+        if self.df:
+            import pandas as pd
+
+            return pd.DataFrame(data)
+        return data
+
+    def _concatenate(
+        self, tables: List[Dict[str, np.ndarray]]
+    ) -> Dict[str, np.ndarray]:
+        from .ligolw.ligolw import _concatenate_table_columns
+
+        if not tables:
+            return {}
+        return _concatenate_table_columns(tables, self.table)
+
+    def poll(self) -> Optional[Union[pd.DataFrame, Dict[str, np.ndarray]]]:
+        """Ingests any new or modified files in the directory and returns their rows
+        as a delta, or None if no new files were ingested."""
+        from .ligolw.ligolw import _map_paths
+
+        new = self._find_new_files()
+        if not new:
+            return None
+
+        paths = [path for path, _ in new]
+        load = partial(
+            _load_table_columns,
+            table=self.table,
+            columns=self.columns,
+            ilwdchar_compat=self.ilwdchar_compat,
+            where=self.where,
+        )
+        results = _map_paths(load, paths, self.n_jobs, self.executor)
+
+        tables = []
+        for (path, state), data in zip(new, results):
+            self._seen[path] = state
+            if data is None:
+                continue
+            # rows of modified files replace any previously ingested rows
+            self._chunks = [chunk for chunk in self._chunks if chunk[0] != path]
+
+            if "end_time" in data and "end_time_ns" in data:
+                times = data["end_time"] + data["end_time_ns"] * 1e-9
+                if len(times) > 0:
+                    self._latest = max(self._latest, float(times.max()))
+            elif self.window is not None:
+                raise KeyError(f"{self.table} table has no end_time column.")
+            else:
+                times = np.zeros(len(next(iter(data.values()), ())))
+
+            self._chunks.append((path, data, times))
+            tables.append(data)
+
+        self._evict()
+        if not tables:
+            return None
+
+        delta = self._format(self._concatenate(tables))
+        logger.debug(
+            "Ingested %d rows from %d new files in %s.",
+            len(delta), len(tables), self.directory,
+        )
+        if self.callback is not None:
+            self.callback(delta)
+        return delta
+
+    def follow(
+        self, timeout: Optional[float] = None
+    ) -> Iterator[Union[pd.DataFrame, Dict[str, np.ndarray]]]:
+        """Polls the directory every interval seconds and yields each non-empty delta,
+        until timeout seconds have elapsed (or indefinitely if timeout is None)."""
+        start = time.monotonic()
+        while True:
+            delta = self.poll()
+            if delta is not None:
+                yield delta
+            elapsed = time.monotonic() - start
+            if timeout is not None and elapsed + self.interval > timeout:
+                return
+            time.sleep(self.interval)
+
+    @property
+    def data(self) -> Union[pd.DataFrame, Dict[str, np.ndarray]]:
+        """All rows currently retained in the buffer, in ingestion order."""
+        return self._format(self._concatenate([data for _, data, _ in self._chunks]))
+
+    def clear(self):
+        """Removes all rows from the buffer, without forgetting the ingested files."""
+        self._chunks = []
+
+
+def _load_table_columns(
+    path: str,
+    table: str,
+    columns: Optional[List[str]],
+    ilwdchar_compat: bool,
+    where: Optional[List[Tuple[str, str, Any]]],
+) -> Optional[Dict[str, np.ndarray]]:
+    # load the table of a single file, returning None if it cannot be read
+    from .ligolw import load_ligolw_table_columns
+
+    try:
+        return load_ligolw_table_columns(
+            path, table, columns=columns, ilwdchar_compat=ilwdchar_compat, where=where
+        )
+    except Exception as exc:
+        logger.warning("Failed to read %s table in %s: %s", table, path, exc)
+        return None
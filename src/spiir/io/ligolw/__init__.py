@@ -1,10 +1,45 @@
 from .ligolw import (
     load_ligolw_xmldoc,
     load_ligolw_tables,
+    iter_ligolw_tables,
+    aload_ligolw_tables,
+    load_ligolw_table_columns,
+    load_ligolw_multi_tables,
+    load_ligolw_multi_table_columns,
     load_ligolw_frequency_series,
+    load_ligolw_psds,
+    load_ligolw_psd_arrays,
     load_all_ligolw_snr_series,
+    load_ligolw_snr_array,
+    load_ligolw_snr_tensor,
+    write_ligolw_table,
+    write_ligolw_tables,
     get_all_ligolw_snr_series_from_xmldoc,
+    get_ligolw_snr_array_from_xmldoc,
+    get_ligolw_table_columns_from_xmldoc,
+    get_compact_table_columns,
+    get_ligolw_frequency_series_from_xmldoc,
+    get_ligolw_psds_from_xmldoc,
     strip_ilwdchar,
     ILWDCharCompatContentHandler,
+    PostcohContentHandler,
+    SelectiveContentHandler,
+    SNRSeriesArray,
+    SNRTensor,
+)
+from .postcoh import PostcohInspiral, PostcohInspiralTable
+from .arrow import (
+    get_arrow_schema,
+    iter_ligolw_record_batches,
+    load_ligolw_arrow_table,
+    to_arrow_record_batch,
+)
+from .cache import LIGOLWDocumentCache, LIGOLWTableCache
+from .stats import LoadStats, get_load_stats
+from .columnar import (
+    format_table_stream,
+    get_structured_dtype,
+    get_where_mask,
+    parse_table_stream,
+    parse_array_stream,
 )
-from .postcoh import PostcohInspiral, PostcohInspiralTable
\ No newline at end of file
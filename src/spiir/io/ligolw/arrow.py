@@ -0,0 +1,396 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor
+from functools import partial
+from os import PathLike
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+import ligo.lw.table
+import ligo.lw.types
+
+from . import postcoh  # noqa: F401 - registers the postcoh table
+from .cache import LIGOLWTableCache
+from .stats import timed_stage
+
+# import after postcoh.py for PostcohInspiralTable compatibility
+import ligo.lw.lsctables
+
+# pyarrow is an optional dependency, so it is only imported within the functions
+# that use it
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+logger = logging.getLogger(__name__)
+
+
+def _get_arrow_type(coltype: str, ilwdchar_compat: bool = True) -> pa.DataType:
+    # the Arrow type of a LIGO_LW column type (e.g. real_4 is float32)
+    import pyarrow as pa
+
+    if coltype == "ilwd:char":
+        return pa.int64() if ilwdchar_compat else pa.string()
+    if coltype in ligo.lw.types.ComplexTypes:
+        raise ValueError(f"LIGO_LW type {coltype} has no equivalent Arrow type.")
+    dtype = ligo.lw.types.ToNumPyType.get(coltype)
+    if dtype is not None:
+        return pa.from_numpy_dtype(np.dtype(dtype))
+    if coltype in ligo.lw.types.BlobTypes:
+        return pa.binary()
+    return pa.string()
+
+
+def get_arrow_schema(
+    table: str,
+    columns: Optional[List[str]] = None,
+    ilwdchar_compat: bool = True,
+) -> pa.Schema:
+    """Returns the pyarrow.Schema of a LIGO_LW Table, where each field is typed by the
+    Type of its column in the table's validcolumns (e.g. PostcohInspiralTable), such
+    that int_4s columns are int32, real_4 columns are float32, and string-like columns
+    (e.g. lstring) are strings.
+
+    Parameters
+    ----------
+    table: str
+        The name of the LIGO_LW Table (e.g. "postcoh" or "sngl_inspiral").
+    columns: list[str] | None = None
+        A optional list of column names to include in the schema, in order. If None,
+        every valid column of the table is included.
+    ilwdchar_compat: bool
+        Whether ilwd:char ID columns are converted to integers (i.e. read with
+        ilwdchar_compat=True), or are otherwise strings.
+
+    Returns
+    -------
+    pyarrow.Schema
+    """
+    import pyarrow as pa
+
+    try:
+        validcolumns = ligo.lw.lsctables.TableByName[table].validcolumns
+    except KeyError as exc:
+        raise ValueError(f"Unknown LIGO_LW table {table}.") from exc
+    coltypes = {
+        ligo.lw.table.Column.ColumnName(name): coltype
+        for name, coltype in validcolumns.items()
+    }
+
+    names = list(coltypes.keys()) if columns is None else columns
+    fields = []
+    for name in names:
+        if name not in coltypes:
+            raise ValueError(f"Column {name} is not a valid {table} column.")
+        fields.append(pa.field(name, _get_arrow_type(coltypes[name], ilwdchar_compat)))
+    return pa.schema(fields, metadata={"table": table})
+
+
+def _to_arrow_array(values: np.ndarray, type: pa.DataType) -> pa.Array:
+    # wrap a column as an Arrow array, where contiguous numeric columns are wrapped
+    # without a copy and object (e.g. string) columns are converted with nulls
+    import pyarrow as pa
+
+    if values.dtype == object or not pa.types.is_primitive(type):
+        return pa.array(values, type=type, from_pandas=True)
+    values = np.ascontiguousarray(values, dtype=type.to_pandas_dtype())
+    return pa.Array.from_buffers(type, len(values), [None, pa.py_buffer(values)])
+
+
+def to_arrow_record_batch(
+    data: Dict[str, np.ndarray],
+    table: str,
+    schema: Optional[pa.Schema] = None,
+    ilwdchar_compat: bool = True,
+) -> pa.RecordBatch:
+    """Converts the columns of a LIGO_LW Table (e.g. from load_ligolw_table_columns)
+    into a pyarrow.RecordBatch typed by its LIGO_LW schema (see get_arrow_schema).
+
+    Numeric columns are handed over to Arrow without a copy if they are contiguous,
+    such that the record batch shares its buffers with the input arrays. Strided
+    columns (e.g. fields of a structured array) are copied once, and string columns
+    are converted to Arrow strings, where None values are null. Any columns of the
+    schema that are not present in data are null.
+
+    Parameters
+    ----------
+    data: dict[str, np.ndarray]
+        A dictionary of column names and their respective column value arrays.
+    table: str
+        The name of the LIGO_LW Table the columns were read from.
+    schema: pyarrow.Schema | None = None
+        An optional schema of the record batch. If None, the schema of the given
+        columns is used.
+    ilwdchar_compat: bool
+        Whether ilwd:char ID columns were converted to integers.
+
+    Returns
+    -------
+    pyarrow.RecordBatch
+    """
+    import pyarrow as pa
+
+    if schema is None:
+        schema = _get_data_schema(data, table, ilwdchar_compat)
+
+    with timed_stage("arrow") as stage:
+        length = len(next(iter(data.values()), ()))
+        arrays = []
+        for field in schema:
+            if field.name not in data:
+                arrays.append(pa.nulls(length, field.type))
+            else:
+                arrays.append(_to_arrow_array(np.asarray(data[field.name]), field.type))
+        batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
+        stage.add(rows=batch.num_rows)
+    return batch
+
+
+def _get_data_schema(
+    data: Dict[str, np.ndarray], table: str, ilwdchar_compat: bool = True
+) -> pa.Schema:
+    # the schema of the given columns, inferred from their dtypes for unknown tables
+    import pyarrow as pa
+
+    if table in ligo.lw.lsctables.TableByName:
+        return get_arrow_schema(table, list(data.keys()), ilwdchar_compat)
+
+    fields = []
+    for name, values in data.items():
+        values = np.asarray(values)
+        if values.dtype == object:
+            fields.append(pa.field(name, pa.string()))
+        else:
+            fields.append(pa.field(name, pa.from_numpy_dtype(values.dtype)))
+    return pa.schema(fields, metadata={"table": table})
+
+
+def _get_table_schema(
+    data: Dict[str, np.ndarray],
+    table: str,
+    columns: Optional[List[str]] = None,
+    ilwdchar_compat: bool = True,
+) -> pa.Schema:
+    # the schema of every document read from a table, which is given by the table's
+    # validcolumns (see get_arrow_schema) rather than the columns of one document
+    import pyarrow as pa
+
+    if table not in ligo.lw.lsctables.TableByName:
+        return _get_data_schema(data, table, ilwdchar_compat)
+
+    schema = get_arrow_schema(table, columns, ilwdchar_compat)
+    if not ilwdchar_compat:
+        # ID columns are declared as integers, but are ilwd:char strings in legacy
+        # documents (e.g. "postcoh:event_id:1") when they are not converted
+        for i, field in enumerate(schema):
+            values = data.get(field.name)
+            if (
+                values is not None
+                and pa.types.is_integer(field.type)
+                and len(values) > 0
+                and isinstance(values[0], str)
+            ):
+                schema = schema.set(i, pa.field(field.name, pa.string()))
+    return schema
+
+
+def _reconcile_schemas(schemas: List[pa.Schema]) -> pa.Schema:
+    # the schema of the record batches of many documents, where an ID column that is
+    # an ilwd:char string in any (legacy) document is a string column in every batch
+    import pyarrow as pa
+
+    schema = schemas[0]
+    for other in schemas[1:]:
+        for i, field in enumerate(schema):
+            if field.type != other.field(i).type and pa.types.is_string(
+                other.field(i).type
+            ):
+                schema = schema.set(i, pa.field(field.name, pa.string()))
+    return schema
+
+
+def iter_ligolw_record_batches(
+    paths: Union[str, bytes, PathLike, Iterable[Union[str, bytes, PathLike]]],
+    table: str,
+    columns: Optional[List[str]] = None,
+    ilwdchar_compat: bool=True,
+    verbose: bool=False,
+    where: Optional[List[Tuple[str, str, Any]]] = None,
+    cache: Optional[LIGOLWTableCache] = None,
+    schema: Optional[pa.Schema] = None,
+    prefetch: int = 1,
+    executor: Optional[Executor] = None,
+) -> Iterator[pa.RecordBatch]:
+    """Iterates over a LIGO_LW Table from one or multiple LIGO_LW XML Documents as one
+    pyarrow.RecordBatch per document, such that any number of documents can be piped
+    into an Arrow IPC file or stream (or an in-process consumer) in bounded memory.
+
+    Each document is read with load_ligolw_table_columns (while the next prefetch
+    documents are read ahead in the background, as in iter_ligolw_tables), and its
+    columns are converted with to_arrow_record_batch. Every record batch shares the
+    same schema, which is given by the table's validcolumns (see get_arrow_schema)
+    restricted to columns, if provided, where columns missing from a document are null.
+
+    Parameters
+    ----------
+    paths: str | bytes | PathLike | Iterable[str | bytes | PathLike]
+        A path or (possibly lazy) iterable of paths to LIGO_LW XML Document(s).
+    table: str
+        The name of the LIGO_LW Table to read from each document.
+    columns: list[str] | None = None
+        A optional list of column names to filter and read in from each table.
+    ilwdchar_compat: bool
+        Whether to add ilwdchar conversion compatibility.
+    verbose: bool
+        Whether to enable verbose output for ligo.lw.utils.load_filename.
+    where: list[tuple[str, str, Any]] | None = None
+        An optional list of (column, operator, value) predicates that every returned
+        row must satisfy (see load_ligolw_table_columns).
+    cache: LIGOLWTableCache | None = None
+        An optional on-disk columnar cache to read (or write) each document's table.
+    schema: pyarrow.Schema | None = None
+        An optional schema of every record batch. If None, the schema is given by the
+        table's validcolumns (see get_arrow_schema), where missing columns are null.
+    prefetch: int
+        The number of documents to read ahead in the background. If 0, documents are
+        read in the calling thread when they are needed.
+    executor: concurrent.futures.Executor | None = None
+        An optional existing executor to read documents ahead with.
+
+    Returns
+    -------
+    Iterator[pyarrow.RecordBatch]
+
+    Examples
+    --------
+        >> batches = iter_ligolw_record_batches(zerolags, "postcoh")
+        >> first = next(batches)
+        >> with pa.ipc.new_file("zerolags.arrow", first.schema) as writer:
+        ..     writer.write_batch(first)
+        ..     for batch in batches:
+        ..         writer.write_batch(batch)
+    """
+    from .ligolw import _iter_prefetched, load_ligolw_table_columns
+
+    if isinstance(paths, (str, bytes, PathLike)):
+        paths = [paths]
+
+    load_table_columns = partial(
+        load_ligolw_table_columns,
+        table=table,
+        columns=columns,
+        ilwdchar_compat=ilwdchar_compat,
+        verbose=verbose,
+        cache=cache,
+        where=where,
+    )
+    for data in _iter_prefetched(load_table_columns, paths, prefetch, executor):
+        if schema is None:
+            schema = _get_table_schema(data, table, columns, ilwdchar_compat)
+        yield to_arrow_record_batch(data, table, schema)
+
+
+def load_ligolw_arrow_table(
+    paths: Union[str, bytes, PathLike, Iterable[Union[str, bytes, PathLike]]],
+    table: str,
+    columns: Optional[List[str]] = None,
+    ilwdchar_compat: bool=True,
+    verbose: bool=False,
+    where: Optional[List[Tuple[str, str, Any]]] = None,
+    cache: Optional[LIGOLWTableCache] = None,
+    schema: Optional[pa.Schema] = None,
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> pa.Table:
+    """Loads a LIGO_LW Table from one or multiple LIGO_LW XML Documents as a
+    pyarrow.Table typed by its LIGO_LW schema (see get_arrow_schema).
+
+    The table holds one record batch per document (see to_arrow_record_batch), which
+    are never concatenated, such that each column is built without copying the data
+    of any other document, and the peak memory stays close to the size of the data.
+    Each document is converted as soon as it is loaded, and if ilwdchar_compat is
+    False, ID columns that hold ilwd:char strings in any (legacy) document are strings
+    in every record batch.
+    The result can be converted to other Arrow-based frames without a copy (e.g. with
+    polars.from_arrow). Documents can be parsed in parallel as in load_ligolw_tables.
+
+    Parameters
+    ----------
+    paths: str | bytes | PathLike | Iterable[str | bytes | PathLike]
+        A path or list of paths to LIGO_LW XML Document(s).
+    table: str
+        The name of the LIGO_LW Table to read from each document.
+    columns: list[str] | None = None
+        A optional list of column names to filter and read in from each table.
+    ilwdchar_compat: bool
+        Whether to add ilwdchar conversion compatibility.
+    verbose: bool
+        Whether to enable verbose output for ligo.lw.utils.load_filename.
+    where: list[tuple[str, str, Any]] | None = None
+        An optional list of (column, operator, value) predicates that every returned
+        row must satisfy (see load_ligolw_table_columns).
+    cache: LIGOLWTableCache | None = None
+        An optional on-disk columnar cache to read (or write) each document's table.
+    schema: pyarrow.Schema | None = None
+        An optional schema of the table. If None, the schema is given by the table's
+        validcolumns (see get_arrow_schema), where missing columns are null.
+    n_jobs: int | None = None
+        The number of worker processes used to parse documents in parallel. If None or
+        1, documents are parsed serially, and if -1, all available CPUs are used.
+    executor: concurrent.futures.Executor | None = None
+        An optional existing executor to parse documents with, which overrides n_jobs.
+
+    Returns
+    -------
+    pyarrow.Table
+
+    Examples
+    --------
+        >> arrow_table = load_ligolw_arrow_table(zerolags, "postcoh", n_jobs=8)
+        >> df = polars.from_arrow(arrow_table)
+    """
+    import pyarrow as pa
+
+    from .ligolw import _imap_paths, load_ligolw_table_columns
+
+    if isinstance(paths, (str, bytes, PathLike)):
+        paths = [paths]
+    paths = list(paths)
+    if not paths:
+        raise ValueError("No LIGO_LW XML Document paths were provided.")
+
+    load_table_columns = partial(
+        load_ligolw_table_columns,
+        table=table,
+        columns=columns,
+        ilwdchar_compat=ilwdchar_compat,
+        verbose=verbose,
+        cache=cache,
+        where=where,
+    )
+    # convert (and release) the columns of each document as it is loaded
+    batches = []
+    first = None
+    for data in _imap_paths(load_table_columns, paths, n_jobs, executor):
+        batch_schema = schema
+        if batch_schema is None and table in ligo.lw.lsctables.TableByName:
+            batch_schema = _get_table_schema(data, table, columns, ilwdchar_compat)
+        elif batch_schema is None:
+            # unknown tables have no declared columns, so every document is read with
+            # the columns (and types) of the first document
+            if first is None:
+                first = _get_data_schema(data, table, ilwdchar_compat)
+            batch_schema = first
+        batches.append(to_arrow_record_batch(data, table, batch_schema))
+        del data
+
+    if schema is None:
+        schema = _reconcile_schemas([batch.schema for batch in batches])
+        batches = [
+            batch if batch.schema.equals(schema) else batch.cast(schema)
+            for batch in batches
+        ]
+    return pa.Table.from_batches(batches, schema=schema)
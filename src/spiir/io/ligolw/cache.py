@@ -0,0 +1,460 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from os import PathLike
+from pathlib import Path
+from typing import Any, Union, Optional, Dict, List, Iterable, Tuple
+
+import numpy as np
+
+from .stats import get_load_stats
+
+
+logger = logging.getLogger(__name__)
+
+
+def _get_default_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    return Path(cache_home) / "spiir" / "ligolw"
+
+
+class LIGOLWTableCache:
+    """A persistent on-disk cache of LIGO_LW tables stored as columnar .npy files.
+
+    Each cached table is stored in its own directory with one .npy file per column,
+    keyed by the source file path, size and modification time as well as the selected
+    table, columns, and ilwdchar_compat mode. Any change to the source file therefore
+    results in a cache miss, and cached columns are memory-mapped when read back.
+
+    String columns are stored as fixed-width unicode arrays (or pickled if they contain
+    null values), but are read back into object arrays (i.e. copied into memory) so
+    that cached tables have the same dtypes as parsed tables. Only numeric columns are
+    read without a copy.
+
+    The total size of the cache can be bounded by max_bytes, in which case the least
+    recently used entries are evicted after a write once the cache exceeds max_bytes.
+    The size of each entry is tracked as it is written, and the cache directory is
+    only listed again if it was modified by another process (or cache instance), so
+    only evictions need to walk every entry.
+
+    Parameters
+    ----------
+    directory: str | bytes | PathLike | None = None
+        The cache directory, which defaults to $XDG_CACHE_HOME/spiir/ligolw.
+    max_bytes: int | None = None
+        The maximum total size of the cache in bytes. If None, the cache is unbounded.
+
+    Examples
+    --------
+        >> cache = LIGOLWTableCache("/tmp/spiir-cache", max_bytes=10 * 1024**3)
+        >> df = load_ligolw_tables(zerolags, "postcoh", cache=cache)  # parses files
+        >> df = load_ligolw_tables(zerolags, "postcoh", cache=cache)  # reads cache
+        >> cache.invalidate(zerolags[0])
+    """
+    def __init__(
+        self,
+        directory: Optional[Union[str, bytes, PathLike]] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        self.directory = Path(os.fsdecode(directory or _get_default_cache_dir()))
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # the size of each entry by name and their total, as of the directory mtime
+        self._lock = threading.Lock()
+        self._sizes: Optional[Dict[str, int]] = None
+        self._total = 0
+        self._mtime_ns: Optional[int] = None
+
+    def __getstate__(self) -> dict:
+        # the size index is sent to worker processes so they do not rebuild it
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.directory)!r}, max_bytes={self.max_bytes})"
+
+    def key(
+        self,
+        path: Union[str, bytes, PathLike],
+        table: str,
+        columns: Optional[List[str]] = None,
+        ilwdchar_compat: bool = True,
+        where: Optional[List[Tuple[str, str, Any]]] = None,
+    ) -> str:
+        """Returns the cache key for a table read from a LIGO_LW XML Document file."""
+        path = os.path.abspath(os.fsdecode(path))
+        stat = os.stat(path)
+        selection = [
+            path, stat.st_size, stat.st_mtime_ns, table, columns, ilwdchar_compat
+        ]
+        if where:
+            # values of "in" predicates may be arrays, so they are serialized as lists
+            selection.append([
+                [name, op, np.asarray(value).tolist()] for name, op, value in where
+            ])
+        return hashlib.sha1(json.dumps(selection).encode()).hexdigest()
+
+    def get(
+        self,
+        path: Union[str, bytes, PathLike],
+        table: str,
+        columns: Optional[List[str]] = None,
+        ilwdchar_compat: bool = True,
+        where: Optional[List[Tuple[str, str, Any]]] = None,
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """Reads a cached table as a dictionary of memory-mapped column arrays (where
+        string columns are copied into object arrays), or returns None if the table is
+        not present in the cache."""
+        entry = self.directory / self.key(path, table, columns, ilwdchar_compat, where)
+        try:
+            with open(entry / "meta.json") as f:
+                meta = json.load(f)
+
+            data = {}
+            for i, (name, kind) in enumerate(zip(meta["names"], meta["kinds"])):
+                if kind == "pickle":
+                    data[name] = np.load(entry / f"{i}.npy", allow_pickle=True)
+                else:
+                    data[name] = np.load(entry / f"{i}.npy", mmap_mode="r")
+                    if kind == "str":
+                        # copies the column, as parsed string columns are objects
+                        data[name] = data[name].astype(object)
+
+            # mark entry as recently used for least recently used eviction
+            os.utime(entry / "meta.json")
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+
+        logger.debug("Loaded %s table from cache for %s.", table, path)
+        return data
+
+    def put(
+        self,
+        path: Union[str, bytes, PathLike],
+        table: str,
+        data: Dict[str, np.ndarray],
+        columns: Optional[List[str]] = None,
+        ilwdchar_compat: bool = True,
+        where: Optional[List[Tuple[str, str, Any]]] = None,
+    ):
+        """Writes a table read from a LIGO_LW XML Document file to the cache."""
+        key = self.key(path, table, columns, ilwdchar_compat, where)
+        meta = {
+            "path": os.path.abspath(os.fsdecode(path)),
+            "table": table,
+            "names": list(data.keys()),
+            "kinds": [],
+        }
+
+        if self.max_bytes is not None:
+            with self._lock:
+                self._sync()
+
+        # write to a temporary directory first so entries are never partially visible
+        tmpdir = Path(tempfile.mkdtemp(prefix=f".{key}.", dir=self.directory))
+        try:
+            for i, values in enumerate(data.values()):
+                values = np.asarray(values)
+                if values.dtype != object:
+                    meta["kinds"].append("array")
+                elif any(value is None for value in values):
+                    meta["kinds"].append("pickle")
+                else:
+                    meta["kinds"].append("str")
+                    values = values.astype(str)
+                np.save(tmpdir / f"{i}.npy", values, allow_pickle=True)
+            with open(tmpdir / "meta.json", "w") as f:
+                json.dump(meta, f)
+            nbytes = self._entry_size(tmpdir)
+            os.rename(tmpdir, self.directory / key)
+        except OSError:
+            # another process may have written the same entry concurrently
+            shutil.rmtree(tmpdir, ignore_errors=True)
+            return
+
+        if self.max_bytes is not None:
+            with self._lock:
+                self._total += nbytes - self._sizes.get(key, 0)
+                self._sizes[key] = nbytes
+                self._mtime_ns = os.stat(self.directory).st_mtime_ns
+                exceeded = self._total > self.max_bytes
+            if exceeded:
+                self.evict(self.max_bytes)
+
+    def _entries(self) -> List[Path]:
+        return [
+            entry for entry in self.directory.iterdir()
+            if entry.is_dir() and not entry.name.startswith(".")
+        ]
+
+    @staticmethod
+    def _entry_size(entry: Path) -> int:
+        size = 0
+        for file in entry.iterdir():
+            try:
+                size += file.stat().st_size
+            except FileNotFoundError:
+                pass
+        return size
+
+    def _sync(self):
+        # add the entries written (and drop the entries removed) elsewhere to the size
+        # index, which only lists the directory if it was modified since the last sync
+        mtime_ns = os.stat(self.directory).st_mtime_ns
+        if self._sizes is not None and mtime_ns == self._mtime_ns:
+            return
+        sizes = {}
+        for entry in self._entries():
+            size = None if self._sizes is None else self._sizes.get(entry.name)
+            sizes[entry.name] = self._entry_size(entry) if size is None else size
+        self._sizes = sizes
+        self._total = sum(sizes.values())
+        self._mtime_ns = mtime_ns
+
+    @property
+    def size(self) -> int:
+        """The total size of all cache entries in bytes."""
+        return sum(self._entry_size(entry) for entry in self._entries())
+
+    def evict(self, max_bytes: int):
+        """Evicts the least recently used cache entries until the total size of the
+        cache is at most max_bytes."""
+        entries = []
+        for entry in self._entries():
+            try:
+                atime = (entry / "meta.json").stat().st_mtime
+            except FileNotFoundError:
+                atime = 0.  # incomplete entries are evicted first
+            entries.append((atime, self._entry_size(entry), entry))
+
+        total = sum(size for _, size, _ in entries)
+        sizes = {entry.name: size for _, size, entry in entries}
+        for _, size, entry in sorted(entries, key=lambda x: x[0]):
+            if total <= max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            del sizes[entry.name]
+            logger.debug("Evicted %s from cache.", entry.name)
+
+        with self._lock:
+            self._sizes = sizes
+            self._total = total
+            self._mtime_ns = os.stat(self.directory).st_mtime_ns
+
+    def invalidate(
+        self,
+        paths: Optional[Union[str, bytes, PathLike, Iterable]] = None,
+    ):
+        """Removes all cached tables read from the given source file path(s), or all
+        entries in the cache if paths is None."""
+        if paths is None:
+            for entry in self._entries():
+                shutil.rmtree(entry, ignore_errors=True)
+            return
+
+        if isinstance(paths, (str, bytes, PathLike)):
+            paths = [paths]
+        paths = {os.path.abspath(os.fsdecode(path)) for path in paths}
+
+        for entry in self._entries():
+            try:
+                with open(entry / "meta.json") as f:
+                    source = json.load(f)["path"]
+            except (FileNotFoundError, ValueError, KeyError):
+                continue
+            if source in paths:
+                shutil.rmtree(entry, ignore_errors=True)
+
+    def clear(self):
+        """Removes all entries from the cache."""
+        self.invalidate()
+
+
+def _estimate_xmldoc_bytes(xmldoc) -> int:
+    # estimate the memory footprint of a parsed document from its tables and arrays,
+    # where each Python object (e.g. a row value or string) is assumed to be ~64 bytes
+    import ligo.lw.ligolw
+
+    nbytes = 0
+    for elem in xmldoc.getElementsByTagName(ligo.lw.ligolw.Table.tagName):
+        array = getattr(elem, "array", None)
+        if array is not None:
+            nbytes += array.nbytes
+            n_objects = sum(array.dtype[name] == object for name in array.dtype.names)
+            nbytes += 64 * n_objects * len(array)
+        else:
+            nbytes += 64 * len(elem) * (len(elem.columnnames) + 1)
+    for elem in xmldoc.getElementsByTagName(ligo.lw.ligolw.Array.tagName):
+        array = getattr(elem, "array", None)
+        if array is not None:
+            nbytes += array.nbytes
+    return nbytes
+
+
+class LIGOLWDocumentCache:
+    """An in-memory least recently used cache of parsed LIGO_LW XML Documents, such
+    that one parse of a file can serve every loader that reads from it.
+
+    Documents are keyed by their source file path, size and modification time as well
+    as the ilwdchar_compat mode, so any change to the source file results in a cache
+    miss, and loaders only share one parse of each file when called with the same
+    ilwdchar_compat mode. Documents are parsed in full with columnar Table and Array
+    streams (see load_ligolw_xmldoc), and are shared between callers, so they must not
+    be modified.
+
+    The total estimated memory footprint of the cached documents is bounded by
+    max_bytes, and the least recently used documents are evicted after each insertion
+    until the cache fits. Documents larger than max_bytes are never cached.
+
+    Parameters
+    ----------
+    max_bytes: int | None = 1024**3
+        The maximum estimated memory footprint of all cached documents in bytes. If
+        None, the cache is unbounded.
+
+    Examples
+    --------
+        >> xmldoc_cache = LIGOLWDocumentCache(max_bytes=2 * 1024**3)
+        >> df = load_ligolw_tables(coinc, "postcoh", xmldoc_cache=xmldoc_cache)
+        >> psds = load_ligolw_psds(coinc, xmldoc_cache=xmldoc_cache)  # no parse
+        >> xmldoc_cache.stats
+        {'hits': 1, 'misses': 1, 'evictions': 0, 'documents': 1, 'bytes': 1578336, ...}
+    """
+    def __init__(self, max_bytes: Optional[int] = 1024**3):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[tuple, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(max_bytes={self.max_bytes}, "
+            f"documents={len(self)}, bytes={self.nbytes})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> dict:
+        # cached documents are not sent to worker processes
+        return {"max_bytes": self.max_bytes}
+
+    def __setstate__(self, state: dict):
+        self.__init__(state["max_bytes"])
+
+    @property
+    def nbytes(self) -> int:
+        """The total estimated memory footprint of all cached documents in bytes."""
+        return sum(nbytes for _, nbytes in self._entries.values())
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """The hit, miss and eviction counts of the cache, and its current size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "documents": len(self),
+            "bytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+            "hit_rate": self.hits / lookups if lookups else 0.,
+        }
+
+    def key(
+        self,
+        path: Union[str, bytes, PathLike],
+        ilwdchar_compat: bool = True,
+    ) -> tuple:
+        """Returns the cache key for a LIGO_LW XML Document file."""
+        path = os.path.abspath(os.fsdecode(path))
+        stat = os.stat(path)
+        return (path, stat.st_size, stat.st_mtime_ns, ilwdchar_compat)
+
+    def load(
+        self,
+        path: Union[str, bytes, PathLike],
+        ilwdchar_compat: bool = True,
+        verbose: bool = False,
+    ):
+        """Returns the parsed LIGO_LW XML Document of a file from the cache, or parses
+        it with load_ligolw_xmldoc and adds it to the cache if it is not present."""
+        key = self.key(path, ilwdchar_compat)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        stats = get_load_stats()
+        if stats is not None:
+            hit = entry is not None
+            stats.record("xmldoc_cache", hits=int(hit), misses=int(not hit))
+        if entry is not None:
+            logger.debug("Loaded document from memory cache for %s.", path)
+            return entry[0]
+
+        from .ligolw import load_ligolw_xmldoc
+
+        xmldoc = load_ligolw_xmldoc(path, ilwdchar_compat, verbose, columnar=True)
+        self.put(key, xmldoc)
+        return xmldoc
+
+    def put(self, key: tuple, xmldoc):
+        """Adds a parsed LIGO_LW XML Document to the cache with the given key, and
+        evicts the least recently used documents until the cache fits max_bytes."""
+        nbytes = _estimate_xmldoc_bytes(xmldoc)
+        with self._lock:
+            # drop documents read from previous versions of the same file
+            for stale in [k for k in self._entries if k[0] == key[0] and k != key]:
+                del self._entries[stale]
+
+            if self.max_bytes is not None and nbytes > self.max_bytes:
+                logger.debug("Document %s is too large to cache.", key[0])
+                return
+            self._entries[key] = (xmldoc, nbytes)
+            self._entries.move_to_end(key)
+
+            if self.max_bytes is not None:
+                total = self.nbytes
+                while total > self.max_bytes and len(self._entries) > 1:
+                    evicted, (_, size) = self._entries.popitem(last=False)
+                    total -= size
+                    self.evictions += 1
+                    logger.debug("Evicted %s from memory cache.", evicted[0])
+
+    def invalidate(
+        self,
+        paths: Optional[Union[str, bytes, PathLike, Iterable]] = None,
+    ):
+        """Removes all cached documents read from the given source file path(s), or all
+        documents in the cache if paths is None."""
+        with self._lock:
+            if paths is None:
+                self._entries.clear()
+                return
+            if isinstance(paths, (str, bytes, PathLike)):
+                paths = [paths]
+            paths = {os.path.abspath(os.fsdecode(path)) for path in paths}
+            for key in [key for key in self._entries if key[0] in paths]:
+                del self._entries[key]
+
+    def clear(self):
+        """Removes all documents from the cache and resets its statistics."""
+        self.invalidate()
+        self.hits = self.misses = self.evictions = 0
@@ -0,0 +1,523 @@
+import logging
+import operator
+from itertools import compress
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union
+)
+
+import numpy as np
+
+import ligo.lw.array
+import ligo.lw.table
+import ligo.lw.types
+
+
+logger = logging.getLogger(__name__)
+
+
+# the comparison operators supported by where predicates, e.g. ("far", "<", 1e-7)
+OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": np.isin,
+    "not in": lambda values, test: np.isin(values, test, invert=True),
+}
+
+
+def _ilwdchar_to_int(value: str) -> int:
+    """Converts an ilwd:char string ID (e.g. "process:process_id:1") to an integer."""
+    return int(value.rpartition(":")[2])
+
+
+def get_tokenizer_types(
+    table: ligo.lw.table.Table,
+    ilwdchar_columns: Iterable[str] = (),
+) -> list:
+    """Returns the list of Python types used by a ligo.lw.tokenizer.Tokenizer to parse
+    each column of a Table, where ilwd:char columns are converted to integers and any
+    columns not in table.loadcolumns are skipped (i.e. set to None).
+
+    Parameters
+    ----------
+    table: ligo.lw.table.Table
+        The LIGO_LW Table to be parsed, with all of its Column elements attached.
+    ilwdchar_columns: Iterable[str]
+        The names of any columns whose values are ilwd:char strings in the Stream.
+
+    Returns
+    -------
+    list
+        A list of callables (or None) for each column in the table, in order.
+    """
+    ilwdchar_columns = set(ilwdchar_columns)
+    loadcolumns = set(table.columnnames)
+    if table.loadcolumns is not None:
+        loadcolumns &= set(table.loadcolumns)
+
+    return [
+        None if name not in loadcolumns
+        else _ilwdchar_to_int if name in ilwdchar_columns
+        else pytype
+        for pytype, name in zip(table.columnpytypes, table.columnnames)
+    ]
+
+
+def _validate_where(where: Iterable[Tuple[str, str, Any]]):
+    for predicate in where:
+        if len(predicate) != 3:
+            raise ValueError(f"where predicate {predicate!r} must be (column, op, value).")
+        if predicate[1] not in OPERATORS:
+            raise ValueError(
+                f"Unknown where operator {predicate[1]!r}, use one of {list(OPERATORS)}."
+            )
+
+
+def get_where_mask(
+    data: Union[Mapping[str, np.ndarray], np.ndarray],
+    where: Iterable[Tuple[str, str, Any]],
+) -> np.ndarray:
+    """Evaluates a list of column predicates (e.g. [("far", "<", 1e-7)]) against a
+    dictionary of column arrays or a structured array, and returns a boolean mask of
+    the rows that satisfy every predicate.
+
+    Parameters
+    ----------
+    data: dict[str, np.ndarray] | np.ndarray
+        A dictionary of equal length column arrays, or a NumPy structured array.
+    where: Iterable[tuple[str, str, Any]]
+        The (column, operator, value) predicates to evaluate, where the operator is one
+        of "==", "!=", "<", "<=", ">", ">=", "in", or "not in".
+
+    Returns
+    -------
+    np.ndarray
+        A boolean mask with one element per row.
+    """
+    where = list(where)
+    _validate_where(where)
+    mask = None
+    for name, op, value in where:
+        try:
+            column = data[name]
+        except (KeyError, ValueError) as exc:
+            raise KeyError(f"where column {name!r} not found in table.") from exc
+        result = np.asarray(OPERATORS[op](column, value), dtype=bool)
+        mask = result if mask is None else mask & result
+    if mask is None:
+        raise ValueError("where must contain at least one predicate.")
+    return mask
+
+
+def get_structured_dtype(
+    validcolumns: Dict[str, str],
+    columns: Optional[Iterable[str]] = None,
+) -> np.dtype:
+    """Derives a NumPy structured dtype from the validcolumns of a LIGO_LW Table class,
+    (e.g. PostcohInspiralTable.validcolumns) where numeric types are mapped to their
+    native width (e.g. int_4s to int32, real_4 to float32, real_8 to float64) and all
+    other types (e.g. lstring) are stored as Python objects.
+
+    Parameters
+    ----------
+    validcolumns: dict[str, str]
+        A dictionary of column names and their LIGO_LW types.
+    columns: Iterable[str] | None = None
+        An optional subset of column names (and their order) to include in the dtype.
+
+    Returns
+    -------
+    np.dtype
+    """
+    names = validcolumns.keys() if columns is None else columns
+    return np.dtype([
+        (name, ligo.lw.types.ToNumPyType.get(validcolumns[name], object))
+        for name in names
+    ])
+
+
+def parse_table_stream(
+    text: str,
+    dtype: np.dtype,
+    columnnames: Iterable[str],
+    delimiter: str = ",",
+    ilwdchar_columns: Iterable[str] = (),
+    where: Optional[List[Tuple[str, str, Any]]] = None,
+    chunksize: int = 65536,
+) -> np.ndarray:
+    """Parses the character data of a LIGO_LW Table Stream into a NumPy structured
+    array in a vectorized pass, without constructing any per-row objects.
+
+    If where predicates are provided, the Stream is parsed in chunks of rows, where
+    only the predicate columns of each chunk are parsed first and the requested columns
+    are then parsed for only the rows that satisfy every predicate. Rejected rows are
+    therefore only tokenized (and validated), and the memory used by the output is
+    proportional to the number of selected rows.
+
+    The Stream is expected to hold one row per line, as written by ligo.lw and by the
+    SPIIR pipeline, and each line is validated to contain exactly one row. Any input
+    that cannot be parsed unambiguously in this way (such as null numeric values or
+    backslash escaped strings) raises a ValueError, in which case the caller should
+    fall back to the generic ligo.lw tokenizer.
+
+    Parameters
+    ----------
+    text: str
+        The (unescaped) character data of the Stream element.
+    dtype: np.dtype
+        The structured dtype of the output array, see get_structured_dtype. Only the
+        fields present in dtype are parsed, all other columns are skipped.
+    columnnames: Iterable[str]
+        The names of every column in the Stream, in the order they appear.
+    delimiter: str
+        The Stream delimiter.
+    ilwdchar_columns: Iterable[str]
+        The names of any integer columns whose values are ilwd:char strings (e.g.
+        "postcoh:event_id:1") in the Stream, which are converted to integers.
+    where: list[tuple[str, str, Any]] | None = None
+        An optional list of (column, operator, value) predicates, see get_where_mask.
+        Every predicate column must be present in dtype.
+    chunksize: int
+        The number of rows parsed at a time when where predicates are provided.
+
+    Returns
+    -------
+    np.ndarray
+        A structured array with one record per row in the Stream.
+    """
+    columnnames = list(columnnames)
+    lines = [line.strip() for line in text.splitlines()]
+    lines = [line for line in lines if line]
+    if not lines:
+        return np.empty(0, dtype=dtype)
+    if any("\\" in line for line in lines):
+        raise ValueError("Cannot vectorize parsing of escaped Stream characters.")
+    if where and any(name not in dtype.names for name, _, _ in where):
+        raise ValueError("Cannot filter rows by columns that are not in the dtype.")
+
+    # every row is terminated by a delimiter except the last, unless its final token
+    # is null - so we add one to read each line as a row with a trailing empty field
+    if not lines[-1].endswith(delimiter):
+        lines[-1] += delimiter
+
+    ilwdchar_columns = set(ilwdchar_columns) & set(dtype.names)
+    if not where:
+        return _load_table_lines(lines, dtype, columnnames, delimiter, ilwdchar_columns)
+
+    # parse the predicate columns of each chunk first, and then parse the requested
+    # columns of only the rows that satisfy every predicate
+    names = list(dict.fromkeys(name for name, _, _ in where))
+    where_dtype = np.dtype([(name, dtype[name]) for name in names])
+    chunks = []
+    for start in range(0, len(lines), chunksize):
+        chunk = lines[start:start + chunksize]
+        values = _load_table_lines(
+            chunk, where_dtype, columnnames, delimiter, ilwdchar_columns
+        )
+        mask = get_where_mask(values, where)
+        if mask.all() and len(names) == len(dtype.names):
+            chunks.append(values[list(dtype.names)].astype(dtype))
+        elif mask.any():
+            chunk = list(compress(chunk, mask))
+            chunks.append(_load_table_lines(
+                chunk, dtype, columnnames, delimiter, ilwdchar_columns
+            ))
+
+    if not chunks:
+        return np.empty(0, dtype=dtype)
+    return chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+
+
+def _load_table_lines(
+    lines: List[str],
+    dtype: np.dtype,
+    columnnames: List[str],
+    delimiter: str,
+    ilwdchar_columns: Set[str],
+) -> np.ndarray:
+    # read ilwd:char columns as strings and convert them in bulk afterwards, and read
+    # columns that were not requested as truncated strings to validate the row length
+    read_dtype = np.dtype([
+        (
+            name,
+            "U1" if name not in dtype.names
+            else object if name in ilwdchar_columns
+            else dtype[name]
+        )
+        for name in columnnames
+    ] + [("__delimiter__", "U1")])
+    data = np.loadtxt(
+        lines, dtype=read_dtype, delimiter=delimiter, quotechar='"', ndmin=1
+    )
+
+    array = np.empty(len(data), dtype=dtype)
+    for name in dtype.names:
+        if name in ilwdchar_columns:
+            ids = np.char.rpartition(data[name].astype(str), ":")[:, 2]
+            array[name] = ids.astype(dtype[name])
+        else:
+            array[name] = data[name]
+    return array
+
+
+class ColumnarTableStream(ligo.lw.table.TableStream):
+    """A LIGO_LW Table Stream that buffers its character data and parses it in bulk into
+    a NumPy structured array, stored on the parent Table as the .array attribute.
+
+    The structured dtype is derived from the parent Table's validcolumns (restricted to
+    its loadcolumns, if set), and no row objects are appended to the Table. If the
+    Stream cannot be vectorized, the generic row-by-row ligo.lw tokenizer is used.
+
+    If where predicates are provided, rows that do not satisfy every predicate are
+    discarded as the Stream is parsed (see parse_table_stream). Note that they are not
+    discarded if the Stream falls back to the ligo.lw tokenizer.
+
+    Note: Tables parsed with this Stream have no rows, so they are intended to be read
+    via their .array attribute (e.g. get_ligolw_table_columns_from_xmldoc) and should
+    not be written back out to a LIGO_LW XML Document.
+    """
+    def config(
+        self,
+        parentNode,
+        ilwdchar_columns: Iterable[str] = (),
+        where: Optional[List[Tuple[str, str, Any]]] = None,
+    ):
+        self._ilwdchar_columns = set(ilwdchar_columns)
+        self._where = where
+        self._buffer = []
+        return self
+
+    def appendData(self, content):
+        if self._buffer is None:
+            return super().appendData(content)
+        self._buffer.append(content)
+
+    def endElement(self):
+        table = self.parentNode
+        text = "".join(self._buffer)
+        self._buffer = None  # any further data is passed on to the tokenizer
+
+        columnnames = table.columnnames
+        loadcolumns = columnnames
+        if table.loadcolumns is not None:
+            loadcolumns = [name for name in columnnames if name in table.loadcolumns]
+        validcolumns = table.validcolumns or {}
+        types = dict(zip(columnnames, table.columntypes))
+        types.update((name, validcolumns[name]) for name in columnnames if name in validcolumns)
+
+        try:
+            table.array = parse_table_stream(
+                text,
+                get_structured_dtype(types, loadcolumns),
+                columnnames,
+                delimiter=self.Delimiter,
+                ilwdchar_columns=self._ilwdchar_columns,
+                where=self._where,
+            )
+        except ValueError as exc:
+            logger.debug("Falling back to ligo.lw tokenizer for %s: %s", table.Name, exc)
+            super().config(table)
+            self._tokenizer.set_types(get_tokenizer_types(table, self._ilwdchar_columns))
+            self.appendData(text)
+            super().endElement()
+
+
+def _format_column(
+    values: np.ndarray,
+    coltype: str,
+    ilwdchar_prefix: Optional[Union[str, np.ndarray]] = None,
+) -> List[str]:
+    # format every value of a column as a Stream token, where null values are empty
+    values = np.asarray(values)
+    null = None
+    if values.dtype == object:
+        null = np.array(
+            [value is None or (isinstance(value, float) and value != value)
+             for value in values],
+            dtype=bool,
+        )
+    elif values.dtype.kind == "f" and coltype not in ligo.lw.types.FloatTypes:
+        null = np.isnan(values)
+    if null is not None and null.any():
+        fill = 0 if coltype in ligo.lw.types.NumericTypes else ""
+        values = np.where(null, fill, values)
+    else:
+        null = None
+
+    if ilwdchar_prefix is not None:
+        ids = values.astype(np.int64).astype(str)
+        tokens = np.char.add(np.char.add(np.char.add('"', ilwdchar_prefix), ids), '"')
+        tokens = tokens.tolist()
+    elif coltype in ligo.lw.types.StringTypes:
+        # escape back-slashes and quotes as ligo.lw does, as well as XML characters
+        tokens = values.astype(str)
+        for old, new in (
+            ("\\", "\\\\"), ('"', '\\"'), ("&", "&amp;"), ("<", "&lt;"), (">", "&gt;")
+        ):
+            if np.char.find(tokens, old).max(initial=-1) >= 0:
+                tokens = np.char.replace(tokens, old, new)
+        tokens = np.char.add(np.char.add('"', tokens), '"').tolist()
+    elif coltype in ligo.lw.types.IntTypes | ligo.lw.types.FloatTypes:
+        # formatting native Python values is faster than np.ndarray.astype(str), and
+        # %.9g and repr are the shortest formats that round-trip float32 and float64
+        values = values.astype(ligo.lw.types.ToNumPyType[coltype])
+        if null is None and len(values) > 1 and (values == values[0]).all():
+            # constant columns (e.g. those of absent detectors) are formatted once
+            return _format_column(values[:1], coltype) * len(values)
+        if values.dtype == np.float32:
+            tokens = list(map("%.9g".__mod__, values.tolist()))
+        elif values.dtype == np.float64:
+            tokens = list(map(repr, values.tolist()))
+        else:
+            tokens = list(map(str, values.tolist()))
+    else:
+        raise ValueError(f"Cannot format column values of type {coltype}.")
+
+    if null is not None:
+        for i in np.flatnonzero(null):
+            tokens[i] = ""
+    return tokens
+
+
+def format_table_stream(
+    data: Mapping[str, np.ndarray],
+    columntypes: Mapping[str, str],
+    delimiter: str = ",",
+    indent: str = "\t\t\t",
+    ilwdchar_prefixes: Optional[Mapping[str, Union[str, np.ndarray]]] = None,
+    chunksize: int = 65536,
+) -> Iterator[str]:
+    """Formats the columns of a LIGO_LW Table as the character data of its Stream in
+    vectorized passes over each column, without constructing any per-row objects.
+
+    The output matches the layout written by ligo.lw, with one row per line and each
+    row terminated by a delimiter except the last, and is generated in chunks of rows
+    such that the memory used is bounded for arbitrarily large tables.
+
+    Parameters
+    ----------
+    data: Mapping[str, np.ndarray]
+        A dictionary of equal length column arrays, in the order they are written.
+    columntypes: Mapping[str, str]
+        The LIGO_LW type of each column (e.g. "int_4s", "real_4", or "lstring").
+    delimiter: str
+        The Stream delimiter.
+    indent: str
+        The whitespace written at the start of each row.
+    ilwdchar_prefixes: Mapping[str, str | np.ndarray] | None = None
+        An optional dictionary of integer ID columns to write as ilwd:char strings and
+        their prefix (e.g. {"process_id": "process:process_id:"}), which may also be an
+        array with a prefix for each row.
+    chunksize: int
+        The number of rows formatted at a time.
+
+    Returns
+    -------
+    Iterator[str]
+        The character data of the Stream, in chunks of rows.
+    """
+    ilwdchar_prefixes = ilwdchar_prefixes or {}
+    length = len(next(iter(data.values()), ()))
+    newline = "\n" + indent
+    for start in range(0, length, chunksize):
+        stop = start + chunksize
+        columns = []
+        for name, values in data.items():
+            prefix = ilwdchar_prefixes.get(name)
+            if isinstance(prefix, np.ndarray):
+                prefix = prefix[start:stop]
+            columns.append(
+                _format_column(values[start:stop], columntypes[name], prefix)
+            )
+
+        text = (delimiter + newline).join(map(delimiter.join, zip(*columns)))
+        yield (newline if start == 0 else delimiter + newline) + text
+
+    # a final delimiter indicates that the last token is present if it is null
+    if length > 0 and columns and columns[-1][-1] == "":
+        yield delimiter
+
+
+def parse_array_stream(
+    text: str,
+    dtype: np.dtype,
+    shape: Tuple[int, ...],
+    delimiter: str = " ",
+) -> np.ndarray:
+    """Parses the character data of a numeric LIGO_LW Array Stream into a NumPy array
+    in a single vectorized pass, without tokenizing each value in Python.
+
+    LIGO_LW Array Streams are written with the first dimension varying fastest, so
+    the values are read in order and reshaped to match the Array's shape attribute
+    (e.g. a REAL8FrequencySeries PSD:array of shape (2, n) has frequencies in row 0
+    and PSD values in row 1).
+
+    Parameters
+    ----------
+    text: str
+        The (unescaped) character data of the Stream element.
+    dtype: np.dtype
+        The numeric dtype of the Array (i.e. ligo.lw.types.ToNumPyType[array.Type]).
+    shape: tuple[int, ...]
+        The shape of the Array as given by its Dim elements (i.e. array.shape).
+    delimiter: str
+        The Stream delimiter.
+
+    Returns
+    -------
+    np.ndarray
+        An array of the given dtype and shape.
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind not in "iuf":
+        raise ValueError(f"Cannot vectorize parsing of {dtype} Array Streams.")
+    if delimiter != " ":
+        text = text.replace(delimiter, " ")
+    if text.isspace() or not text:
+        # np.fromstring parses whitespace alone as a single value of -1
+        values = np.empty(0, dtype=dtype)
+    else:
+        # parses the text in C without building a Python string for each value
+        values = np.fromstring(text, dtype=dtype, sep=" ")
+
+    size = int(np.prod(shape))
+    if len(values) != size:
+        raise ValueError(
+            f"length of Stream ({len(values)} elements) does not match "
+            f"array size ({size} elements)"
+        )
+    return values.reshape(tuple(reversed(shape))).T
+
+
+class ColumnarArrayStream(ligo.lw.array.ArrayStream):
+    """A LIGO_LW Array Stream that buffers its character data and parses it in bulk into
+    the parent Array's .array attribute, rather than tokenizing it value by value.
+
+    Arrays with non-numeric types (e.g. complex) are parsed with the generic ligo.lw
+    tokenizer as usual.
+    """
+    def config(self, parentNode):
+        self._buffer = []
+        return self
+
+    def appendData(self, content):
+        if self._buffer is None:
+            return super().appendData(content)
+        self._buffer.append(content)
+
+    def endElement(self):
+        array = self.parentNode
+        text = "".join(self._buffer)
+        self._buffer = None  # any further data is passed on to the tokenizer
+
+        try:
+            dtype = ligo.lw.types.ToNumPyType[array.Type]
+            array.array = parse_array_stream(text, dtype, array.shape, self.Delimiter)
+        except (KeyError, ValueError) as exc:
+            logger.debug("Falling back to ligo.lw tokenizer for %s: %s", array.Name, exc)
+            super().config(array)
+            self.appendData(text)
+            super().endElement()
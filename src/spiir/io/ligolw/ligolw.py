@@ -1,26 +1,63 @@
+from __future__ import annotations
+
+import gzip
+import io
 import logging
-from collections.abc import Iterable
+import os
+import re
+import tempfile
+import xml.parsers.expat
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from multiprocessing.shared_memory import SharedMemory
 from os import PathLike
-from tempfile import NamedTemporaryFile
-from typing import Union, Optional, Dict, List
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
-import pandas as pd
 import numpy as np
 
-from gwpy.frequencyseries import FrequencySeries
-
-import lal.series
 from ligo.lw import ligolw
 import ligo.lw.array
 import ligo.lw.param
 import ligo.lw.table
+import ligo.lw.types
 import ligo.lw.utils
 
 from . import postcoh
+from .cache import LIGOLWDocumentCache, LIGOLWTableCache
+from .columnar import (
+    ColumnarArrayStream,
+    ColumnarTableStream,
+    format_table_stream,
+    get_tokenizer_types,
+    get_where_mask,
+    _ilwdchar_to_int,
+    _validate_where,
+)
+from .stats import timed_stage, wrap_worker
 
 # import after postcoh.py for PostcohInspiralTable compatibility
 import ligo.lw.lsctables
-from gwpy.table import EventTable
+
+# pandas, lal.series and gwpy (and astropy) are slow to import, so they are only
+# imported within the functions that use them
+if TYPE_CHECKING:
+    import pandas as pd
+    from gwpy.table import EventTable
 
 
 logger = logging.getLogger(__name__)
@@ -34,13 +71,239 @@ logger = logging.getLogger(__name__)
 @ligo.lw.array.use_in
 @ligo.lw.param.use_in
 @ligo.lw.table.use_in
-class ILWDCharCompatContentHandler(ligolw.LIGOLWContentHandler):
+class LIGOLWContentHandler(ligolw.LIGOLWContentHandler):
+    pass
+
+
+class ILWDCharCompatContentHandler(LIGOLWContentHandler):
+    """A LIGO_LW content handler that converts all ilwd:char types to int_8s integers
+    as the document is parsed.
+
+    ilwd:char Table columns are converted in bulk by the Stream tokenizer as each row is
+    read (i.e. "process:process_id:1" is tokenized directly as 1), and ilwd:char Param
+    values are converted as each Param element is closed, such that the resulting
+    document does not need to be passed through strip_ilwdchar afterwards.
+    """
+    ilwdchar_compat = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._ilwdchar_columns = set()  # ilwd:char columns of the current table
+
+    def startColumn(self, parent, attrs):
+        column = super().startColumn(parent, attrs)
+        if self.ilwdchar_compat and column.Type == "ilwd:char":
+            column.Type = "int_8s"
+            self._ilwdchar_columns.add(column.Name)
+        return column
+
+    def startStream(self, parent, attrs):
+        stream = super().startStream(parent, attrs)
+        if parent.tagName == ligolw.Table.tagName:
+            if self._ilwdchar_columns:
+                types = get_tokenizer_types(parent, self._ilwdchar_columns)
+                stream._tokenizer.set_types(types)
+            self._ilwdchar_columns = set()
+        return stream
+
+    def endElementNS(self, uri_localname, qname):
+        element = self.current
+        super().endElementNS(uri_localname, qname)
+        if (
+            self.ilwdchar_compat
+            and element.tagName == ligolw.Param.tagName
+            and element.Type == "ilwd:char"
+        ):
+            element.Type = "int_8s"
+            if element.value is not None:
+                element.value = _ilwdchar_to_int(element.value)
+
+
+@postcoh.use_in
+class PostcohContentHandler(ILWDCharCompatContentHandler):
+    """An ILWDCharCompatContentHandler that builds known SPIIR tables (i.e. the postcoh
+    table) with their custom Table classes, as registered by postcoh.use_in."""
+    pass
+
+
+class SelectiveContentHandler(PostcohContentHandler):
+    """A LIGO_LW content handler that only builds the Tables, Arrays and Columns that
+    have been explicitly requested, discarding everything else at the SAX level.
+
+    Elements that are not selected are skipped along with all of their children, and
+    the XML parser's character data callback is detached while inside them so that no
+    Python strings are built for their (potentially very large) Stream contents.
+
+    When ilwdchar_compat is True, ilwd:char columns are converted to int_8s integers
+    as each Stream is tokenized, and known SPIIR tables (i.e. the postcoh table) are
+    built with their custom Table classes (see PostcohContentHandler). Otherwise they
+    are built as generic Tables, as their validcolumns do not accept legacy ilwd:char
+    IDs. If columnar is True, the Streams of known SPIIR tables are instead parsed in bulk into a NumPy
+    structured array (see columnar.ColumnarTableStream) stored as table.array, and
+    numeric Array Streams are parsed in bulk (see columnar.ColumnarArrayStream).
+
+    Parameters
+    ----------
+    document: ligo.lw.ligolw.Document
+        The Document object into which the parsed XML tree will be loaded.
+    tables: Iterable[str] | None = None
+        The names of the Tables to load. If None, all Tables are loaded.
+    arrays: Iterable[str] | None = None
+        The names of the Arrays to load. If None, all Arrays are loaded.
+    columns: Iterable[str] | dict[str, Iterable[str]] | None = None
+        The names of the Columns to load in each Table, or a dictionary of the Columns
+        to load for each Table by name (where Tables not in the dictionary are loaded
+        with all of their Columns). If None, all Columns are loaded.
+    ilwdchar_compat: bool
+        Whether to convert ilwd:char Table columns to integers during tokenization.
+    columnar: bool
+        Whether to parse known SPIIR tables and numeric Arrays in bulk with NumPy.
+    where: list[tuple[str, str, Any]] | None = None
+        An optional list of (column, operator, value) predicates (e.g. [("far", "<",
+        1e-7)]) used to discard the rows of known SPIIR tables while they are parsed,
+        if columnar is True. Predicate columns are always loaded.
+
+    Examples
+    --------
+        >> from functools import partial
+        >> content_handler = partial(SelectiveContentHandler, tables=["postcoh"], arrays=[])
+        >> xmldoc = ligo.lw.utils.load_filename("coinc.xml", contenthandler=content_handler)
+    """
+    def __init__(
+        self,
+        document: ligo.lw.ligolw.Element,
+        tables: Optional[Iterable[str]] = None,
+        arrays: Optional[Iterable[str]] = None,
+        columns: Optional[Union[Iterable[str], Dict[str, Iterable[str]]]] = None,
+        ilwdchar_compat: bool = True,
+        columnar: bool = False,
+        where: Optional[List[Tuple[str, str, Any]]] = None,
+    ):
+        super().__init__(document)
+        self.tables = None
+        if tables is not None:
+            self.tables = {ligo.lw.table.Table.TableName(name) for name in tables}
+        self.arrays = None
+        if arrays is not None:
+            self.arrays = {ligo.lw.array.Array.ArrayName(name) for name in arrays}
+        self.columns = None
+        if isinstance(columns, dict):
+            self.columns = {
+                ligo.lw.table.Table.TableName(name): set(names)
+                for name, names in columns.items()
+            }
+        elif columns is not None:
+            self.columns = set(columns)
+        self.ilwdchar_compat = ilwdchar_compat
+        self.columnar = columnar
+        self.where = where or None
+        if self.where is not None:
+            _validate_where(self.where)
+
+        self._depth = 0  # depth of the currently skipped element subtree
+        self._parser = None  # the underlying expat parser, or False if unavailable
+        self._character_data_handler = None  # the detached character data callback
+
+    def _get_columns(self, table: str) -> Optional[set]:
+        # the set of columns to load for a table (with any predicate columns), if any
+        columns = self.columns
+        if isinstance(columns, dict):
+            columns = columns.get(table)
+        if columns is not None and self.where is not None:
+            columns = columns | {name for name, _, _ in self.where}
+        return columns
+
+    def _is_selected(self, localname: str, attrs) -> bool:
+        if localname == ligolw.Table.tagName and self.tables is not None:
+            name = attrs.get((None, "Name"))
+            return name is not None and ligo.lw.table.Table.TableName(name) in self.tables
+        if localname == ligolw.Array.tagName and self.arrays is not None:
+            name = attrs.get((None, "Name"))
+            return name is not None and ligo.lw.array.Array.ArrayName(name) in self.arrays
+        return True
+
+    def _get_expat_parser(self) -> Optional[xml.parsers.expat.XMLParserType]:
+        # the expat parser driving this handler via xml.sax.expatreader, if available,
+        # which is reached through private attributes that other readers may not have
+        if self._parser is None:
+            self._parser = False
+            try:
+                parser = self._locator._ref._parser
+            except (AttributeError, ReferenceError):
+                logger.debug("No expat parser found, skipped elements are tokenized.")
+            else:
+                if isinstance(parser, xml.parsers.expat.XMLParserType):
+                    self._parser = parser
+        return self._parser or None
+
+    def _set_character_data_handler(self, enabled: bool):
+        # detach the expat character data callback while inside skipped elements
+        # so no Python strings are created for their content, otherwise they are
+        # still discarded by self.characters (i.e. parsed as normal)
+        parser = self._get_expat_parser()
+        if parser is None:
+            return
+        if enabled:
+            if self._character_data_handler is not None:
+                parser.CharacterDataHandler = self._character_data_handler
+                self._character_data_handler = None
+        elif self._character_data_handler is None:
+            self._character_data_handler = parser.CharacterDataHandler
+            parser.CharacterDataHandler = None
+
+    def startElementNS(self, uri_localname, qname, attrs):
+        if self._depth > 0:
+            self._depth += 1
+        elif not self._is_selected(uri_localname[1], attrs):
+            self._depth = 1
+            self._set_character_data_handler(False)
+        else:
+            super().startElementNS(uri_localname, qname, attrs)
+
+    def endElementNS(self, uri_localname, qname):
+        if self._depth > 0:
+            self._depth -= 1
+            if self._depth == 0:
+                self._set_character_data_handler(True)
+            return
+
+        # drop the column elements that were not loaded into the table rows
+        current = self.current
+        if current.tagName == ligolw.Table.tagName and current.loadcolumns is not None:
+            for column in current.getElementsByTagName(ligolw.Column.tagName):
+                if column.Name not in current.loadcolumns:
+                    current.removeChild(column).unlink()
+
+        super().endElementNS(uri_localname, qname)
+
+    def characters(self, content):
+        if self._depth == 0:
+            super().characters(content)
+
+    def startTable(self, parent, attrs):
+        if self.ilwdchar_compat:
+            return super().startTable(parent, attrs)
+        # skip the custom Table classes registered by PostcohContentHandler
+        return ILWDCharCompatContentHandler.startTable(self, parent, attrs)
+
+    def startStream(self, parent, attrs):
+        if parent.tagName == ligolw.Table.tagName:
+            columns = self._get_columns(parent.Name)
+            if columns is not None:
+                parent.loadcolumns = columns & set(parent.columnnames)
+
+            # parse known SPIIR tables in bulk into a structured array
+            if self.columnar and parent.Name in postcoh.TableByName:
+                ilwdchar_columns, self._ilwdchar_columns = self._ilwdchar_columns, set()
+                parent._end_of_columns()
+                stream = ColumnarTableStream(attrs)
+                return stream.config(parent, ilwdchar_columns, self.where)
 
-        # convert all ilwd:char types to int_8s in ligolw arrays and tables
-        # requires the content_handler to be instantiated with use_in decorators
-        self.document = strip_ilwdchar(self.document)
+        # parse numeric arrays (i.e. PSDs) in bulk rather than value by value
+        if self.columnar and parent.tagName == ligolw.Array.tagName:
+            return ColumnarArrayStream(attrs).config(parent)
+
+        return super().startStream(parent, attrs)
 
 
 def strip_ilwdchar(xmldoc: ligo.lw.ligolw.Element) -> ligo.lw.ligolw.Element:
@@ -50,7 +313,10 @@ def strip_ilwdchar(xmldoc: ligo.lw.ligolw.Element) -> ligo.lw.ligolw.Element:
     Weight XML Python library.
 
     This is a refactor from ligo.lw to handle ligo.lw.param.Param
-    as well as ligo.lw.table.Table.
+    as well as ligo.lw.table.Table, where ilwd:char table columns are
+    converted in bulk one column at a time rather than row by row. Documents
+    loaded with ilwdchar_compat=True are already converted as they are parsed
+    (see ILWDCharCompatContentHandler), in which case this is a no-op.
 
     Parameters
     ----------
@@ -73,113 +339,388 @@ def strip_ilwdchar(xmldoc: ligo.lw.ligolw.Element) -> ligo.lw.ligolw.Element:
     own algorithm for doing so, specifically for their needs.
 
     """
-    for elem in xmldoc.getElements(
-        lambda e: (
-            (e.tagName == ligo.lw.table.Table.tagName)
-            or (e.tagName == ligo.lw.param.Param.tagName)
-        )
-    ):
-        logging.info(f"{elem.tagName} {elem.Name}")
-
-        # convert table ilwd:char column values to integers
-        if elem.tagName == ligo.lw.table.Table.tagName:
-            # first strip table names from column names that shouldn't have them
-            if elem.Name in ligo.lw.lsctables.TableByName:
-                validcolumns = ligo.lw.lsctables.TableByName[elem.Name].validcolumns
-                stripped_column_to_valid_column = dict(
-                    (ligo.lw.table.Column.ColumnName(name), name)
-                    for name in validcolumns
-                )
-                for column in elem.getElementsByTagName(ligolw.Column.tagName):
-                    if column.getAttribute("Name") not in validcolumns:
-                        before = column.getAttribute("Name")
-                        column.setAttribute(
-                            "Name", stripped_column_to_valid_column[column.Name]
-                        )
-                        logging.info(
-                            f'Renamed {elem.Name} column {before} to {column.getAttribute("Name")}.'
-                        )
-
-            # convert ilwd:char ids to integers
-            idattrs = tuple(
-                elem.columnnames[i]
-                for i, coltype in enumerate(elem.columntypes)
-                if coltype == "ilwd:char"
+    with timed_stage("strip_ilwdchar"):
+        for elem in xmldoc.getElements(
+            lambda e: (
+                (e.tagName == ligo.lw.table.Table.tagName)
+                or (e.tagName == ligo.lw.param.Param.tagName)
             )
-
-            if not idattrs:
-                logging.info("no ID columns to convert.")
-                continue
-
-            for row in elem:
-                for attr in idattrs:
-                    new_value = getattr(row, attr)
-                    if new_value is not None:
-                        setattr(row, attr, int(new_value.split(":")[-1]))
-
-            # update the column types
-            for attr in idattrs:
-                elem.getColumnByName(attr).Type = "int_8s"
-
-            logging.info(f"Converted id column(s) {', '.join(sorted(idattrs))}.")
-
-        # convert param ilwd:char values to integers
-        if elem.tagName == ligo.lw.param.Param.tagName:
-            if elem.Type == "ilwd:char":
-                value = getattr(elem, "value", None)
-                setattr(elem, "Type", "int_8s")
-                if value is not None:
-                    new_value = int(value.split(":")[-1])
-                    setattr(elem, "value", new_value)
-                    logging.info(f"Converted param {elem.Name} value to {new_value}")
-                else:
-                    logging.info(f"Converted param {elem.Name}, but value is None.")
-
-            else:
-                logging.info("No param values to convert.")
+        ):
+            # convert table ilwd:char column values to integers
+            if elem.tagName == ligo.lw.table.Table.tagName:
+                # first strip table names from column names that shouldn't have them
+                if elem.Name in ligo.lw.lsctables.TableByName:
+                    validcolumns = ligo.lw.lsctables.TableByName[elem.Name].validcolumns
+                    stripped_column_to_valid_column = dict(
+                        (ligo.lw.table.Column.ColumnName(name), name)
+                        for name in validcolumns
+                    )
+                    for column in elem.getElementsByTagName(ligolw.Column.tagName):
+                        before = column.getAttribute("Name")
+                        if before in validcolumns:
+                            continue
+                        after = stripped_column_to_valid_column.get(column.Name)
+                        if after is None:
+                            logger.debug("Unknown %s column %s.", elem.Name, before)
+                            continue
+                        column.setAttribute("Name", after)
+                        logger.debug("Renamed %s column %s to %s.", elem.Name, before, after)
+
+                # convert ilwd:char ids to integers one column at a time
+                for column in elem.getElementsByTagName(ligolw.Column.tagName):
+                    if column.Type != "ilwd:char":
+                        continue
+                    if len(elem) > 0:
+                        values = np.array(column[:], dtype=object)
+                        valid = values != None  # noqa: E711
+                        ids = np.char.rpartition(values[valid].astype(str), ":")[:, 2]
+                        values[valid] = ids.astype(np.int64).tolist()
+                        column[:] = values
+                    column.Type = "int_8s"
+                    logger.debug("Converted %s id column %s.", elem.Name, column.Name)
+
+            # convert param ilwd:char values to integers
+            elif elem.Type == "ilwd:char":
+                elem.Type = "int_8s"
+                if elem.value is not None:
+                    elem.value = _ilwdchar_to_int(elem.value)
+                logger.debug("Converted param %s value to %s.", elem.Name, elem.value)
 
     return xmldoc
 
 
 def load_ligolw_xmldoc(
-    path: Union[str, bytes, PathLike],
+    path: Union[str, bytes, PathLike, BinaryIO],
     ilwdchar_compat: bool=True,
     verbose: bool=False,
+    tables: Optional[Iterable[str]] = None,
+    arrays: Optional[Iterable[str]] = None,
+    columns: Optional[Union[Iterable[str], Dict[str, Iterable[str]]]] = None,
+    columnar: bool = False,
+    where: Optional[List[Tuple[str, str, Any]]] = None,
 ) -> ligo.lw.ligolw.Element:
-    """Reads a valid LIGO_LW XML Document from a file path and returns a dictionary containing
-    the complex SNR timeseries arrays associated with each interferometer ('ifo').
+    """Reads a valid LIGO_LW XML Document from a file path or binary file object and
+    returns the parsed document.
+
+    If any of tables, arrays, or columns are provided, the document is parsed with a
+    SelectiveContentHandler that discards every Table, Array, or Column that was not
+    requested before it is built, which can be substantially faster for documents
+    that contain large arrays (e.g. PSDs) that are not needed.
 
     Parameters
     ----------
-    paths: str | bytes | PathLike
-        A path-like to a file containing a valid LIGO_LW XML Document.
-    add_epoch_time: bool
-        Whether to add the epoch time to each SNR series array for correct timestamps.
+    path: str | bytes | PathLike | BinaryIO
+        A path-like to a file containing a valid LIGO_LW XML Document, or an open
+        binary file object (e.g. io.BytesIO) containing the document, which may be
+        gzip compressed in either case.
     ilwdchar_compat: bool
         Whether to add ilwdchar conversion compatibility.
     verbose: bool
         Whether to enable verbose output for ligo.lw.utils.load_filename.
-    
+    tables: Iterable[str] | None = None
+        An optional whitelist of Table names to load (e.g. ["postcoh"]).
+    arrays: Iterable[str] | None = None
+        An optional whitelist of Array names to load (e.g. ["PSD"]), or [] for none.
+    columns: Iterable[str] | dict[str, Iterable[str]] | None = None
+        An optional whitelist of Column names to load for each loaded Table, or a
+        dictionary of Column name whitelists for each Table by name.
+    columnar: bool
+        Whether to parse known SPIIR tables (i.e. postcoh) in bulk into a NumPy
+        structured array stored as table.array, rather than into row objects.
+    where: list[tuple[str, str, Any]] | None = None
+        An optional list of (column, operator, value) predicates used to discard the
+        rows of known SPIIR tables while they are parsed (requires columnar=True).
+
     Returns
     -------
     ligo.lw.ligolw.Element
+        The root element of the parsed LIGO_LW XML Document.
     """
     # define XML document parser
-    if ilwdchar_compat:
+    if columnar or any(arg is not None for arg in (tables, arrays, columns)):
+        content_handler = partial(
+            SelectiveContentHandler,
+            tables=tables,
+            arrays=arrays,
+            columns=columns,
+            ilwdchar_compat=ilwdchar_compat,
+            columnar=columnar,
+            where=where,
+        )
+    elif ilwdchar_compat:
         content_handler = ILWDCharCompatContentHandler
     else:
+        content_handler = LIGOLWContentHandler
+
+    with timed_stage("parse") as stage:
+        if stage:
+            stage.add(files=1, bytes=_get_size(path))
+        if hasattr(path, "read"):
+            xmldoc = ligo.lw.utils.load_fileobj(path, contenthandler=content_handler)
+        else:
+            xmldoc = ligo.lw.utils.load_filename(
+                path, verbose=verbose, contenthandler=content_handler
+            )
+        if stage:
+            stage.add(**_count_elements(xmldoc))
+    return xmldoc
 
-        @ligo.lw.array.use_in
-        @ligo.lw.param.use_in
-        @ligo.lw.table.use_in
-        class ContentHandler(ligo.lw.ligolw.LIGOLWContentHandler):
-            pass
 
-        content_handler = ContentHandler
+def _get_size(path: Union[str, bytes, PathLike, BinaryIO]) -> int:
+    # the size of a file (or in-memory file object) in bytes, or 0 if it is unknown
+    if hasattr(path, "getbuffer"):
+        return path.getbuffer().nbytes
+    if hasattr(path, "read"):
+        return 0
+    return os.path.getsize(path)
 
-    return ligo.lw.utils.load_filename(
-        path, verbose=verbose, contenthandler=content_handler
-    )
+
+def _count_elements(xmldoc: ligo.lw.ligolw.Element) -> Dict[str, int]:
+    # count the Tables (and their rows) and Arrays parsed into a document
+    tables = xmldoc.getElementsByTagName(ligolw.Table.tagName)
+    rows = 0
+    for table in tables:
+        array = getattr(table, "array", None)
+        rows += len(array) if array is not None else len(table)
+    arrays = len(xmldoc.getElementsByTagName(ligolw.Array.tagName))
+    return {"tables": len(tables), "rows": rows, "arrays": arrays}
+
+
+def get_ligolw_table_columns_from_xmldoc(
+    xmldoc: ligo.lw.ligolw.Element,
+    table: str,
+    columns: Optional[List[str]] = None,
+) -> Dict[str, np.ndarray]:
+    """Extracts the columns of a LIGO_LW Table from a ligo.lw.ligolw.Document object as
+    a dictionary of typed NumPy arrays, without writing the document back out to disk.
+
+    Numeric columns are converted to their native NumPy dtype as defined by the Type
+    attribute of each LIGO_LW Column (e.g. real_4 to float32, int_4s to int32), while
+    string-like columns (e.g. lstring, or ilwd:char when not converted) and numeric
+    columns that contain null values (i.e. None) are returned as object arrays. If the
+    table was parsed in bulk into a structured array (i.e. with load_ligolw_xmldoc(...,
+    columnar=True)), its fields are returned directly.
+
+    Parameters
+    ----------
+    xmldoc: ligo.lw.ligolw.Element
+        A LIGO_LW XML Document, or Element, containing the necessary LIGO_LW elements.
+    table: str
+        The name of the LIGO_LW Table to extract (e.g. "postcoh" or "sngl_inspiral").
+    columns: list[str] | None = None
+        A optional list of column names to extract, in order. If None, all columns
+        are extracted in the order they appear in the document.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        A dictionary of column names and their respective column value arrays.
+    """
+    ligolw_table = ligo.lw.table.Table.get_table(xmldoc, name=table)
+    names = ligolw_table.columnnames if columns is None else columns
+
+    array = getattr(ligolw_table, "array", None)
+    if array is not None:
+        return {name: array[name] for name in names}
+
+    with timed_stage("extract_columns") as stage:
+        data = {}
+        for name in names:
+            column = ligolw_table.getColumnByName(name)
+            dtype = ligo.lw.types.ToNumPyType.get(column.Type)
+            if dtype is not None:
+                try:
+                    data[name] = np.fromiter(column, dtype=dtype, count=len(ligolw_table))
+                except TypeError:
+                    # numeric columns with null values are kept as object arrays
+                    data[name] = np.array(list(column), dtype=object)
+            else:
+                data[name] = np.array(list(column), dtype=object)
+        stage.add(rows=len(ligolw_table))
+
+    return data
+
+
+def load_ligolw_table_columns(
+    path: Union[str, bytes, PathLike, BinaryIO],
+    table: str,
+    columns: Optional[List[str]] = None,
+    ilwdchar_compat: bool=True,
+    verbose: bool=False,
+    cache: Optional[LIGOLWTableCache] = None,
+    where: Optional[List[Tuple[str, str, Any]]] = None,
+    xmldoc_cache: Optional[LIGOLWDocumentCache] = None,
+) -> Dict[str, np.ndarray]:
+    """Loads a LIGO_LW Table from a LIGO_LW XML Document and returns its columns as a
+    dictionary of typed NumPy arrays.
+
+    Only the requested table (and columns) are parsed from the document, and known
+    SPIIR tables (i.e. postcoh) are parsed in bulk without constructing row objects.
+    The compact columnar output makes this function suitable for use in worker processes.
+
+    Rows can be filtered with a list of where predicates, which are evaluated on the
+    typed columns of known SPIIR tables as they are parsed, such that rejected rows are
+    never materialized. Other tables are filtered after they have been parsed.
+
+    Parameters
+    ----------
+    path: str | bytes | PathLike | BinaryIO
+        A path-like to a file containing a valid LIGO_LW XML Document, or an open
+        binary file object containing the document (which is never cached).
+    table: str
+        The name of the LIGO_LW Table to read from the document.
+    columns: list[str] | None = None
+        A optional list of column names to filter and read in from the table.
+    ilwdchar_compat: bool
+        Whether to add ilwdchar conversion compatibility.
+    verbose: bool
+        Whether to enable verbose output for ligo.lw.utils.load_filename.
+    cache: LIGOLWTableCache | None = None
+        An optional on-disk cache to read the table from (memory-mapped) if present,
+        or to write the table to after it has been parsed.
+    where: list[tuple[str, str, Any]] | None = None
+        An optional list of (column, operator, value) predicates that every returned
+        row must satisfy, e.g. [("far", "<", 1e-7), ("is_background", "==", 0)].
+        Supported operators are "==", "!=", "<", "<=", ">", ">=", "in" and "not in".
+    xmldoc_cache: LIGOLWDocumentCache | None = None
+        An optional in-memory cache of parsed documents, such that the full document
+        is parsed once and shared with any other loader called with the same cache.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        A dictionary of column names and their respective column value arrays.
+    """
+    where = [tuple(predicate) for predicate in where] if where else None
+    if hasattr(path, "read"):
+        # file objects cannot be keyed by their path and mtime
+        cache = xmldoc_cache = None
+    if cache is not None:
+        with timed_stage("table_cache_read") as stage:
+            data = cache.get(path, table, columns, ilwdchar_compat, where)
+            stage.add(hits=int(data is not None), misses=int(data is None))
+        if data is not None:
+            return data
+
+    # predicate columns must be loaded to be evaluated, even if they are not returned
+    load_columns = columns
+    if columns is not None and where is not None:
+        load_columns = list(columns)
+        load_columns += [
+            name for name, _, _ in where if name not in load_columns
+        ]
+
+    if xmldoc_cache is not None:
+        # copy the columns so that cached documents cannot be modified through them
+        xmldoc = xmldoc_cache.load(path, ilwdchar_compat, verbose)
+        data = get_ligolw_table_columns_from_xmldoc(xmldoc, table, load_columns)
+        data = {name: values.copy() for name, values in data.items()}
+    else:
+        xmldoc = load_ligolw_xmldoc(
+            path,
+            ilwdchar_compat,
+            verbose,
+            tables=[table],
+            arrays=[],
+            columns=load_columns,
+            columnar=True,
+            where=where,
+        )
+        data = get_ligolw_table_columns_from_xmldoc(xmldoc, table, load_columns)
+        xmldoc.unlink()
+
+    # filter any tables that could not be filtered while parsing (this is a no-op for
+    # tables that were), and drop any predicate columns that were not requested
+    if where is not None:
+        with timed_stage("filter") as stage:
+            mask = get_where_mask(data, where)
+            if not mask.all():
+                data = {name: values[mask] for name, values in data.items()}
+            if columns is not None:
+                data = {name: data[name] for name in columns}
+            if stage:
+                stage.add(rows=len(mask), selected=int(mask.sum()))
+
+    if cache is not None:
+        with timed_stage("table_cache_write"):
+            cache.put(path, table, data, columns, ilwdchar_compat, where)
+    return data
+
+
+def _concatenate_table_columns(
+    tables: List[Dict[str, np.ndarray]], table: str
+) -> Dict[str, np.ndarray]:
+    # concatenate the columns of each table in the order they were loaded, where the
+    # output has the union of every table's columns (in the order they are first seen)
+    # and columns that are missing from a table are filled with null values
+    if not tables:
+        raise ValueError("No LIGO_LW XML Document paths were provided.")
+
+    names = list(dict.fromkeys(name for arrays in tables for name in arrays))
+    data = {}
+    for name in names:
+        columns = [arrays.get(name) for arrays in tables]
+        if any(values is None for values in columns):
+            logger.debug("Column %s not present in every %s table.", name, table)
+            dtype = np.result_type(*(values for values in columns if values is not None))
+            columns = [
+                _get_null_column(len(next(iter(arrays.values()), ())), dtype)
+                if values is None else values
+                for arrays, values in zip(tables, columns)
+            ]
+        data[name] = np.concatenate(columns)
+    return data
+
+
+def _get_null_column(length: int, dtype: np.dtype) -> np.ndarray:
+    # a column of null values, i.e. NaN for floating point dtypes and otherwise None
+    if dtype.kind in "fc":
+        return np.full(length, np.nan, dtype=dtype)
+    return np.full(length, None, dtype=object)
+
+
+def _get_n_jobs(n_jobs: Optional[int]) -> int:
+    # resolve the number of worker processes, where negative values count backwards
+    # from the number of available CPUs (i.e. -1 uses all CPUs)
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be a non-zero integer.")
+    return n_jobs
+
+
+def _imap_paths(
+    func: Callable,
+    paths: List[Union[str, bytes, PathLike]],
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Iterator:
+    # apply func to each path, in parallel if requested, yielding results in path order
+    # as they arrive such that each can be consumed (and released) before the next
+    n_jobs = _get_n_jobs(n_jobs)
+    if executor is not None or (n_jobs > 1 and len(paths) > 1):
+        # send files to workers in batches to reduce inter-process overhead
+        chunksize = max(1, len(paths) // (4 * n_jobs))
+        func, unwrap = wrap_worker(func)
+        if executor is not None:
+            yield from map(unwrap, executor.map(func, paths, chunksize=chunksize))
+            return
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            yield from map(unwrap, pool.map(func, paths, chunksize=chunksize))
+        return
+    yield from map(func, paths)
+
+
+def _map_paths(
+    func: Callable,
+    paths: List[Union[str, bytes, PathLike]],
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> list:
+    # apply func to each path, in parallel if requested, preserving the path order
+    return list(_imap_paths(func, paths, n_jobs, executor))
 
 
 def load_ligolw_tables(
@@ -189,14 +730,31 @@ def load_ligolw_tables(
     ilwdchar_compat: bool=True,
     verbose: bool=False,
     df: bool=True,
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    cache: Optional[LIGOLWTableCache] = None,
+    where: Optional[List[Tuple[str, str, Any]]] = None,
+    compact: bool=False,
+    xmldoc_cache: Optional[LIGOLWDocumentCache] = None,
 ) -> Union[EventTable, pd.DataFrame]:
     """Loads one or multiple LIGO_LW XML Documents each containing PostcohInspiralTables
-    using GWPy and returns a pandas DataFrame object.
+    and returns a pandas DataFrame object.
+
+    Each document is parsed once and its table is converted directly into typed NumPy
+    columns in memory - no intermediate files are written to disk. Multiple documents
+    can be parsed in parallel across worker processes with n_jobs (or a user provided
+    concurrent.futures.Executor), where each worker returns only the columnar arrays.
+    The rows of the output are always ordered in the same order as the input paths.
+    If the tables of each document have different columns (e.g. only some documents
+    have *_K1 columns), the output has the union of their columns, where the missing
+    values of floating point columns are NaN and those of any other column are None.
 
     Parameters
     ----------
     paths: str | bytes | PathLike | Iterable[str | bytes | PathLike]
         A path or list of paths to LIGO_LW XML Document(s) each with a postcoh table.
+    table: str
+        The name of the LIGO_LW Table to read from each document.
     columns: list[str] | None = None
         A optional list of column names to filter and read in from each postcoh table.
     ilwdchar_compat: bool
@@ -204,80 +762,942 @@ def load_ligolw_tables(
     verbose: bool
         Whether to enable verbose output for ligo.lw.utils.load_filename.
     df: bool
-        If True returns a pd.DataFrame, else returns the original gwpy.table.EventTable.
+        If True returns a pd.DataFrame, else returns a gwpy.table.EventTable.
+    n_jobs: int | None = None
+        The number of worker processes used to parse documents in parallel. If None or
+        1, documents are parsed serially, and if -1, all available CPUs are used.
+    executor: concurrent.futures.Executor | None = None
+        An optional existing executor to parse documents with, which overrides n_jobs.
+    cache: LIGOLWTableCache | None = None
+        An optional on-disk columnar cache, such that each document is only parsed the
+        first time it is loaded (until it is modified), and memory-mapped thereafter.
+    where: list[tuple[str, str, Any]] | None = None
+        An optional list of (column, operator, value) predicates that every returned
+        row must satisfy, e.g. [("far", "<", 1e-7), ("is_background", "==", 0)].
+        Predicates are evaluated while postcoh tables are parsed, such that rows that
+        are rejected are never materialized (see load_ligolw_table_columns).
+    compact: bool
+        Whether to return a memory compact pd.DataFrame with native column widths,
+        categorical string columns, and fused int64 nanosecond time columns (e.g. the
+        end_time_ns column holds end_time * 1e9 + end_time_ns), see
+        get_compact_table_columns. Requires df=True.
+    xmldoc_cache: LIGOLWDocumentCache | None = None
+        An optional in-memory cache of parsed documents shared with other loaders (see
+        load_ligolw_table_columns). It is only used when documents are parsed serially.
+
+    Returns
+    -------
+    pd.DataFrame | gwpy.table.EventTable
+
+    Examples
+    --------
+        >> df = load_ligolw_tables(zerolags, "postcoh", where=[("far", "<", 1e-7)])
+    """
+    if compact and not df:
+        raise ValueError("compact output is only supported when df=True.")
+    if isinstance(paths, (str, bytes, PathLike)):
+        paths = [paths]
+    paths = list(paths)
+    if executor is not None or _get_n_jobs(n_jobs) > 1:
+        xmldoc_cache = None  # documents parsed in worker processes cannot be shared
+
+    load_table_columns = partial(
+        load_ligolw_table_columns,
+        table=table,
+        columns=columns,
+        ilwdchar_compat=ilwdchar_compat,
+        verbose=verbose,
+        cache=cache,
+        where=where,
+        xmldoc_cache=xmldoc_cache,
+    )
+
+    # extract typed column arrays from each document in memory
+    tables = _map_paths(load_table_columns, paths, n_jobs, executor)
+
+    with timed_stage("concatenate") as stage:
+        data = _concatenate_table_columns(tables, table)
+        stage.add(files=len(tables))
+    if compact:
+        with timed_stage("compact"):
+            data = get_compact_table_columns(data, table)
+    names = list(data.keys())
+
+    if df:
+        import pandas as pd
+
+        with timed_stage("dataframe"):
+            return pd.DataFrame(data, columns=names)
+
+    from gwpy.table import EventTable
+
+    with timed_stage("eventtable"):
+        return EventTable(data, names=names)
+
+
+def _iter_prefetched(
+    func: Callable,
+    paths: Iterable[Union[str, bytes, PathLike]],
+    prefetch: int = 1,
+    executor: Optional[Executor] = None,
+) -> Iterator:
+    # apply func to each path in order, while the next paths are loaded in the background
+    if prefetch <= 0:
+        yield from map(func, paths)
+        return
+
+    pool = executor or ProcessPoolExecutor(max_workers=1)
+    func, unwrap = wrap_worker(func)
+    futures = deque()
+    try:
+        paths = iter(paths)
+        for path in islice(paths, prefetch):
+            futures.append(pool.submit(func, path))
+        while futures:
+            future = futures.popleft()
+            for path in islice(paths, 1):
+                futures.append(pool.submit(func, path))
+            yield unwrap(future.result())
+    finally:
+        for future in futures:
+            future.cancel()
+        if executor is None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _to_structured_array(data: Dict[str, np.ndarray]) -> np.ndarray:
+    # pack a dictionary of equal length column arrays into a structured array
+    length = len(next(iter(data.values()), ()))
+    array = np.empty(length, dtype=[(name, values.dtype) for name, values in data.items()])
+    for name, values in data.items():
+        array[name] = values
+    return array
+
+
+def iter_ligolw_tables(
+    paths: Union[str, bytes, PathLike, Iterable[Union[str, bytes, PathLike]]],
+    table: str,
+    columns: Optional[List[str]] = None,
+    chunk_rows: int = 100_000,
+    ilwdchar_compat: bool=True,
+    verbose: bool=False,
+    df: bool=True,
+    compact: bool=False,
+    where: Optional[List[Tuple[str, str, Any]]] = None,
+    cache: Optional[LIGOLWTableCache] = None,
+    prefetch: int = 1,
+    executor: Optional[Executor] = None,
+) -> Iterator[Union[pd.DataFrame, np.ndarray]]:
+    """Iterates over a LIGO_LW Table from one or multiple LIGO_LW XML Documents in
+    chunks of a bounded number of rows, such that an arbitrarily large number of
+    documents can be processed in constant memory.
+
+    Rows are yielded in the same order as the input paths, where each chunk may span
+    multiple documents (and each document may span multiple chunks). While a chunk is
+    being consumed, the next prefetch documents are read ahead in a background worker
+    process (or a user provided concurrent.futures.Executor). The memory used at any
+    time is therefore bounded by the chunk_rows and the size of prefetch + 1 documents.
+
+    Parameters
+    ----------
+    paths: str | bytes | PathLike | Iterable[str | bytes | PathLike]
+        A path or (possibly lazy) iterable of paths to LIGO_LW XML Document(s).
+    table: str
+        The name of the LIGO_LW Table to read from each document.
+    columns: list[str] | None = None
+        A optional list of column names to filter and read in from each table.
+    chunk_rows: int
+        The number of rows in each chunk, except for the last chunk, which may be smaller.
+    ilwdchar_compat: bool
+        Whether to add ilwdchar conversion compatibility.
+    verbose: bool
+        Whether to enable verbose output for ligo.lw.utils.load_filename.
+    df: bool
+        If True yields pd.DataFrame chunks, else yields NumPy structured array chunks.
+    compact: bool
+        Whether to yield memory compact pd.DataFrame chunks, see
+        get_compact_table_columns. Requires df=True.
+    where: list[tuple[str, str, Any]] | None = None
+        An optional list of (column, operator, value) predicates that every returned
+        row must satisfy (see load_ligolw_table_columns).
+    cache: LIGOLWTableCache | None = None
+        An optional on-disk columnar cache to read (or write) each document's table.
+    prefetch: int
+        The number of documents to read ahead in the background. If 0, documents are
+        read in the calling thread when they are needed.
+    executor: concurrent.futures.Executor | None = None
+        An optional existing executor to read documents ahead with.
+
+    Returns
+    -------
+    Iterator[pd.DataFrame | np.ndarray]
+
+    Examples
+    --------
+        >> counts = np.zeros(len(bins) - 1)
+        >> for chunk in iter_ligolw_tables(zerolags, "postcoh", columns=["far"]):
+        ..     counts += np.histogram(chunk["far"], bins=bins)[0]
+    """
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be a positive integer.")
+    if compact and not df:
+        raise ValueError("compact output is only supported when df=True.")
+    if isinstance(paths, (str, bytes, PathLike)):
+        paths = [paths]
+
+    def to_output(data: Dict[str, np.ndarray]):
+        if not df:
+            return _to_structured_array(data)
+
+        import pandas as pd
+
+        if compact:
+            data = get_compact_table_columns(data, table)
+        with timed_stage("dataframe"):
+            return pd.DataFrame(data, columns=list(data.keys()))
+
+    load_table_columns = partial(
+        load_ligolw_table_columns,
+        table=table,
+        columns=columns,
+        ilwdchar_compat=ilwdchar_compat,
+        verbose=verbose,
+        cache=cache,
+        where=where,
+    )
+
+    buffer = []
+    buffered = 0
+    for data in _iter_prefetched(load_table_columns, paths, prefetch, executor):
+        buffer.append(data)
+        buffered += len(next(iter(data.values()), ()))
+        if buffered < chunk_rows:
+            continue
+
+        # yield every full chunk and keep the remaining rows for the next chunk
+        data = _concatenate_table_columns(buffer, table)
+        start = 0
+        while buffered - start >= chunk_rows:
+            yield to_output({k: v[start:start + chunk_rows] for k, v in data.items()})
+            start += chunk_rows
+        buffer = [{k: v[start:] for k, v in data.items()}]
+        buffered -= start
+
+    if buffered > 0:
+        yield to_output(_concatenate_table_columns(buffer, table))
+
+
+def _read_file(path: Union[str, bytes, PathLike]) -> bytes:
+    with timed_stage("read_file") as stage:
+        with open(path, "rb") as f:
+            content = f.read()
+        stage.add(files=1, bytes=len(content))
+    return content
+
+
+async def aload_ligolw_tables(
+    paths: Union[str, bytes, PathLike, Iterable[Union[str, bytes, PathLike]]],
+    table: str,
+    columns: Optional[List[str]] = None,
+    ilwdchar_compat: bool=True,
+    df: bool=True,
+    compact: bool=False,
+    where: Optional[List[Tuple[str, str, Any]]] = None,
+    max_concurrency: int = 16,
+    ordered: bool = False,
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[Tuple[Union[str, bytes, PathLike], Union[pd.DataFrame, np.ndarray]]]:
+    """Asynchronously loads a LIGO_LW Table from one or multiple LIGO_LW XML Documents,
+    overlapping file reads on slow (e.g. network) filesystems with document parsing.
+
+    Each file is read in full in a background thread, and then parsed in an executor
+    (see load_ligolw_table_columns), such that the event loop is never blocked. The
+    table of each file is yielded with its path as soon as it completes, or in the
+    order of the input paths if ordered is True. Paths are consumed lazily, and at most
+    max_concurrency files are being read, parsed, or held for ordered output at any one
+    time, such that memory is bounded for arbitrarily many paths.
+
+    By default, documents are parsed in the default (thread pool) executor of the
+    running event loop, where parsing holds the GIL, so only file reads overlap with
+    parsing. Pass a ProcessPoolExecutor to also parse documents in parallel.
+
+    Parameters
+    ----------
+    paths: str | bytes | PathLike | Iterable[str | bytes | PathLike]
+        A path or (possibly lazy) iterable of paths to LIGO_LW XML Document(s).
+    table: str
+        The name of the LIGO_LW Table to read from each document.
+    columns: list[str] | None = None
+        A optional list of column names to filter and read in from each table.
+    ilwdchar_compat: bool
+        Whether to add ilwdchar conversion compatibility.
+    df: bool
+        If True yields pd.DataFrame tables, else yields NumPy structured arrays.
+    compact: bool
+        Whether to yield memory compact pd.DataFrame tables, see
+        get_compact_table_columns. Requires df=True.
+    where: list[tuple[str, str, Any]] | None = None
+        An optional list of (column, operator, value) predicates that every returned
+        row must satisfy (see load_ligolw_table_columns).
+    max_concurrency: int
+        The maximum number of files that are read, parsed, or buffered (awaiting
+        ordered output) at any one time.
+    ordered: bool
+        Whether to yield tables in the order of the input paths, rather than as each
+        file completes.
+    executor: concurrent.futures.Executor | None = None
+        An optional executor to parse documents with (e.g. a ProcessPoolExecutor). If
+        None, the default (thread pool) executor of the running event loop is used.
+
+    Returns
+    -------
+    AsyncIterator[tuple[str | bytes | PathLike, pd.DataFrame | np.ndarray]]
+        An asynchronous iterator of each path and its respective table.
+
+    Examples
+    --------
+        >> async def count_triggers(paths):
+        ..     async for path, df in aload_ligolw_tables(paths, "postcoh", ordered=True):
+        ..         print(path, len(df))
+        >> asyncio.run(count_triggers(paths))
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be a positive integer.")
+    if compact and not df:
+        raise ValueError("compact output is only supported when df=True.")
+    if isinstance(paths, (str, bytes, PathLike)):
+        paths = [paths]
+    paths = iter(paths)
+
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+
+    # executors do not inherit the calling context, so any LoadStats must be threaded
+    read_file, unwrap_read = wrap_worker(_read_file)
+    load_table_columns, unwrap_load = wrap_worker(load_ligolw_table_columns)
+
+    async def load(path):
+        content = unwrap_read(await loop.run_in_executor(None, read_file, path))
+        data = unwrap_load(await loop.run_in_executor(
+            executor,
+            partial(
+                load_table_columns,
+                io.BytesIO(content),
+                table,
+                columns=columns,
+                ilwdchar_compat=ilwdchar_compat,
+                where=where,
+            ),
+        ))
+        if not df:
+            return path, _to_structured_array(data)
+
+        import pandas as pd
+
+        if compact:
+            data = get_compact_table_columns(data, table)
+        return path, pd.DataFrame(data, columns=list(data.keys()))
+
+    # keep a bounded window of in-flight (or completed but not yet yielded) tasks, and
+    # start loading the next path as each completed task is yielded
+    pending = deque(
+        asyncio.ensure_future(load(path)) for path in islice(paths, max_concurrency)
+    )
+    try:
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+                await asyncio.wait(done)
+            else:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                pending = deque(task for task in pending if task not in done)
+            for task in done:
+                pending.extend(
+                    asyncio.ensure_future(load(path)) for path in islice(paths, 1)
+                )
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+# the string columns of known tables that hold a small set of interferometer names
+_CATEGORICAL_COLUMNS = {"ifo", "ifos", "pivotal_ifo", "instruments"}
+
+# the string column types (i.e. excluding ilwd:char IDs) converted to pd.Categorical
+_CATEGORICAL_TYPES = ligo.lw.types.StringTypes - {"ilwd:char"}
+
+# a nanosecond column and the name of its seconds column without "_ns"
+_NANOSECONDS_COLUMN = re.compile(r"^(?P<prefix>.*)_ns(?P<suffix>_.*)?$")
+
+
+def get_compact_table_columns(
+    data: Dict[str, np.ndarray],
+    table: str,
+) -> Dict[str, Union[np.ndarray, pd.Categorical]]:
+    """Converts the columns of a LIGO_LW Table into a memory compact representation,
+    suitable for holding large numbers of triggers in memory as a pd.DataFrame.
+
+    Numeric columns are cast to the native widths of their Table's validcolumns (e.g.
+    real_4 to float32, int_4s to int32), string columns (i.e. lstring columns such as
+    ifos, pivotal_ifo and skymap_fname, or ifo and instruments columns of unknown
+    tables) are converted to pd.Categorical such that each distinct string is stored
+    once, and each pair of second and nanosecond columns named <prefix>_ns[_<suffix>]
+    and <prefix>[_<suffix>] (e.g. end_time and end_time_ns, or end_time_sngl_H1 and
+    end_time_ns_sngl_H1) is fused into a single int64 nanosecond column that takes the
+    name of the nanosecond column (i.e. end_time_ns = end_time * 1e9 + end_time_ns),
+    as a vectorized equivalent of the PostcohInspiral.end property.
+
+    Parameters
+    ----------
+    data: dict[str, np.ndarray]
+        A dictionary of column names and their respective column value arrays.
+    table: str
+        The name of the LIGO_LW Table the columns belong to (e.g. "postcoh").
 
     Returns
     -------
-    pd.DataFrame
+    dict[str, np.ndarray | pd.Categorical]
+        A dictionary of the compacted columns, in their original order.
     """
-    if isinstance(paths, Iterable):
-        # load a list of xmldoc file paths into temp files
-        files = []
-        for path in paths:
-            file = NamedTemporaryFile(mode="w")
-            xmldoc = load_ligolw_xmldoc(path, ilwdchar_compat, verbose)
-            if ilwdchar_compat:
-                xmldoc = strip_ilwdchar(xmldoc)
-            xmldoc.write(file)
-            file.seek(0)
-            files.append(file)
-        
-        # construct keyword arguments for EventTable.read
-        kwargs = dict(
-            format="ligolw",
-            tablename=table,
-            verbose=verbose
+    import pandas as pd
+
+    table_class = ligo.lw.lsctables.TableByName.get(ligo.lw.table.Table.TableName(table))
+    validcolumns = table_class.validcolumns if table_class is not None else {}
+
+    # find the pairs of columns holding seconds and nanoseconds (e.g. end_time_ns)
+    fused = {}
+    for name in data:
+        match = _NANOSECONDS_COLUMN.match(name)
+        if match is None:
+            continue
+        seconds = match["prefix"] + (match["suffix"] or "")
+        # columns with null values (i.e. object arrays) cannot be fused
+        if seconds in data and object not in (data[seconds].dtype, data[name].dtype):
+            fused[seconds] = name
+
+    compact = {}
+    for name, values in data.items():
+        if name in fused:
+            continue  # fused into the nanosecond column
+        if name in fused.values():
+            seconds = next(key for key, value in fused.items() if value == name)
+            compact[name] = (
+                np.asarray(data[seconds], dtype=np.int64) * 1_000_000_000
+                + np.asarray(values, dtype=np.int64)
+            )
+        elif (
+            validcolumns.get(name) in _CATEGORICAL_TYPES
+            or (name not in validcolumns and name in _CATEGORICAL_COLUMNS)
+        ):
+            compact[name] = pd.Categorical(values)
+        else:
+            dtype = ligo.lw.types.ToNumPyType.get(validcolumns.get(name))
+            if dtype is not None and np.asarray(values).dtype != object:
+                values = np.asarray(values).astype(dtype, copy=False)
+            compact[name] = values
+    return compact
+
+
+# the ID columns used to join the tables of coinc documents
+_JOIN_KEYS = {
+    "coinc_inspiral": ["coinc_event_id"],
+    "coinc_event": ["coinc_event_id"],
+    "coinc_event_map": ["coinc_event_id", "event_id", "table_name"],
+    "sngl_inspiral": ["event_id"],
+}
+
+
+def load_ligolw_multi_table_columns(
+    path: Union[str, bytes, PathLike],
+    tables: Iterable[str],
+    columns: Optional[Dict[str, List[str]]] = None,
+    ilwdchar_compat: bool=True,
+    verbose: bool=False,
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """Loads multiple LIGO_LW Tables from a LIGO_LW XML Document in a single parse and
+    returns the columns of each table as a dictionary of typed NumPy arrays.
+
+    Only the requested tables (and columns) are parsed from the document, as in
+    load_ligolw_table_columns, such that the cost is one parse per document rather
+    than one parse per table.
+
+    Parameters
+    ----------
+    path: str | bytes | PathLike
+        A path-like to a file containing a valid LIGO_LW XML Document.
+    tables: Iterable[str]
+        The names of the LIGO_LW Tables to read from the document.
+    columns: dict[str, list[str]] | None = None
+        An optional dictionary of column names to read in from each table by name.
+        Tables that are not in the dictionary are read with all of their columns.
+    ilwdchar_compat: bool
+        Whether to add ilwdchar conversion compatibility.
+    verbose: bool
+        Whether to enable verbose output for ligo.lw.utils.load_filename.
+
+    Returns
+    -------
+    dict[str, dict[str, np.ndarray]]
+        A dictionary of each table name and its dictionary of column value arrays.
+    """
+    tables = list(tables)
+    columns = columns or {}
+    xmldoc = load_ligolw_xmldoc(
+        path,
+        ilwdchar_compat,
+        verbose,
+        tables=tables,
+        arrays=[],
+        columns=columns,
+        columnar=True,
+    )
+    data = {
+        table: get_ligolw_table_columns_from_xmldoc(xmldoc, table, columns.get(table))
+        for table in tables
+    }
+    xmldoc.unlink()
+    return data
+
+
+def _join_coinc_tables(frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    # prefix every column that is not a join key with its table name
+    frames = {
+        table: df.rename(
+            columns={
+                name: f"{table}:{name}" for name in df.columns
+                if name != "file_index" and name not in _JOIN_KEYS.get(table, [])
+            }
         )
+        for table, df in frames.items()
+    }
+
+    # join the coinc level tables on their coinc_event_id
+    joined = None
+    for table in ("coinc_inspiral", "coinc_event"):
+        if table in frames:
+            df = frames.pop(table)
+            joined = df if joined is None else joined.merge(
+                df, how="left", on=["file_index", "coinc_event_id"]
+            )
 
-        if columns is not None:
-            # NOTE: if columns is None, read fails
-            kwargs["columns"] = columns
+    # join the single detector triggers of each coinc via the coinc_event_map
+    if "coinc_event_map" in frames:
+        df = frames.pop("coinc_event_map")
+        if "sngl_inspiral" in frames:
+            df = df[df["table_name"] == "sngl_inspiral"].merge(
+                frames.pop("sngl_inspiral"), how="left", on=["file_index", "event_id"]
+            )
+        joined = df if joined is None else joined.merge(
+            df, how="left", on=["file_index", "coinc_event_id"]
+        )
+
+    # join any remaining tables (e.g. postcoh) on the document they were read from
+    for df in frames.values():
+        joined = df if joined is None else joined.merge(df, how="left", on="file_index")
+    return joined
 
-        # load each temp file into dataframe via gwpy
-        event_table = EventTable.read(files, **kwargs)
 
-        for file in files:
-            file.close()
+def load_ligolw_multi_tables(
+    paths: Union[str, bytes, PathLike, Iterable[Union[str, bytes, PathLike]]],
+    tables: Iterable[str],
+    columns: Optional[Dict[str, List[str]]] = None,
+    ilwdchar_compat: bool=True,
+    verbose: bool=False,
+    join: bool=False,
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Union[Dict[str, pd.DataFrame], pd.DataFrame]:
+    """Loads multiple LIGO_LW Tables from one or multiple LIGO_LW XML Documents with a
+    single parse per document, and returns a pandas DataFrame for each table, or all
+    tables joined into a single DataFrame.
+
+    As row IDs are only unique within each document, every table is given a file_index
+    column with the index of the path each row was read from. If join is True, the
+    tables are joined with vectorized hash joins on (file_index, coinc_event_id) for
+    coinc_inspiral and coinc_event, and on (file_index, event_id) for sngl_inspiral
+    via the coinc_event_map, while all other tables (e.g. postcoh) are joined on the
+    file_index alone. The non-key columns of a joined DataFrame are prefixed with their
+    table name (e.g. "postcoh:cohsnr" and "sngl_inspiral:snr").
 
+    Parameters
+    ----------
+    paths: str | bytes | PathLike | Iterable[str | bytes | PathLike]
+        A path or list of paths to LIGO_LW XML Document(s).
+    tables: Iterable[str]
+        The names of the LIGO_LW Tables to read from each document.
+    columns: dict[str, list[str]] | None = None
+        An optional dictionary of column names to read in from each table by name.
+        Tables that are not in the dictionary are read with all of their columns, and
+        any ID columns required to join tables are always read if join is True.
+    ilwdchar_compat: bool
+        Whether to add ilwdchar conversion compatibility.
+    verbose: bool
+        Whether to enable verbose output for ligo.lw.utils.load_filename.
+    join: bool
+        Whether to join every table into a single pd.DataFrame.
+    n_jobs: int | None = None
+        The number of worker processes used to parse documents in parallel. If None or
+        1, documents are parsed serially, and if -1, all available CPUs are used.
+    executor: concurrent.futures.Executor | None = None
+        An optional existing executor to parse documents with, which overrides n_jobs.
+
+    Returns
+    -------
+    dict[str, pd.DataFrame] | pd.DataFrame
+        A dictionary of a pd.DataFrame for each table by name, or a single joined
+        pd.DataFrame if join is True.
+
+    Examples
+    --------
+        >> tables = ["postcoh", "coinc_inspiral", "coinc_event_map", "sngl_inspiral"]
+        >> df = load_ligolw_multi_tables(coincs, tables, join=True)
+    """
+    import pandas as pd
+
+    if isinstance(paths, (str, bytes, PathLike)):
+        paths = [paths]
+    paths = list(paths)
+    tables = list(tables)
+
+    # always read the ID columns required to join tables
+    columns = dict(columns or {})
+    if join:
+        for table, names in columns.items():
+            keys = _JOIN_KEYS.get(table, [])
+            columns[table] = list(names) + [key for key in keys if key not in names]
+
+    load_table_columns = partial(
+        load_ligolw_multi_table_columns,
+        tables=tables,
+        columns=columns,
+        ilwdchar_compat=ilwdchar_compat,
+        verbose=verbose,
+    )
+    results = _map_paths(load_table_columns, paths, n_jobs, executor)
+
+    frames = {}
+    for table in tables:
+        data = _concatenate_table_columns([result[table] for result in results], table)
+        lengths = [len(next(iter(result[table].values()), ())) for result in results]
+        file_index = np.repeat(np.arange(len(paths), dtype=np.int32), lengths)
+        with timed_stage("dataframe"):
+            frames[table] = pd.DataFrame({"file_index": file_index, **data})
+
+    if join:
+        with timed_stage("join"):
+            return _join_coinc_tables(frames)
+    return frames
+
+
+# the tables that own each ID column, used to write legacy ilwd:char IDs
+_ILWDCHAR_TABLES = {
+    "process_id": "process",
+    "coinc_event_id": "coinc_event",
+    "coinc_def_id": "coinc_definer",
+    "time_slide_id": "time_slide",
+    "segment_def_id": "segment_definer",
+    "simulation_id": "sim_inspiral",
+}
+
+_LIGOLW_HEADER = (
+    "<?xml version='1.0' encoding='utf-8'?>\n"
+    '<!DOCTYPE LIGO_LW SYSTEM "http://ldas-sw.ligo.caltech.edu/doc/ligolwAPI/html/'
+    'ligolw_dtd.txt">\n'
+    "<LIGO_LW>\n"
+)
+
+
+def _get_table_column_arrays(
+    data: Union[pd.DataFrame, np.ndarray, Dict[str, np.ndarray]],
+    columns: Optional[List[str]] = None,
+) -> Dict[str, np.ndarray]:
+    # return the columns of a DataFrame, structured array or dictionary as arrays
+    if isinstance(data, np.ndarray):
+        names = data.dtype.names or ()
     else:
-        # load a single xmldoc
-        xmldoc = load_ligolw_xmldoc(paths, ilwdchar_compat, verbose)
-
-        with NamedTemporaryFile(mode="w") as file:
-            if ilwdchar_compat:
-                xmldoc = strip_ilwdchar(xmldoc)
-            xmldoc.write(file)
-            file.seek(0)
-
-            # construct keyword arguments for EventTable
-            kwargs = dict(
-                format="ligolw",
-                tablename=table,
-                verbose=verbose
-            )
-            if columns is not None:
-                # NOTE: if columns is None, read fails
-                kwargs["columns"] = columns
+        names = list(data.keys())
+    if columns is not None:
+        missing = [name for name in columns if name not in names]
+        if missing:
+            raise KeyError(f"Columns {missing} not present in data.")
+        names = columns
+    return {name: np.asarray(data[name]) for name in names}
+
+
+def _write_ligolw_table(
+    fileobj: io.TextIOBase,
+    data: Dict[str, np.ndarray],
+    table: str,
+    ilwdchar_compat: bool = False,
+    chunksize: int = 65536,
+):
+    # write a Table element in the LIGO_LW schema of the named table
+    try:
+        validcolumns = ligo.lw.lsctables.TableByName[table].validcolumns
+    except KeyError as exc:
+        raise ValueError(f"Unknown LIGO_LW table {table}.") from exc
+
+    # some validcolumns are keyed by the table that owns them (e.g. coinc_event:...)
+    schema = {ligo.lw.table.Column.ColumnName(key): key for key in validcolumns}
+    unknown = [name for name in data if name not in schema]
+    if unknown:
+        raise ValueError(f"Columns {unknown} are not valid {table} table columns.")
+
+    columntypes = {name: validcolumns[schema[name]] for name in data}
+    ilwdchar_prefixes = {}
+    if ilwdchar_compat:
+        for name, coltype in columntypes.items():
+            if coltype != "int_8s" or not name.endswith("_id"):
+                continue
+            if ":" in schema[name]:
+                owner = schema[name].split(":")[0]
+            elif name == "event_id" and "table_name" in data:
+                # coinc_event_map event IDs belong to the table named in each row
+                owner = data["table_name"].astype(str)
+            else:
+                owner = _ILWDCHAR_TABLES.get(name, table)
+            ilwdchar_prefixes[name] = np.char.add(owner, f":{name}:")
+            if ilwdchar_prefixes[name].ndim == 0:
+                ilwdchar_prefixes[name] = str(ilwdchar_prefixes[name])
+            columntypes[name] = "ilwd:char"
+
+    fileobj.write(f'\t<Table Name="{table}:table">\n')
+    for name, coltype in columntypes.items():
+        fileobj.write(f'\t\t<Column Name="{table}:{name}" Type="{coltype}"/>\n')
+    fileobj.write(f'\t\t<Stream Delimiter="," Name="{table}:table" Type="Local">')
+    for text in format_table_stream(
+        data, columntypes, ilwdchar_prefixes=ilwdchar_prefixes, chunksize=chunksize
+    ):
+        fileobj.write(text)
+    fileobj.write("\n\t\t</Stream>\n\t</Table>\n")
+
+
+def _get_umask() -> int:
+    # read the process umask, which can only be read by setting it
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def write_ligolw_tables(
+    path: Union[str, bytes, PathLike, BinaryIO],
+    tables: Dict[str, Union[pd.DataFrame, np.ndarray, Dict[str, np.ndarray]]],
+    ilwdchar_compat: bool=False,
+    compress: Optional[bool] = None,
+    chunksize: int = 65536,
+):
+    """Writes one or more tables to a LIGO_LW XML Document, where each table is
+    serialized in the LIGO_LW schema of its name (e.g. PostcohInspiralTable for
+    "postcoh") with vectorized column formatting, without constructing row objects.
+
+    Column values are cast to the type of their schema column (e.g. real_4 columns are
+    written as float32 values), and null values (None or NaN in non-float columns) are
+    written as null tokens. Files are written to a temporary file first and then moved
+    into place, such that partially written documents are never visible.
+
+    Parameters
+    ----------
+    path: str | bytes | PathLike | BinaryIO
+        The path to write the LIGO_LW XML Document to, or an open binary file object.
+    tables: dict[str, pd.DataFrame | np.ndarray | dict[str, np.ndarray]]
+        A dictionary of table names and their data as a pd.DataFrame, a structured
+        array or a dictionary of column arrays. Every column name must be a valid
+        column of the table's schema.
+    ilwdchar_compat: bool
+        Whether to write integer ID columns (e.g. event_id) as legacy ilwd:char strings
+        (e.g. "postcoh:event_id:1") for compatibility with older LIGO_LW readers.
+    compress: bool | None = None
+        Whether to gzip compress the document. If None, the document is compressed if
+        the path ends with ".gz".
+    chunksize: int
+        The number of rows formatted at a time.
+
+    Examples
+    --------
+        >> tables = load_ligolw_multi_tables(paths, ["postcoh", "sngl_inspiral"])
+        >> write_ligolw_tables("coinc.xml.gz", tables, ilwdchar_compat=True)
+    """
+    if hasattr(path, "write"):
+        fileobj = path
+        if compress:
+            # use the same compression level as ligo.lw.utils.write_filename
+            fileobj = gzip.GzipFile(fileobj=path, mode="wb", compresslevel=3)
+        stream = io.TextIOWrapper(fileobj, encoding="utf-8", newline="\n")
+        try:
+            with timed_stage("write") as stage:
+                stream.write(_LIGOLW_HEADER)
+                for table, data in tables.items():
+                    data = _get_table_column_arrays(data)
+                    _write_ligolw_table(
+                        stream, data, table, ilwdchar_compat, chunksize
+                    )
+                    stage.add(tables=1, rows=len(next(iter(data.values()), ())))
+                stream.write("</LIGO_LW>\n")
+                stage.add(files=1)
+        finally:
+            stream.flush()
+            stream.detach()
+            if fileobj is not path:
+                fileobj.close()
+        return
+
+    path = os.fsdecode(path)
+    if compress is None:
+        compress = path.endswith(".gz")
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=f".{name}.", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write_ligolw_tables(f, tables, ilwdchar_compat, compress, chunksize)
+        os.chmod(tmp, 0o666 & ~_get_umask())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def write_ligolw_table(
+    path: Union[str, bytes, PathLike, BinaryIO],
+    data: Union[pd.DataFrame, np.ndarray, Dict[str, np.ndarray]],
+    table: str = "postcoh",
+    columns: Optional[List[str]] = None,
+    ilwdchar_compat: bool=False,
+    compress: Optional[bool] = None,
+    chunksize: int = 65536,
+):
+    """Writes a table to a LIGO_LW XML Document in the LIGO_LW schema of its name
+    (e.g. PostcohInspiralTable for "postcoh"), such that filtered or re-ranked triggers
+    can be written back out and read again with load_ligolw_xmldoc.
+
+    See write_ligolw_tables for details.
+
+    Parameters
+    ----------
+    path: str | bytes | PathLike | BinaryIO
+        The path to write the LIGO_LW XML Document to, or an open binary file object.
+    data: pd.DataFrame | np.ndarray | dict[str, np.ndarray]
+        The table as a pd.DataFrame, a structured array or a dictionary of column
+        arrays. Every column name must be a valid column of the table's schema.
+    table: str
+        The name of the LIGO_LW Table to write.
+    columns: list[str] | None = None
+        A optional list of column names to write from the data, in order.
+    ilwdchar_compat: bool
+        Whether to write integer ID columns (e.g. event_id) as legacy ilwd:char strings.
+    compress: bool | None = None
+        Whether to gzip compress the document. If None, the document is compressed if
+        the path ends with ".gz".
+    chunksize: int
+        The number of rows formatted at a time.
+
+    Examples
+    --------
+        >> df = load_ligolw_tables(zerolags, "postcoh")
+        >> write_ligolw_table("zerolag.xml.gz", df[df.far < 1e-7], "postcoh")
+    """
+    data = _get_table_column_arrays(data, columns)
+    write_ligolw_tables(path, {table: data}, ilwdchar_compat, compress, chunksize)
+
+
+def get_ligolw_frequency_series_from_xmldoc(
+    xmldoc: ligo.lw.ligolw.Element,
+    name: Optional[str] = None,
+    epoch: Optional[Union[float, str]] = None,
+    **params,
+) -> pd.Series:
+    """Gets the real-valued frequency series of the single LIGO_LW Array in a
+    ligo.lw.ligolw.Document object that matches the given name, epoch and params.
+
+    Arrays are matched in the same way as gwpy.frequencyseries.FrequencySeries.read,
+    where each keyword argument in params must equal the value of the Param of the same
+    name in the Array's parent LIGO_LW element (e.g. instrument="H1").
+
+    Parameters
+    ----------
+    xmldoc: ligo.lw.ligolw.Element
+        A LIGO_LW XML Document, or Element, containing the necessary LIGO_LW elements.
+    name: str | None = None
+        The name of the Array to match (e.g. "PSD").
+    epoch: float | str | None = None
+        The GPS time of the Time element of the Array's parent LIGO_LW element.
+
+    Returns
+    -------
+    pd.Series
+        A pd.Series array containing the value and index of each frequency component.
+    """
+    import pandas as pd
+
+    if epoch is not None:
+        from gwpy.time import to_gps
+
+        epoch = to_gps(epoch)
+
+    def is_match(array: ligolw.Array) -> bool:
+        parent = array.parentNode
+        if name is not None and getattr(array, "Name", None) != name:
+            return False
+        if epoch is not None:
+            times = parent.getElementsByTagName(ligolw.Time.tagName)
+            if len(times) != 1 or times[0].pcdata != epoch:
+                return False
+        for key, value in params.items():
+            try:
+                if ligo.lw.param.get_param(parent, key).pcdata != value:
+                    return False
+            except ValueError:
+                return False
+        return True
+
+    matches = [
+        array for array in xmldoc.getElementsByTagName(ligolw.Array.tagName)
+        if is_match(array)
+    ]
+    if len(matches) != 1:
+        raise ValueError(
+            f"{'No' if not matches else 'Multiple'} <Array> elements found matching "
+            f"name={name!r}, epoch={epoch!r} and params={params!r}."
+        )
+    array, = matches
+
+    values = array.array[-1]
+    dim = array.getElementsByTagName(ligolw.Dim.tagName)[0]
+    index = pd.Index(
+        np.linspace(
+            start=dim.Start or 0.,
+            stop=dim.Scale * len(values),
+            num=len(values),
+            endpoint=False,
+        ),
+        name="frequency",
+    )
+    return pd.Series(values, name=array.Name, index=index)
 
-            # load each temp file into dataframe via gwpy
-            event_table = EventTable.read(file, **kwargs)
-    
-    if df:
-        return event_table.to_pandas()
-    return event_table
 
 def load_ligolw_frequency_series(
-    path: Union[str, bytes, PathLike], index: str = "frequency", *args, **kwargs
+    path: Union[str, bytes, PathLike],
+    index: str = "frequency",
+    *args,
+    xmldoc_cache: Optional[LIGOLWDocumentCache] = None,
+    **kwargs,
 ) -> pd.Series:
     """Reads a valid LIGO_LW XML Document from a file path and returns a pd.Series
     containing the real-valued frequency series associated with the specified kwargs.
 
-    Uses the gwpy.frequencyseries.FrequencySeries object to read LIGO_LW XML Documents.
+    Uses the gwpy.frequencyseries.FrequencySeries object to read LIGO_LW XML Documents,
+    unless an xmldoc_cache is given, in which case the series is read from the cached
+    document (see get_ligolw_frequency_series_from_xmldoc).
 
     Parameters
     ----------
     path: str | bytes | PathLike
         A path-like to a file containing a valid LIGO_LW XML Document.
+    xmldoc_cache: LIGOLWDocumentCache | None = None
+        An optional in-memory cache of parsed documents shared with other loaders.
 
     Returns
     -------
@@ -292,8 +1712,20 @@ def load_ligolw_frequency_series(
             for ifo in ifos
         }
     """
-
-    frequency_series = FrequencySeries.read(path, *args, **kwargs)
+    if xmldoc_cache is not None:
+        xmldoc = xmldoc_cache.load(path, ilwdchar_compat=True)
+        with timed_stage("extract_frequency_series") as stage:
+            series = get_ligolw_frequency_series_from_xmldoc(xmldoc, *args, **kwargs)
+            stage.add(arrays=1)
+        return series.copy()
+
+    import pandas as pd
+    from gwpy.frequencyseries import FrequencySeries
+
+    with timed_stage("gwpy_read") as stage:
+        frequency_series = FrequencySeries.read(path, *args, **kwargs)
+        if stage:
+            stage.add(files=1, bytes=_get_size(path), arrays=1)
     index = pd.Index(
         np.linspace(
             start=frequency_series.f0.value,
@@ -306,11 +1738,195 @@ def load_ligolw_frequency_series(
     return pd.Series(frequency_series.value, name=frequency_series.name, index=index)
 
 
+def get_ligolw_psds_from_xmldoc(
+    xmldoc: ligo.lw.ligolw.Element,
+    ifos: Optional[Iterable[str]] = None,
+    df: bool = True,
+) -> Union[pd.DataFrame, Tuple[np.ndarray, np.ndarray]]:
+    """Gets every REAL8FrequencySeries PSD in a LIGO_LW XML Document as a single 2-D
+    array of PSD values that share one frequency index.
+
+    The frequency index is computed from the f0:param and the frequency Dim (i.e. its
+    Scale and length) of each PSD:array, and all PSDs are required to share the same
+    frequency index. Empty PSDs are ignored, and any requested ifos that do not have a
+    PSD in the document are filled with NaN values.
+
+    Parameters
+    ----------
+    xmldoc: ligo.lw.ligolw.Element
+        A valid LIGO_LW XML Document, or Element, containing REAL8FrequencySeries.
+    ifos: Iterable[str] | None = None
+        The interferometers to return PSDs for (and their order). If None, all PSDs are
+        returned in the order they appear in the document.
+    df: bool
+        If True returns a pd.DataFrame, else returns a tuple of NumPy arrays.
+
+    Returns
+    -------
+    pd.DataFrame | tuple[np.ndarray, np.ndarray]
+        Either a pd.DataFrame with a frequency index and one column per ifo, or a tuple
+        of the 1-D frequency array and the 2-D (ifos x frequencies) array of PSDs.
+    """
+    frequencies = None
+    psds = {}
+    for elem in xmldoc.getElementsByTagName(ligolw.LIGO_LW.tagName):
+        if not elem.hasAttribute("Name") or elem.Name != "REAL8FrequencySeries":
+            continue
+
+        ifo = ligo.lw.param.get_param(elem, "instrument").value
+        array, = elem.getElementsByTagName(ligolw.Array.tagName)
+        values = array.array[1]
+        if len(values) == 0:
+            logger.debug("Ignoring empty PSD for %s.", ifo)
+            continue
+
+        dim = array.getElementsByTagName(ligolw.Dim.tagName)[0]
+        f0 = ligo.lw.param.get_param(elem, "f0").value
+        index = f0 + dim.Scale * np.arange(len(values))
+        if frequencies is None:
+            frequencies = index
+        elif len(index) != len(frequencies) or not np.allclose(index, frequencies):
+            raise ValueError(f"{ifo} PSD does not share the same frequency index.")
+        psds[ifo] = values
+
+    ifos = list(psds.keys()) if ifos is None else list(ifos)
+    if frequencies is None:
+        frequencies = np.empty(0, dtype=np.float64)
+    data = np.full((len(ifos), len(frequencies)), np.nan, dtype=np.float64)
+    for i, ifo in enumerate(ifos):
+        if ifo in psds:
+            data[i] = psds[ifo]
+
+    if df:
+        import pandas as pd
+
+        index = pd.Index(frequencies, name="frequency")
+        return pd.DataFrame(data.T, index=index, columns=ifos)
+    return frequencies, data
+
+
+def load_ligolw_psds(
+    path: Union[str, bytes, PathLike],
+    ifos: Optional[Iterable[str]] = None,
+    verbose: bool = False,
+    df: bool = True,
+    xmldoc_cache: Optional[LIGOLWDocumentCache] = None,
+) -> Union[pd.DataFrame, Tuple[np.ndarray, np.ndarray]]:
+    """Reads every REAL8FrequencySeries PSD from a LIGO_LW XML Document in a single pass
+    and returns them as one 2-D array (or pd.DataFrame) sharing a frequency index.
+
+    Unlike load_ligolw_frequency_series, the document is parsed only once for all
+    interferometers, all Tables and non-PSD Arrays are skipped while parsing, and each
+    PSD:array Stream is parsed in bulk with NumPy (see columnar.ColumnarArrayStream).
+
+    Parameters
+    ----------
+    path: str | bytes | PathLike
+        A path-like to a file containing a valid LIGO_LW XML Document.
+    ifos: Iterable[str] | None = None
+        The interferometers to return PSDs for (and their order). If None, all PSDs are
+        returned in the order they appear in the document.
+    verbose: bool
+        Whether to enable verbose output for ligo.lw.utils.load_filename.
+    df: bool
+        If True returns a pd.DataFrame, else returns a tuple of NumPy arrays.
+    xmldoc_cache: LIGOLWDocumentCache | None = None
+        An optional in-memory cache of parsed documents shared with other loaders.
+
+    Returns
+    -------
+    pd.DataFrame | tuple[np.ndarray, np.ndarray]
+        Either a pd.DataFrame with a frequency index and one column per ifo, or a tuple
+        of the 1-D frequency array and the 2-D (ifos x frequencies) array of PSDs.
+
+    Examples
+    --------
+        >> psds = load_ligolw_psds("coinc.xml")
+        >> psds["H1"]
+    """
+    if xmldoc_cache is not None:
+        xmldoc = xmldoc_cache.load(path, verbose=verbose)
+    else:
+        xmldoc = load_ligolw_xmldoc(
+            path, verbose=verbose, tables=[], arrays=["PSD"], columnar=True
+        )
+    with timed_stage("extract_psds"):
+        psds = get_ligolw_psds_from_xmldoc(xmldoc, ifos, df)
+    if xmldoc_cache is None:
+        xmldoc.unlink()
+    return psds
+
+
+def load_ligolw_psd_arrays(
+    paths: Union[str, bytes, PathLike, Iterable[Union[str, bytes, PathLike]]],
+    ifos: Iterable[str],
+    verbose: bool = False,
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Reads the REAL8FrequencySeries PSDs from one or multiple LIGO_LW XML Documents
+    and stacks them into a single (files x ifos x frequencies) float64 array.
+
+    Every document must share the same frequency index, and any ifos without a PSD in
+    a given document are filled with NaN values. Documents can be parsed in parallel
+    across worker processes with n_jobs (or a user provided Executor).
+
+    Parameters
+    ----------
+    paths: str | bytes | PathLike | Iterable[str | bytes | PathLike]
+        A path or list of paths to LIGO_LW XML Document(s) with PSDs.
+    ifos: Iterable[str]
+        The interferometers to read PSDs for, which sets the order of the ifo axis.
+    verbose: bool
+        Whether to enable verbose output for ligo.lw.utils.load_filename.
+    n_jobs: int | None = None
+        The number of worker processes used to parse documents in parallel. If None or
+        1, documents are parsed serially, and if -1, all available CPUs are used.
+    executor: concurrent.futures.Executor | None = None
+        An optional existing executor to parse documents with, which overrides n_jobs.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        A tuple of the 1-D frequency array and the 3-D (files x ifos x frequencies)
+        array of PSDs.
+
+    Examples
+    --------
+        >> frequencies, psds = load_ligolw_psd_arrays(paths, ifos=["H1", "L1", "V1"])
+        >> psds.shape  # (len(paths), 3, len(frequencies))
+    """
+    if isinstance(paths, (str, bytes, PathLike)):
+        paths = [paths]
+    paths = list(paths)
+    ifos = list(ifos)
+
+    load_psds = partial(load_ligolw_psds, ifos=ifos, verbose=verbose, df=False)
+    results = _map_paths(load_psds, paths, n_jobs, executor)
+
+    # use the first non-empty frequency index as the shared index of every document
+    frequencies = np.empty(0, dtype=np.float64)
+    for index, _ in results:
+        if len(index) > 0:
+            frequencies = index
+            break
+
+    psds = np.full((len(paths), len(ifos), len(frequencies)), np.nan, dtype=np.float64)
+    for i, (index, data) in enumerate(results):
+        if len(index) == 0:
+            continue
+        if len(index) != len(frequencies) or not np.allclose(index, frequencies):
+            raise ValueError(f"PSDs in {paths[i]} do not share the same frequency index.")
+        psds[i] = data
+    return frequencies, psds
+
+
 def load_all_ligolw_snr_series(
     path: Union[str, bytes, PathLike],
     add_epoch_time: bool = True,
     verbose: bool = False,
     ilwdchar_compat: bool = False,
+    xmldoc_cache: Optional[LIGOLWDocumentCache] = None,
 ) -> Dict[int, pd.Series]:
     """Reads a valid LIGO_LW XML Document from a file path and returns a dictionary
     containing the complex SNR timeseries arrays associated with each interferometer.
@@ -337,9 +1953,13 @@ def load_all_ligolw_snr_series(
     add_epoch_time: bool
         Whether to add the epoch time to each SNR series array for correct timestamps.
     ilwdchar_compat: bool
-        Whether to add ilwdchar conversion compatibility.
+        Whether to add ilwdchar conversion compatibility. If True, event_id keys are
+        integers, otherwise they are left as read from the event_id:param (e.g. the
+        ilwd:char string "sngl_inspiral:event_id:1" of legacy documents).
     verbose: bool
         Whether to enable verbose output for ligo.lw.utils.load_filename.
+    xmldoc_cache: LIGOLWDocumentCache | None = None
+        An optional in-memory cache of parsed documents shared with other loaders.
 
     Returns
     -------
@@ -348,9 +1968,15 @@ def load_all_ligolw_snr_series(
         and the values contain the respective SNR timeseries array
         (each with their own timestamped indices).
     """
-    xmldoc = load_ligolw_xmldoc(path, ilwdchar_compat, verbose)
+    if xmldoc_cache is not None:
+        xmldoc = xmldoc_cache.load(path, ilwdchar_compat, verbose)
+    else:
+        xmldoc = load_ligolw_xmldoc(path, ilwdchar_compat, verbose)
 
-    return get_all_ligolw_snr_series_from_xmldoc(xmldoc, add_epoch_time)
+    with timed_stage("extract_snr_series") as stage:
+        data = get_all_ligolw_snr_series_from_xmldoc(xmldoc, add_epoch_time)
+        stage.add(arrays=len(data))
+    return data
 
 
 def get_all_ligolw_snr_series_from_xmldoc(
@@ -389,6 +2015,8 @@ def get_all_ligolw_snr_series_from_xmldoc(
         and the values contain the respective SNR timeseries array
         (each with their own timestamped indices).
     """
+    import pandas as pd
+    import lal.series
 
     # get inspiral rows from sngl_inspiral table
     sngl_inspiral_table = ligo.lw.table.Table.get_table(xmldoc, name="sngl_inspiral")
@@ -436,3 +2064,422 @@ def get_all_ligolw_snr_series_from_xmldoc(
         )
 
     return data
+
+
+class SNRSeriesArray(NamedTuple):
+    """A batch of complex SNR time series stored as contiguous NumPy arrays.
+
+    Every series shares the same time grid relative to its own epoch, such that the
+    GPS timestamps of event i are given by epochs[i] + times. Series shorter than the
+    longest series in the batch are padded with NaN values after their first lengths[i]
+    samples.
+
+    Attributes
+    ----------
+    event_ids: np.ndarray
+        The sngl_inspiral event_id of each series, with shape (events,).
+    ifos: np.ndarray
+        The interferometer of each series, with shape (events,).
+    epochs: np.ndarray
+        The float64 GPS start time of each series, with shape (events,).
+    times: np.ndarray
+        The float64 time grid shared by every series, with shape (samples,).
+    snr: np.ndarray
+        The complex64 SNR time series, with shape (events, samples).
+    lengths: np.ndarray
+        The int64 number of samples of each series before padding, with shape (events,).
+    """
+    event_ids: np.ndarray
+    ifos: np.ndarray
+    epochs: np.ndarray
+    times: np.ndarray
+    snr: np.ndarray
+    lengths: np.ndarray
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns the SNR series as a pd.DataFrame with one row per series indexed
+        by a (event_id, ifo, epoch) pd.MultiIndex and one column per time step."""
+        import pandas as pd
+
+        index = pd.MultiIndex.from_arrays(
+            [self.event_ids, self.ifos, self.epochs], names=["event_id", "ifo", "epoch"]
+        )
+        columns = pd.Index(self.times, name="time")
+        return pd.DataFrame(self.snr, index=index, columns=columns, copy=False)
+
+
+def get_ligolw_snr_array_from_xmldoc(
+    xmldoc: ligo.lw.ligolw.Element,
+    df: bool = False,
+) -> Union[SNRSeriesArray, pd.DataFrame]:
+    """Gets all complex SNR time series in a LIGO_LW XML Document as a single contiguous
+    complex64 array that shares one time grid, with a per-series epoch offset vector.
+
+    This is a batched alternative to get_all_ligolw_snr_series_from_xmldoc, where the
+    sngl_inspiral table is indexed by event_id once rather than scanned for each
+    COMPLEX8TimeSeries, and no per-series pd.Series objects are constructed.
+
+    Parameters
+    ----------
+    xmldoc: ligo.lw.ligolw.Element
+        A LIGO_LW XML Document, or Element, containing the necessary LIGO_LW elements.
+    df: bool
+        If True returns a pd.DataFrame (see SNRSeriesArray.to_frame), else returns
+        an SNRSeriesArray.
+
+    Returns
+    -------
+    SNRSeriesArray | pd.DataFrame
+    """
+    # build an event_id -> ifo index of the sngl_inspiral table once
+    sngl_inspiral_table = ligo.lw.table.Table.get_table(xmldoc, name="sngl_inspiral")
+    ifo_by_event_id = dict(
+        zip(
+            sngl_inspiral_table.getColumnByName("event_id"),
+            sngl_inspiral_table.getColumnByName("ifo"),
+        )
+    )
+
+    elems = [
+        elem for elem in xmldoc.getElementsByTagName(ligolw.LIGO_LW.tagName)
+        if elem.hasAttribute("Name") and elem.Name == "COMPLEX8TimeSeries"
+    ]
+
+    event_ids, ifos, epochs, arrays = [], [], [], []
+    delta_t = None
+    for elem in elems:
+        event_id = ligo.lw.param.get_param(elem, "event_id").value
+        try:
+            ifos.append(ifo_by_event_id[event_id])
+        except KeyError as exc:
+            raise ValueError(f"No sngl_inspiral row matches event_id {event_id}.") from exc
+        event_ids.append(event_id)
+
+        time, = elem.getElementsByTagName(ligolw.Time.tagName)
+        epochs.append(float(time.pcdata))
+
+        array, = elem.getElementsByTagName(ligolw.Array.tagName)
+        dim = array.getElementsByTagName(ligolw.Dim.tagName)[0]
+        if delta_t is None:
+            delta_t = dim.Scale
+        elif dim.Scale != delta_t:
+            raise ValueError(f"SNR series {event_id} does not share the same time step.")
+        arrays.append(array.array)
+
+    # write each series into a single preallocated complex64 array (rows: time, re, im)
+    lengths = np.array([array.shape[1] for array in arrays], dtype=np.int64)
+    num = int(lengths.max()) if len(lengths) else 0
+    snr = np.full((len(arrays), num), np.nan, dtype=np.complex64)
+    for i, array in enumerate(arrays):
+        snr[i, :lengths[i]].real = array[1]
+        snr[i, :lengths[i]].imag = array[2]
+
+    data = SNRSeriesArray(
+        event_ids=np.array(event_ids),
+        ifos=np.array(ifos, dtype=object),
+        epochs=np.array(epochs, dtype=np.float64),
+        times=np.arange(num) * (delta_t or 0.),
+        snr=snr,
+        lengths=lengths,
+    )
+    return data.to_frame() if df else data
+
+
+def load_ligolw_snr_array(
+    path: Union[str, bytes, PathLike],
+    ilwdchar_compat: bool = True,
+    verbose: bool = False,
+    df: bool = False,
+    xmldoc_cache: Optional[LIGOLWDocumentCache] = None,
+) -> Union[SNRSeriesArray, pd.DataFrame]:
+    """Reads all complex SNR time series from a LIGO_LW XML Document as a single
+    contiguous complex64 array that shares one time grid, see
+    get_ligolw_snr_array_from_xmldoc.
+
+    Only the event_id and ifo columns of the sngl_inspiral table and the snr:array
+    Arrays are loaded from the document, where each Array is parsed in bulk.
+
+    Parameters
+    ----------
+    path: str | bytes | PathLike
+        A path-like to a file containing a valid LIGO_LW XML Document.
+    ilwdchar_compat: bool
+        Whether to add ilwdchar conversion compatibility.
+    verbose: bool
+        Whether to enable verbose output for ligo.lw.utils.load_filename.
+    df: bool
+        If True returns a pd.DataFrame (see SNRSeriesArray.to_frame), else returns
+        an SNRSeriesArray.
+    xmldoc_cache: LIGOLWDocumentCache | None = None
+        An optional in-memory cache of parsed documents shared with other loaders.
+
+    Returns
+    -------
+    SNRSeriesArray | pd.DataFrame
+
+    Examples
+    --------
+        >> snrs = load_ligolw_snr_array("H1L1V1_1187006031_3_432.xml")
+        >> snrs.snr.shape  # (events, samples)
+        >> timestamps = snrs.epochs[:, None] + snrs.times
+    """
+    if xmldoc_cache is not None:
+        xmldoc = xmldoc_cache.load(path, ilwdchar_compat, verbose)
+    else:
+        xmldoc = load_ligolw_xmldoc(
+            path,
+            ilwdchar_compat,
+            verbose,
+            tables=["sngl_inspiral"],
+            arrays=["snr"],
+            columns=["event_id", "ifo"],
+            columnar=True,
+        )
+    with timed_stage("extract_snr_array") as stage:
+        data = get_ligolw_snr_array_from_xmldoc(xmldoc, df)
+        stage.add(arrays=len(data) if df else len(data.event_ids))
+    if xmldoc_cache is None:
+        xmldoc.unlink()
+    return data
+
+
+class SNRTensor(NamedTuple):
+    """A batch of complex SNR time series from multiple LIGO_LW XML Documents stored as
+    a single (files x ifos x samples) complex64 tensor.
+
+    The series of each file are aligned onto a common time grid starting at the
+    earliest epoch of that file, such that the GPS timestamps of file i are given by
+    epochs[i] + times. Missing ifos and samples are filled with a fill value.
+
+    Attributes
+    ----------
+    epochs: np.ndarray
+        The float64 GPS start time of each file's time grid, with shape (files,).
+    times: np.ndarray
+        The float64 time grid shared by every file, with shape (samples,).
+    ifos: list[str]
+        The interferometer of each row of the ifo axis.
+    snr: np.ndarray
+        The complex64 SNR tensor, with shape (files, ifos, samples).
+    shared_memory: multiprocessing.shared_memory.SharedMemory | None = None
+        The shared memory block backing the snr tensor, if any, which should be
+        closed (and unlinked) by the caller once it is no longer required.
+    """
+    epochs: np.ndarray
+    times: np.ndarray
+    ifos: List[str]
+    snr: np.ndarray
+    shared_memory: Optional[SharedMemory] = None
+
+
+def _fill_snr_tensor_row(
+    row: np.ndarray,
+    data: SNRSeriesArray,
+    ifos: List[str],
+    fill_value: complex = np.nan,
+) -> Tuple[float, Optional[float]]:
+    # align each ifo's series by its epoch offset onto the row's (ifos x samples) grid
+    row[:] = fill_value
+    if len(data.event_ids) == 0:
+        return np.nan, None
+
+    delta_t = data.times[1] if len(data.times) > 1 else None
+    epoch = data.epochs.min()
+    offsets = np.zeros(len(data.epochs), dtype=np.int64)
+    if delta_t is not None:
+        offsets = np.rint((data.epochs - epoch) / delta_t).astype(np.int64)
+
+    for i, ifo in enumerate(ifos):
+        matches = np.flatnonzero(data.ifos == ifo)
+        if len(matches) == 0:
+            continue
+        if len(matches) > 1:
+            logger.debug("Using the first of %d SNR series for %s.", len(matches), ifo)
+        j = matches[0]
+        start = min(offsets[j], row.shape[1])
+        stop = min(offsets[j] + data.lengths[j], row.shape[1])
+        row[i, start:stop] = data.snr[j, :stop - start]
+    return epoch, delta_t
+
+
+def _get_snr_tensor_length(data: SNRSeriesArray) -> int:
+    # the number of samples spanned by all aligned series in a document
+    if len(data.event_ids) == 0:
+        return 0
+    if len(data.times) < 2:
+        return int(data.lengths.max())
+    offsets = np.rint((data.epochs - data.epochs.min()) / data.times[1])
+    return int((offsets + data.lengths).max())
+
+
+def _open_snr_tensor(
+    shape: Tuple[int, ...],
+    shared_memory: Optional[str] = None,
+    memmap: Optional[str] = None,
+) -> Tuple[np.ndarray, Optional[SharedMemory]]:
+    # attach to an existing shared memory or memory-mapped snr tensor
+    if shared_memory is not None:
+        shm = SharedMemory(name=shared_memory)
+        return np.ndarray(shape, dtype=np.complex64, buffer=shm.buf), shm
+    return np.load(memmap, mmap_mode="r+"), None
+
+
+def _load_snr_tensor_row(
+    item: Tuple[int, Union[str, bytes, PathLike]],
+    ifos: List[str],
+    shape: Tuple[int, ...],
+    fill_value: complex = np.nan,
+    ilwdchar_compat: bool = True,
+    verbose: bool = False,
+    shared_memory: Optional[str] = None,
+    memmap: Optional[str] = None,
+) -> Tuple[float, Optional[float]]:
+    # load a single document and write its aligned series directly into the tensor
+    i, path = item
+    data = load_ligolw_snr_array(path, ilwdchar_compat, verbose)
+    snr, shm = _open_snr_tensor(shape, shared_memory, memmap)
+    try:
+        return _fill_snr_tensor_row(snr[i], data, ifos, fill_value)
+    finally:
+        del snr
+        if shm is not None:
+            shm.close()
+
+
+def load_ligolw_snr_tensor(
+    paths: Union[str, bytes, PathLike, Iterable[Union[str, bytes, PathLike]]],
+    ifos: Iterable[str],
+    num_samples: Optional[int] = None,
+    fill_value: complex = np.nan,
+    ilwdchar_compat: bool = True,
+    verbose: bool = False,
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    shared_memory: bool = False,
+    memmap: Optional[Union[str, PathLike]] = None,
+) -> SNRTensor:
+    """Reads the complex SNR time series from one or multiple LIGO_LW XML Documents into
+    a single preallocated (files x ifos x samples) complex64 tensor.
+
+    The series of each document are aligned by their epochs onto a common time grid
+    (with the sample rate of the first document), padded with fill_value where they
+    do not have data, and truncated to num_samples. Documents can be parsed in
+    parallel across worker processes with n_jobs (or a user provided Executor), in
+    which case the tensor is backed by shared memory or a memory-mapped .npy file so
+    that each worker writes its rows in place rather than returning them to the parent.
+
+    Parameters
+    ----------
+    paths: str | bytes | PathLike | Iterable[str | bytes | PathLike]
+        A path or list of paths to LIGO_LW XML Document(s) with SNR time series.
+    ifos: Iterable[str]
+        The interferometers to read SNR series for, which sets the order of the ifo axis.
+    num_samples: int | None = None
+        The number of samples of the time grid. If None, the number of samples spanned
+        by the aligned series of the first document is used.
+    fill_value: complex
+        The value of any samples of the tensor without SNR data.
+    ilwdchar_compat: bool
+        Whether to add ilwdchar conversion compatibility.
+    verbose: bool
+        Whether to enable verbose output for ligo.lw.utils.load_filename.
+    n_jobs: int | None = None
+        The number of worker processes used to parse documents in parallel. If None or
+        1, documents are parsed serially, and if -1, all available CPUs are used.
+    executor: concurrent.futures.Executor | None = None
+        An optional existing executor to parse documents with, which overrides n_jobs.
+    shared_memory: bool
+        Whether to return the tensor backed by a new multiprocessing.shared_memory block
+        (see SNRTensor.shared_memory), e.g. to share it with other processes.
+    memmap: str | PathLike | None = None
+        An optional .npy file path to write the tensor to as a memory-mapped array.
+
+    Returns
+    -------
+    SNRTensor
+
+    Examples
+    --------
+        >> tensor = load_ligolw_snr_tensor(paths, ifos=["H1", "L1", "V1"], n_jobs=8)
+        >> tensor.snr.shape  # (len(paths), 3, len(tensor.times))
+    """
+    if isinstance(paths, (str, bytes, PathLike)):
+        paths = [paths]
+    paths = list(paths)
+    ifos = list(ifos)
+    if shared_memory and memmap is not None:
+        raise ValueError("Only one of shared_memory and memmap may be provided.")
+
+    # infer the time grid from the first document if it was not specified
+    first = None
+    if num_samples is None:
+        first = load_ligolw_snr_array(paths[0], ilwdchar_compat, verbose) if paths else None
+        num_samples = _get_snr_tensor_length(first) if first is not None else 0
+
+    # workers can only write into shared memory or memory-mapped tensors
+    n_jobs = _get_n_jobs(n_jobs)
+    parallel = executor is not None or (n_jobs > 1 and len(paths) > 1)
+    shape = (len(paths), len(ifos), num_samples)
+    nbytes = max(1, int(np.prod(shape)) * np.dtype(np.complex64).itemsize)
+    shm = None
+    if memmap is not None:
+        memmap = os.fspath(memmap)
+        snr = np.lib.format.open_memmap(memmap, mode="w+", dtype=np.complex64, shape=shape)
+    elif shared_memory or parallel:
+        shm = SharedMemory(create=True, size=nbytes)
+        snr = np.ndarray(shape, dtype=np.complex64, buffer=shm.buf)
+    else:
+        snr = np.empty(shape, dtype=np.complex64)
+
+    try:
+        results = []
+        if first is not None:
+            results.append(_fill_snr_tensor_row(snr[0], first, ifos, fill_value))
+        items = list(enumerate(paths))[len(results):]
+
+        if parallel:
+            if memmap is not None:
+                snr.flush()
+            load_row = partial(
+                _load_snr_tensor_row,
+                ifos=ifos,
+                shape=shape,
+                fill_value=fill_value,
+                ilwdchar_compat=ilwdchar_compat,
+                verbose=verbose,
+                shared_memory=shm.name if shm is not None else None,
+                memmap=memmap,
+            )
+            results += _map_paths(load_row, items, n_jobs, executor)
+        else:
+            for i, path in items:
+                data = load_ligolw_snr_array(path, ilwdchar_compat, verbose)
+                results.append(_fill_snr_tensor_row(snr[i], data, ifos, fill_value))
+
+        # check every document shares the time grid of the first document
+        delta_ts = [delta_t for _, delta_t in results if delta_t is not None]
+        delta_t = delta_ts[0] if delta_ts else 0.
+        if any(not np.isclose(value, delta_t) for value in delta_ts):
+            raise ValueError("SNR series do not share the same sample rate.")
+
+        if memmap is not None:
+            snr.flush()
+        elif shm is not None and not shared_memory:
+            # copy out of the temporary shared memory used by the worker processes
+            snr = snr.copy()
+            shm.close()
+            shm.unlink()
+            shm = None
+    except BaseException:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+        raise
+
+    return SNRTensor(
+        epochs=np.array([epoch for epoch, _ in results], dtype=np.float64),
+        times=np.arange(num_samples) * delta_t,
+        ifos=ifos,
+        snr=snr,
+        shared_memory=shm,
+    )
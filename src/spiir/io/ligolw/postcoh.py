@@ -25,15 +25,20 @@ class PostcohInspiralTable(table.Table):
         "end_time_ns_sngl_L1": "int_4s",
         "end_time_sngl_V1": "int_4s",
         "end_time_ns_sngl_V1": "int_4s",
+        "end_time_sngl_K1": "int_4s",
+        "end_time_ns_sngl_K1": "int_4s",
         "snglsnr_H1": "real_4",
         "snglsnr_L1": "real_4",
         "snglsnr_V1": "real_4",
+        "snglsnr_K1": "real_4",
         "coaphase_L1": "real_4",
         "coaphase_H1": "real_4",
         "coaphase_V1": "real_4",
+        "coaphase_K1": "real_4",
         "chisq_H1": "real_4",
         "chisq_L1": "real_4",
         "chisq_V1": "real_4",
+        "chisq_K1": "real_4",
         "is_background": "int_4s",
         "livetime": "int_4s",
         "ifos": "lstring",
@@ -49,15 +54,19 @@ class PostcohInspiralTable(table.Table):
         "far_sngl_H1": "real_4",
         "far_sngl_L1": "real_4",
         "far_sngl_V1": "real_4",
+        "far_sngl_K1": "real_4",
         "far_1w_sngl_H1": "real_4",
         "far_1w_sngl_L1": "real_4",
         "far_1w_sngl_V1": "real_4",
+        "far_1w_sngl_K1": "real_4",
         "far_1d_sngl_H1": "real_4",
         "far_1d_sngl_L1": "real_4",
         "far_1d_sngl_V1": "real_4",
+        "far_1d_sngl_K1": "real_4",
         "far_2h_sngl_H1": "real_4",
         "far_2h_sngl_L1": "real_4",
         "far_2h_sngl_V1": "real_4",
+        "far_2h_sngl_K1": "real_4",
         "far": "real_4",
         "far_2h": "real_4",
         "far_1d": "real_4",
@@ -81,7 +90,10 @@ class PostcohInspiralTable(table.Table):
         "deff_H1": "real_8",
         "deff_L1": "real_8",
         "deff_V1": "real_8",
+        "deff_K1": "real_8",
         "rank": "real_8",
+        "ringdown_dur": "int_4s",
+        "ringdown_dur_ns": "int_4s",
     }
     constraints = "PRIMARY KEY (event_id)"
     # next_id = PostcohInspiralID(0)
@@ -129,7 +141,7 @@ def use_in(ContentHandler):
     # ContentHandler = table.use_in(ContentHandler)
 
     def startTable(self, parent, attrs, __orig_startTable=ContentHandler.startTable):
-        name = ligolw.Table.TableName(attrs[u"Name"])
+        name = table.Table.TableName(attrs[u"Name"])
         if name in TableByName:
             return TableByName[name](attrs)
         return __orig_startTable(self, parent, attrs)
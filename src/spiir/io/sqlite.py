@@ -0,0 +1,449 @@
+from __future__ import annotations
+
+import logging
+import math
+import os
+import sqlite3
+from concurrent.futures import Executor
+from functools import partial
+from os import PathLike
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+
+# the columns indexed for fast time, significance and detector queries of each table
+INDEX_COLUMNS = {
+    "postcoh": ["end_time", "far", "cohsnr", "ifos"],
+    "sngl_inspiral": ["end_time", "snr", "ifo", "event_id"],
+    "coinc_inspiral": ["end_time", "combined_far", "snr", "ifos", "coinc_event_id"],
+    "coinc_event": ["coinc_event_id"],
+    "coinc_event_map": ["coinc_event_id", "event_id"],
+}
+
+# SQL operators for each supported where predicate operator
+_SQL_OPERATORS = {
+    "==": "=",
+    "!=": "!=",
+    "<": "<",
+    "<=": "<=",
+    ">": ">",
+    ">=": ">=",
+    "in": "IN",
+    "not in": "NOT IN",
+}
+
+
+def _get_table_schema(table: str) -> Dict[str, str]:
+    # return the LIGO_LW type of each valid column of a table, without table prefixes
+    import ligo.lw.lsctables
+    import ligo.lw.table
+
+    from .ligolw import postcoh  # noqa: F401 - registers the postcoh table
+
+    try:
+        validcolumns = ligo.lw.lsctables.TableByName[table].validcolumns
+    except KeyError as exc:
+        raise ValueError(f"Unknown LIGO_LW table {table}.") from exc
+    return {
+        ligo.lw.table.Column.ColumnName(name): coltype
+        for name, coltype in validcolumns.items()
+    }
+
+
+def _load_file_tables(
+    path: str,
+    tables: List[str],
+    ilwdchar_compat: bool,
+) -> Optional[Dict[str, Dict[str, np.ndarray]]]:
+    # load every table of a single file, returning None if it cannot be read
+    from .ligolw import load_ligolw_multi_table_columns
+
+    try:
+        return load_ligolw_multi_table_columns(
+            path, tables, ilwdchar_compat=ilwdchar_compat
+        )
+    except Exception as exc:
+        logger.warning("Failed to read %s tables in %s: %s", tables, path, exc)
+        return None
+
+
+class TriggerDatabase:
+    """An indexed SQLite store of LIGO_LW trigger tables (e.g. postcoh, sngl_inspiral
+    and coinc_inspiral) ingested from many LIGO_LW XML Documents.
+
+    Each table is stored with the columns of its LIGO_LW schema that are present in
+    the ingested documents, as well as a file_id column referencing the file each row
+    was read from, as event IDs are only unique
+    within a single file. Indexes are created on the columns in INDEX_COLUMNS (e.g.
+    end_time, far, cohsnr and ifos for postcoh), such that time, significance and
+    detector queries do not need to scan every row.
+
+    Files are parsed with the columnar LIGO_LW readers and their rows are inserted
+    with batched executemany calls inside one transaction per file, such that a file
+    is either fully ingested or not at all. The size and modification time of each
+    ingested file is recorded, so ingesting the same files again only ingests the new
+    or modified ones, where the rows of modified files are replaced.
+
+    Parameters
+    ----------
+    path: str | PathLike
+        The path to the SQLite database file, which is created if it does not exist.
+    tables: Iterable[str]
+        The names of the LIGO_LW Tables to ingest from each document.
+    ilwdchar_compat: bool
+        Whether to add ilwdchar conversion compatibility, such that ID columns are
+        stored as integers.
+
+    Examples
+    --------
+        >> with TriggerDatabase("triggers.sqlite", ["postcoh", "sngl_inspiral"]) as db:
+        ..     db.ingest(catalog.paths)
+        ..     df = db.query("postcoh", start=1187008800, end=1187009000)
+        ..     df = db.query("postcoh", where=[("far", "<", 1e-7)], order_by="far")
+    """
+    def __init__(
+        self,
+        path: Union[str, PathLike],
+        tables: Iterable[str] = ("postcoh",),
+        ilwdchar_compat: bool = True,
+    ):
+        self.path = os.fspath(path)
+        self.tables = list(tables)
+        self.ilwdchar_compat = ilwdchar_compat
+        self._schemas = {table: _get_table_schema(table) for table in self.tables}
+        # the stored columns of each table, such that they are only read once
+        self._columns: Dict[str, List[str]] = {}
+
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self._create_tables()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path!r}, tables={self.tables})"
+
+    def __enter__(self) -> TriggerDatabase:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Closes the connection to the database."""
+        self.connection.close()
+
+    def _create_tables(self):
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "file_id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL, "
+                "size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL)"
+            )
+
+    def _get_columns(self, table: str) -> List[str]:
+        # return the names of the stored columns of a table, excluding file_id
+        if table not in self._columns:
+            rows = self.connection.execute(f'PRAGMA table_info("{table}")').fetchall()
+            self._columns[table] = [row[1] for row in rows if row[1] != "file_id"]
+        return self._columns[table]
+
+    def _add_columns(self, table: str, names: List[str]):
+        # create the table (and its indexes) with the given columns if it does not
+        # exist, or add any columns it does not yet have, as ligo.lw.dbtables does
+        import ligo.lw.types
+
+        schema = self._schemas[table]
+        existing = self._get_columns(table)
+        added = [name for name in names if name not in existing]
+        if not added:
+            return
+
+        columns = [
+            f'"{name}" {ligo.lw.types.ToSQLiteType[schema[name]]}' for name in added
+        ]
+        if not existing:
+            self.connection.execute(
+                f'CREATE TABLE IF NOT EXISTS "{table}" '
+                f'(file_id INTEGER NOT NULL, {", ".join(columns)})'
+            )
+            added = ["file_id"] + added
+        else:
+            for column in columns:
+                self.connection.execute(f'ALTER TABLE "{table}" ADD COLUMN {column}')
+
+        # indexes are only created as their columns are added
+        for name in added:
+            if name == "file_id" or name in INDEX_COLUMNS.get(table, []):
+                self.connection.execute(
+                    f'CREATE INDEX IF NOT EXISTS "{table}_{name}_index" '
+                    f'ON "{table}" ("{name}")'
+                )
+        self._columns[table] = existing + [name for name in added if name != "file_id"]
+
+    @property
+    def files(self) -> Dict[str, Tuple[int, int]]:
+        """The (size, mtime_ns) of every ingested file, keyed by its absolute path."""
+        rows = self.connection.execute("SELECT path, size, mtime_ns FROM files")
+        return {path: (size, mtime_ns) for path, size, mtime_ns in rows}
+
+    def _insert(
+        self,
+        table: str,
+        data: Dict[str, np.ndarray],
+        file_id: int,
+        batch_size: int,
+    ):
+        # insert the rows of a table in batches, as native Python values
+        schema = self._schemas[table]
+        names = [name for name in data if name in schema]
+        if not names:
+            return
+        self._add_columns(table, names)
+        placeholders = ", ".join(["?"] * (len(names) + 1))
+        statement = (
+            f'INSERT INTO "{table}" (file_id, '
+            + ", ".join(f'"{name}"' for name in names)
+            + f") VALUES ({placeholders})"
+        )
+        length = len(next(iter(data.values()), ()))
+        for start in range(0, length, batch_size):
+            columns = [data[name][start:start + batch_size].tolist() for name in names]
+            self.connection.executemany(
+                statement, zip([file_id] * len(columns[0]), *columns)
+            )
+
+    def ingest(
+        self,
+        paths: Union[str, bytes, PathLike, Iterable[Union[str, bytes, PathLike]]],
+        batch_size: int = 10_000,
+        prefetch: int = 1,
+        executor: Optional[Executor] = None,
+    ) -> int:
+        """Ingests the tables of one or more LIGO_LW XML Documents into the database,
+        skipping any files that have already been ingested and have not been modified.
+
+        Parameters
+        ----------
+        paths: str | bytes | PathLike | Iterable[str | bytes | PathLike]
+            One or more paths to files containing valid LIGO_LW XML Documents.
+        batch_size: int
+            The number of rows inserted per executemany call.
+        prefetch: int
+            The number of files parsed in the background while rows are inserted. If
+            zero, files are parsed and inserted sequentially.
+        executor: Executor | None = None
+            An optional existing executor used to parse files in the background.
+
+        Returns
+        -------
+        int
+            The number of files that were ingested.
+        """
+        from .ligolw.ligolw import _iter_prefetched
+
+        if isinstance(paths, (str, bytes, PathLike)):
+            paths = [paths]
+
+        known = self.files
+        pending = []
+        for path in paths:
+            path = os.path.abspath(os.fsdecode(path))
+            stat = os.stat(path)
+            if known.get(path) != (stat.st_size, stat.st_mtime_ns):
+                pending.append((path, stat.st_size, stat.st_mtime_ns))
+
+        load = partial(
+            _load_file_tables, tables=self.tables, ilwdchar_compat=self.ilwdchar_compat
+        )
+        results = _iter_prefetched(
+            load, [path for path, _, _ in pending], prefetch, executor
+        )
+
+        n_files = n_rows = 0
+        for (path, size, mtime_ns), tables in zip(pending, results):
+            if tables is None:
+                continue
+            try:
+                self._ingest_file(path, size, mtime_ns, tables, batch_size)
+            except BaseException:
+                self._columns.clear()  # any added columns were rolled back
+                raise
+            n_rows += sum(
+                len(next(iter(data.values()), ())) for data in tables.values()
+            )
+            n_files += 1
+
+        logger.debug(
+            "Ingested %d rows from %d files into %s.", n_rows, n_files, self.path
+        )
+        return n_files
+
+    def _ingest_file(
+        self,
+        path: str,
+        size: int,
+        mtime_ns: int,
+        tables: Dict[str, Dict[str, np.ndarray]],
+        batch_size: int,
+    ):
+        # insert the tables of a single file in one transaction
+        with self.connection:
+            # replace the rows of modified files
+            row = self.connection.execute(
+                "SELECT file_id FROM files WHERE path = ?", (path,)
+            ).fetchone()
+            if row is not None:
+                for table in filter(self._get_columns, self.tables):
+                    self.connection.execute(
+                        f'DELETE FROM "{table}" WHERE file_id = ?', row
+                    )
+                self.connection.execute("DELETE FROM files WHERE file_id = ?", row)
+
+            file_id = self.connection.execute(
+                "INSERT INTO files (path, size, mtime_ns) VALUES (?, ?, ?)",
+                (path, size, mtime_ns),
+            ).lastrowid
+            for table, data in tables.items():
+                self._insert(table, data, file_id, batch_size)
+
+    def _get_where_clause(
+        self,
+        table: str,
+        where: Optional[List[Tuple[str, str, Any]]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Tuple[str, list]:
+        # build a parameterized WHERE clause from predicates and a GPS time interval
+        import ligo.lw.types
+
+        stored = self._get_columns(table)
+        schema = self._schemas[table]
+        clauses, params = [], []
+        for name, op, value in where or []:
+            if name not in stored and name != "file_id":
+                raise KeyError(f"where column {name!r} not found in {table} table.")
+            if op not in _SQL_OPERATORS:
+                raise ValueError(
+                    f"Unknown where operator {op!r}, use one of {list(_SQL_OPERATORS)}."
+                )
+            if op in ("in", "not in"):
+                values = np.asarray(value).ravel().tolist()
+                placeholders = ", ".join(["?"] * len(values))
+                clauses.append(f'"{name}" {_SQL_OPERATORS[op]} ({placeholders})')
+                params.extend(values)
+            else:
+                # real_4 columns are stored as the doubles of their float32 values, so
+                # values are promoted as when comparing a float32 array (i.e. a Python
+                # float is rounded to float32), as in load_ligolw_tables
+                dtype = ligo.lw.types.ToNumPyType.get(schema.get(name))
+                if dtype == "float32":
+                    value = np.asarray(value, dtype=np.result_type(np.float32, value))
+                clauses.append(f'"{name}" {_SQL_OPERATORS[op]} ?')
+                params.append(np.asarray(value).item())
+
+        # the integer end_time bounds use its index before the precise time is compared
+        if start is not None:
+            clauses.append('"end_time" >= ?')
+            clauses.append('"end_time" + "end_time_ns" * 1e-9 >= ?')
+            params.extend([math.floor(start), start])
+        if end is not None:
+            clauses.append('"end_time" <= ?')
+            clauses.append('"end_time" + "end_time_ns" * 1e-9 < ?')
+            params.extend([math.floor(end), end])
+
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def query(
+        self,
+        table: str = "postcoh",
+        columns: Optional[List[str]] = None,
+        where: Optional[List[Tuple[str, str, Any]]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Queries the rows of a table and returns them as a pd.DataFrame, with each
+        column cast to the NumPy type of its LIGO_LW schema (e.g. real_4 to float32).
+
+        Parameters
+        ----------
+        table: str
+            The name of the table to query.
+        columns: list[str] | None = None
+            An optional list of column names to return. The file_id column may also be
+            requested to identify the file each row was read from.
+        where: list[tuple[str, str, Any]] | None = None
+            An optional list of (column, operator, value) predicates that every returned
+            row must satisfy, e.g. [("far", "<", 1e-7), ("ifos", "==", "H1L1")].
+            Supported operators are "==", "!=", "<", "<=", ">", ">=", "in" and "not in".
+        start: float | None = None
+            The GPS start time of the rows to return, as compared to end_time.
+        end: float | None = None
+            The GPS end time (exclusive) of the rows to return, as compared to end_time.
+        order_by: str | None = None
+            An optional column name to sort the returned rows by.
+        descending: bool
+            Whether to sort the returned rows in descending order.
+        limit: int | None = None
+            The maximum number of rows to return.
+
+        Returns
+        -------
+        pd.DataFrame
+            A pd.DataFrame with one row per matching row in the table.
+        """
+        import ligo.lw.types
+
+        stored = self._get_columns(table) if table in self._schemas else []
+        if not stored:
+            raise ValueError(f"{table} table is not stored in {self.path}.")
+        schema = {"file_id": "int_8s", **self._schemas[table]}
+
+        names = stored if columns is None else list(columns)
+        for name in names + ([order_by] if order_by is not None else []):
+            if name not in stored and name != "file_id":
+                raise KeyError(f"Column {name!r} not found in {table} table.")
+
+        clause, params = self._get_where_clause(table, where, start, end)
+        statement = (
+            "SELECT " + ", ".join(f'"{name}"' for name in names)
+            + f' FROM "{table}"' + clause
+        )
+        if order_by is not None:
+            statement += f' ORDER BY "{order_by}"' + (" DESC" if descending else "")
+        if limit is not None:
+            statement += " LIMIT ?"
+            params.append(int(limit))
+
+        import pandas as pd
+
+        rows = self.connection.execute(statement, params).fetchall()
+        values = list(zip(*rows)) if rows else [()] * len(names)
+        data = {}
+        for name, column in zip(names, values):
+            dtype = ligo.lw.types.ToNumPyType.get(schema[name], object)
+            if dtype is not object and None in column:
+                dtype = object  # null values cannot be represented by numeric types
+            data[name] = np.array(column, dtype=dtype)
+        return pd.DataFrame(data)
+
+    def sql(self, statement: str, params: Iterable[Any] = ()) -> pd.DataFrame:
+        """Executes an arbitrary SQL query and returns its result as a pd.DataFrame."""
+        import pandas as pd
+
+        return pd.read_sql_query(statement, self.connection, params=list(params))
+
+    def count(self, table: str = "postcoh") -> int:
+        """Returns the number of rows stored in a table."""
+        if table not in self._schemas or not self._get_columns(table):
+            return 0
+        return self.connection.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
@@ -0,0 +1,57 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from spiir.io import TriggerArchive
+from spiir.io.ligolw import load_ligolw_psds, load_ligolw_tables, write_ligolw_tables
+
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "share" / "data"
+PATHS = sorted(str(path) for path in DATA_DIR.glob("*/*.xml"))
+
+
+def test_append_files_with_different_columns_in_any_order(tmp_path):
+    # only the snr document has *_K1 columns, and it is packed into its own batch
+    for i, paths in enumerate((PATHS, PATHS[::-1])):
+        archive = TriggerArchive(tmp_path / f"archive_{i}")
+        assert archive.append(paths + [str(tmp_path / "missing.xml")], batch_size=1) == 3
+        expected = load_ligolw_tables(paths, "postcoh")
+        data = archive.read().drop(columns="file_index").reset_index(drop=True)
+        pd.testing.assert_frame_equal(data[expected.columns], expected, check_dtype=False)
+
+
+def test_get_psds_matches_load_ligolw_psds(tmp_path):
+    archive = TriggerArchive(tmp_path / "archive")
+    archive.append(PATHS)
+    for file_index, path in enumerate(archive.files):
+        pd.testing.assert_frame_equal(archive.get_psds(file_index), load_ligolw_psds(path))
+
+
+def test_find_event_ids_matches_scanning_every_row(tmp_path):
+    # event IDs repeat within and across files, and their rows are found by the index
+    df = load_ligolw_tables(PATHS[0], "postcoh")
+    df = df.loc[df.index.repeat(20)].reset_index(drop=True)
+    paths = []
+    for i in range(3):
+        df["event_id"] = (np.arange(20) * (i + 1)) % 7
+        paths.append(str(tmp_path / f"H1L1_{1186642820 + i}_20.xml"))
+        write_ligolw_tables(paths[-1], {"postcoh": df})
+
+    archive = TriggerArchive(tmp_path / "archive")
+    archive.append(paths, batch_size=2)
+    assert all(batch.has_event_ids() for batch in archive._batches)
+    event_ids = archive.read(columns=["event_id"], df=False)["event_id"]
+    for event_id in list(np.unique(event_ids)) + [event_ids[0], 7, "missing"]:
+        expected = np.flatnonzero(event_ids == event_id)
+        np.testing.assert_array_equal(archive.find(event_id), expected)
+    assert len(archive.find(event_ids[0], path=paths[1])) == 3
+
+    # legacy ilwd:char event IDs are indexed as strings
+    archive = TriggerArchive(tmp_path / "legacy")
+    archive.append(PATHS, ilwdchar_compat=False)
+    event_ids = archive.read(columns=["event_id"], df=False)["event_id"]
+    assert isinstance(event_ids[0], str) and archive._batches[0].has_event_ids()
+    for event_id in list(event_ids) + [0]:
+        expected = np.flatnonzero(event_ids == event_id)
+        np.testing.assert_array_equal(archive.find(event_id), expected)
@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+
+from spiir.io.ligolw import (
+    iter_ligolw_record_batches,
+    load_ligolw_arrow_table,
+    load_ligolw_tables,
+    write_ligolw_tables,
+)
+
+pa = pytest.importorskip("pyarrow")
+
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "share" / "data"
+PATHS = sorted(str(path) for path in DATA_DIR.glob("*/*.xml"))
+
+
+@pytest.mark.parametrize("paths", [PATHS, PATHS[::-1]])
+def test_load_arrow_table_with_different_columns_in_any_order(paths):
+    # only the snr document has *_K1 columns, which are null for the coinc documents
+    arrow_table = load_ligolw_arrow_table(paths, "postcoh")
+    batches = list(iter_ligolw_record_batches(paths, "postcoh", prefetch=0))
+    assert pa.Table.from_batches(batches).equals(arrow_table)
+
+    expected = load_ligolw_tables(paths, "postcoh")
+    assert arrow_table.num_rows == len(expected)
+    assert set(expected.columns) <= set(arrow_table.column_names)
+    assert arrow_table.column("chisq_K1").to_pandas().isna().tolist() == (
+        expected["chisq_K1"].isna().tolist()
+    )
+
+
+def test_load_arrow_table_with_legacy_and_integer_ids(tmp_path):
+    # legacy documents have ilwd:char event_ids, which are strings without conversion
+    path = str(tmp_path / "H1L1_1186642820_1.xml")
+    write_ligolw_tables(path, {"postcoh": load_ligolw_tables(PATHS[0], "postcoh")})
+    for paths in ([PATHS[0], path], [path, PATHS[0]]):
+        arrow_table = load_ligolw_arrow_table(paths, "postcoh", ilwdchar_compat=False)
+        assert arrow_table.schema.field("event_id").type == pa.string()
+        assert arrow_table.schema.field("far").type == pa.float32()
+        event_ids = arrow_table.column("event_id").to_pylist()
+        assert sorted(event_ids) == ["2807", "postcoh:event_id:2807"]
+
+    parallel = load_ligolw_arrow_table(PATHS, "postcoh", n_jobs=2)
+    assert parallel.equals(load_ligolw_arrow_table(PATHS, "postcoh"))
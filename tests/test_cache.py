@@ -0,0 +1,37 @@
+from pathlib import Path
+
+import numpy as np
+
+from spiir.io.ligolw import LIGOLWTableCache, LoadStats, load_ligolw_table_columns
+
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "share" / "data"
+PATHS = sorted(str(path) for path in DATA_DIR.glob("*/*.xml"))
+
+
+def test_table_cache_hit_returns_parsed_columns(tmp_path):
+    cache = LIGOLWTableCache(tmp_path)
+    for path in PATHS:
+        expected = load_ligolw_table_columns(path, "postcoh")
+        with LoadStats() as stats:
+            assert load_ligolw_table_columns(path, "postcoh", cache=cache).keys()
+            data = load_ligolw_table_columns(path, "postcoh", cache=cache)
+        assert stats.to_dict()["table_cache_read"]["hits"] == 1
+        assert list(data) == list(expected)
+        for name, values in expected.items():
+            assert data[name].dtype == values.dtype, name
+            np.testing.assert_array_equal(data[name], values)
+
+
+def test_table_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = LIGOLWTableCache(tmp_path)
+    for path in PATHS:
+        load_ligolw_table_columns(path, "postcoh", cache=cache)
+    max_bytes = cache.size
+
+    # entries written by another cache instance are counted towards max_bytes
+    cache = LIGOLWTableCache(tmp_path, max_bytes=max_bytes)
+    load_ligolw_table_columns(PATHS[0], "postcoh", cache=cache, columns=["far"])
+    assert cache.size <= max_bytes
+    assert cache.get(PATHS[0], "postcoh", columns=["far"]) is not None
+    assert cache.get(PATHS[0], "postcoh") is None
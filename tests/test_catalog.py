@@ -0,0 +1,67 @@
+import os
+import shutil
+from pathlib import Path
+
+import spiir.io.catalog
+from spiir.io import TriggerFileCatalog, parse_trigger_filename
+
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "share" / "data"
+COINC_PATH = DATA_DIR / "coinc" / "H1L1_1186642820_386_38.xml"
+
+
+def _copy_zerolags(directory: Path, gps_times):
+    # copy a trigger file into the directory as zerolag files starting at gps_times
+    paths = []
+    for gps in gps_times:
+        path = directory / f"H1L1_zerolag_{gps}_100.xml"
+        shutil.copy(COINC_PATH, path)
+        paths.append(str(path))
+    return paths
+
+
+def test_parse_zerolag_trigger_filename():
+    assert parse_trigger_filename("H1L1_1186643089_412_557.xml") == ("H1L1", 1186643089)
+    assert parse_trigger_filename("H1L1V1_zerolag_1187008882_23.xml.gz") == (
+        "H1L1V1", 1187008882
+    )
+    assert parse_trigger_filename("H1L1_zerolag.xml") is None
+
+
+def test_query_zerolag_files_by_duration(tmp_path):
+    paths = _copy_zerolags(tmp_path, [1186640000, 1186640100, 1186640200])
+    catalog = TriggerFileCatalog(tmp_path, duration=100)
+    assert catalog.paths == paths
+    assert catalog.query(1186640150, 1186640160) == paths[1:2]
+
+    # without stats or a duration, files may span any time after their GPS time
+    catalog = TriggerFileCatalog(tmp_path, path=tmp_path / "unbounded.npz")
+    assert catalog.query(1186640150, 1186640160) == paths[:2]
+
+
+def test_query_zerolag_files_by_stats(tmp_path):
+    paths = _copy_zerolags(tmp_path, [1186640000])
+    catalog = TriggerFileCatalog(tmp_path, stats=True)
+    # the file holds one trigger at 1186642820.87, long after its GPS time
+    assert catalog.query(1186642820, 1186642821) == paths
+    assert catalog.query(1186640000, 1186640100) == []
+
+
+def test_catalog_relative_directory_and_files_removed_while_scanning(
+    tmp_path, monkeypatch
+):
+    paths = _copy_zerolags(tmp_path, [1186640000, 1186640100, 1186640200])
+    scan_trigger_files = spiir.io.catalog._scan_trigger_files
+
+    def scan_and_remove(*args):
+        for entry in scan_trigger_files(*args):
+            if entry.path == paths[0]:
+                os.remove(entry.path)
+            yield entry
+
+    monkeypatch.setattr(spiir.io.catalog, "_scan_trigger_files", scan_and_remove)
+    monkeypatch.chdir(tmp_path.parent)
+    catalog = TriggerFileCatalog(tmp_path.name, duration=100)
+    monkeypatch.chdir(tmp_path)
+    assert catalog.paths == paths[1:]
+    assert catalog.query(1186640150, 1186640160) == paths[1:2]
@@ -0,0 +1,118 @@
+import io
+from pathlib import Path
+
+import ligo.lw.array
+import ligo.lw.ligolw
+import ligo.lw.table
+import numpy as np
+import pandas as pd
+import pytest
+
+from spiir.io.ligolw import (
+    PostcohInspiralTable,
+    format_table_stream,
+    get_ligolw_table_columns_from_xmldoc,
+    get_structured_dtype,
+    load_ligolw_tables,
+    load_ligolw_xmldoc,
+    write_ligolw_tables,
+)
+from spiir.io.ligolw.columnar import parse_table_stream
+
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "share" / "data"
+PATHS = sorted(str(path) for path in DATA_DIR.glob("*/*.xml"))
+
+
+@pytest.mark.parametrize("ilwdchar_compat", [True, False])
+@pytest.mark.parametrize("path", PATHS)
+def test_columnar_postcoh_matches_row_parsing(path, ilwdchar_compat):
+    expected = get_ligolw_table_columns_from_xmldoc(
+        load_ligolw_xmldoc(path, ilwdchar_compat), "postcoh"
+    )
+    xmldoc = load_ligolw_xmldoc(path, ilwdchar_compat, columnar=True)
+    table = ligo.lw.table.Table.get_table(xmldoc, name="postcoh")
+    assert isinstance(table.array, np.ndarray)
+
+    data = get_ligolw_table_columns_from_xmldoc(xmldoc, "postcoh")
+    assert list(data) == list(expected)
+    for name, values in expected.items():
+        assert data[name].dtype == values.dtype, name
+        np.testing.assert_array_equal(data[name], values)
+
+
+def test_columnar_arrays_match_ligolw_arrays():
+    arrays = {
+        "int": np.arange(24, dtype=np.int32).reshape(2, 3, 4),
+        "real_8": np.random.default_rng(0).normal(size=(2, 5)),
+        "real_4": np.linspace(0, 1, 7, dtype=np.float32),
+        "empty": np.zeros((2, 0)),
+    }
+    xmldoc = ligo.lw.ligolw.Document()
+    ligolw = xmldoc.appendChild(ligo.lw.ligolw.LIGO_LW())
+    for name, array in arrays.items():
+        ligolw.appendChild(ligo.lw.array.Array.build(name, array))
+    f = io.StringIO()
+    xmldoc.write(f)
+    text = f.getvalue().encode()
+
+    expected = load_ligolw_xmldoc(io.BytesIO(text)).getElementsByTagName("Array")
+    xmldoc = load_ligolw_xmldoc(io.BytesIO(text), tables=[], columnar=True)
+    for elem, other in zip(xmldoc.getElementsByTagName("Array"), expected):
+        assert elem.array.dtype == other.array.dtype
+        assert elem.array.shape == other.array.shape == arrays[elem.Name].shape
+        np.testing.assert_array_equal(elem.array, other.array)
+
+
+@pytest.fixture(scope="module")
+def postcoh(tmp_path_factory):
+    # a postcoh table of 200 rows with distinct event_ids, fars and ifos
+    df = load_ligolw_tables(PATHS[0], "postcoh")
+    df = df.loc[df.index.repeat(200)].reset_index(drop=True)
+    df["event_id"] = np.arange(200)
+    df["far"] = np.logspace(-10, -2, 200)
+    df["ifos"] = np.where(np.arange(200) % 3, "H1L1", "H1L1V1")
+    path = tmp_path_factory.mktemp("postcoh") / "H1L1_1186642820_200.xml"
+    write_ligolw_tables(path, {"postcoh": df})
+    return str(path), load_ligolw_tables(path, "postcoh")
+
+
+WHERE = [
+    ([("far", "<", 1e-6)], lambda df: df.far < 1e-6),
+    (
+        [("far", ">=", 1e-6), ("ifos", "==", "H1L1")],
+        lambda df: (df.far >= 1e-6) & (df.ifos == "H1L1"),
+    ),
+    ([("event_id", "in", [0, 5, 150])], lambda df: df.event_id.isin([0, 5, 150])),
+    ([("event_id", "not in", [0, 5])], lambda df: ~df.event_id.isin([0, 5])),
+    ([("far", ">", 1.)], lambda df: df.far > 1.),
+]
+
+
+@pytest.mark.parametrize("columns", [None, ["event_id", "cohsnr"]])
+@pytest.mark.parametrize("where, query", WHERE)
+def test_where_matches_dataframe_filtering(postcoh, where, query, columns):
+    path, df = postcoh
+    expected = df[query(df)].reset_index(drop=True)
+    if columns is not None:
+        expected = expected[columns]
+    result = load_ligolw_tables(path, "postcoh", columns=columns, where=where)
+    # pandas does not infer a string dtype for empty string columns
+    pd.testing.assert_frame_equal(result, expected, check_dtype=len(expected) > 0)
+
+
+@pytest.mark.parametrize("where, query", WHERE)
+def test_parse_table_stream_filters_every_chunk(postcoh, where, query):
+    _, df = postcoh
+    validcolumns = PostcohInspiralTable.validcolumns
+    data = {name: df[name].to_numpy() for name in df.columns}
+    text = "".join(format_table_stream(data, validcolumns))
+    dtype = get_structured_dtype(validcolumns, ["event_id", "far", "ifos"])
+
+    expected = df[query(df)]
+    for chunksize in (7, 200):
+        array = parse_table_stream(
+            text, dtype, df.columns, where=where, chunksize=chunksize
+        )
+        np.testing.assert_array_equal(array["event_id"], expected["event_id"])
+        np.testing.assert_array_equal(array["far"], expected["far"])
@@ -0,0 +1,55 @@
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+import spiir.io.follow
+from spiir.io import TriggerFileFollower
+
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "share" / "data"
+COINC_PATH = DATA_DIR / "coinc" / "H1L1_1186642820_386_38.xml"
+SNR_PATH = DATA_DIR / "snr" / "H1L1V1_1187006031_3_432.xml"
+
+
+def test_follow_zerolag_files(tmp_path):
+    follower = TriggerFileFollower(tmp_path, df=False)
+    assert follower.poll() is None
+
+    shutil.copy(COINC_PATH, tmp_path / "H1L1_zerolag_1186642800_100.xml")
+    delta = follower.poll()
+    assert len(delta["event_id"]) == 1
+    assert follower.poll() is None
+
+    # files with other columns (i.e. *_K1) are buffered with the union of columns
+    shutil.copy(SNR_PATH, tmp_path / "H1L1V1_zerolag_1187006000_100.xml")
+    assert len(follower.poll()["chisq_K1"]) == 1
+    assert len(follower.data["chisq_K1"]) == 2
+
+
+def test_follow_custom_pattern(tmp_path):
+    shutil.copy(COINC_PATH, tmp_path / "zerolag-1186642800.xml")
+    assert TriggerFileFollower(tmp_path).poll() is None
+
+    follower = TriggerFileFollower(tmp_path, pattern=r"^zerolag-(?P<gps>\d+)\.xml$")
+    assert len(follower.poll()) == 1
+
+
+@pytest.mark.parametrize("backfill", [True, False])
+def test_follow_skips_files_removed_while_scanning(tmp_path, monkeypatch, backfill):
+    removed = tmp_path / "H1L1_zerolag_1186642700_100.xml"
+    shutil.copy(COINC_PATH, removed)
+    shutil.copy(COINC_PATH, tmp_path / "H1L1_zerolag_1186642800_100.xml")
+    scan_trigger_files = spiir.io.follow._scan_trigger_files
+
+    def scan_and_remove(*args):
+        for entry in scan_trigger_files(*args):
+            if entry.path == str(removed):
+                os.remove(entry.path)
+            yield entry
+
+    monkeypatch.setattr(spiir.io.follow, "_scan_trigger_files", scan_and_remove)
+    follower = TriggerFileFollower(tmp_path, df=False, backfill=backfill)
+    delta = follower.poll()
+    assert (delta is not None and len(delta["event_id"]) == 1) == backfill
@@ -0,0 +1,302 @@
+import asyncio
+import gzip
+from pathlib import Path
+
+import ligo.lw.utils
+import numpy as np
+import pandas as pd
+import pytest
+
+from spiir.io.ligolw import (
+    ILWDCharCompatContentHandler,
+    LIGOLWDocumentCache,
+    LoadStats,
+    aload_ligolw_tables,
+    PostcohInspiralTable,
+    SelectiveContentHandler,
+    get_compact_table_columns,
+    iter_ligolw_tables,
+    load_all_ligolw_snr_series,
+    load_ligolw_frequency_series,
+    load_ligolw_multi_tables,
+    load_ligolw_psd_arrays,
+    load_ligolw_psds,
+    load_ligolw_snr_array,
+    load_ligolw_snr_tensor,
+    load_ligolw_table_columns,
+    load_ligolw_tables,
+    load_ligolw_xmldoc,
+    strip_ilwdchar,
+    write_ligolw_tables,
+)
+from spiir.io.ligolw.ligolw import LIGOLWContentHandler
+
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "share" / "data"
+COINC_PATHS = sorted(str(path) for path in (DATA_DIR / "coinc").glob("*.xml"))
+SNR_PATHS = sorted(str(path) for path in (DATA_DIR / "snr").glob("*.xml"))
+
+
+def test_load_process_table_with_null_columns():
+    # the process table holds null int_4s values (e.g. end_time and cvs_entry_time)
+    df = load_ligolw_tables(COINC_PATHS[0], "process")
+    assert df.shape == (1, 15)
+    assert df["end_time"].isna().all()
+    assert df["cvs_entry_time"].isna().all()
+
+
+def test_load_table_columns_keeps_non_null_dtypes():
+    data = load_ligolw_table_columns(COINC_PATHS[0], "process")
+    assert data["end_time"].dtype == object
+    assert data["unix_procid"].dtype == np.int32
+
+
+def test_load_legacy_postcoh_table_without_ilwdchar_compat():
+    df = load_ligolw_tables(COINC_PATHS[0], "postcoh", ilwdchar_compat=False)
+    assert df.shape == (1, 67)
+    assert df["event_id"].iloc[0].startswith("postcoh:event_id:")
+
+
+def test_xmldoc_cache_matches_uncached_loaders():
+    path = SNR_PATHS[0]
+    xmldoc_cache = LIGOLWDocumentCache()
+    with LoadStats() as stats:
+        for table in ("postcoh", "sngl_inspiral"):
+            pd.testing.assert_frame_equal(
+                load_ligolw_tables(path, table, xmldoc_cache=xmldoc_cache),
+                load_ligolw_tables(path, table),
+            )
+        cached = load_all_ligolw_snr_series(
+            path, ilwdchar_compat=True, xmldoc_cache=xmldoc_cache
+        )
+        uncached = load_all_ligolw_snr_series(path, ilwdchar_compat=True)
+    assert list(cached) == list(uncached)
+    assert all(cached[key].equals(uncached[key]) for key in uncached)
+    assert stats.to_dict()["xmldoc_cache"]["misses"] == 1
+
+
+def test_load_stats_counts_stages_only_within_block():
+    where = [("far", "<", 1.)]
+    with LoadStats() as stats:
+        data = load_ligolw_table_columns(SNR_PATHS[0], "postcoh", where=where)
+    counts = stats.to_dict()
+    assert counts["parse"]["calls"] == 1
+    assert counts["parse"]["files"] == 1 and counts["parse"]["bytes"] > 0
+    assert counts["filter"]["rows"] == counts["filter"]["selected"] == len(data["far"])
+    assert len(data["far"]) > 0
+
+    load_ligolw_table_columns(SNR_PATHS[0], "postcoh", where=where)
+    assert stats.to_dict() == counts
+
+
+def test_load_tables_with_different_columns_in_any_order():
+    # only the snr document has *_K1 columns, which are NaN for the coinc documents
+    paths = COINC_PATHS + SNR_PATHS
+    forward = load_ligolw_tables(paths, "postcoh")
+    backward = load_ligolw_tables(paths[::-1], "postcoh")
+    assert forward.shape == backward.shape == (3, 79)
+    assert forward["chisq_K1"].isna().tolist() == [True, True, False]
+    pd.testing.assert_frame_equal(
+        forward.iloc[::-1].reset_index(drop=True),
+        backward[forward.columns].reset_index(drop=True),
+    )
+
+
+def test_selective_handler_uses_postcoh_tables_with_ilwdchar_compat(monkeypatch):
+    tables = {}
+    for ilwdchar_compat in (True, False):
+        xmldoc = load_ligolw_xmldoc(
+            COINC_PATHS[0], ilwdchar_compat=ilwdchar_compat, tables=["postcoh"]
+        )
+        (tables[ilwdchar_compat],) = xmldoc.getElementsByTagName("Table")
+    assert isinstance(tables[True], PostcohInspiralTable)
+    assert not isinstance(tables[False], PostcohInspiralTable)
+
+    # without access to the expat parser, skipped elements are parsed and discarded
+    monkeypatch.setattr(SelectiveContentHandler, "_get_expat_parser", lambda self: None)
+    xmldoc = load_ligolw_xmldoc(COINC_PATHS[0], tables=["postcoh"], arrays=[])
+    (table,) = xmldoc.getElementsByTagName("Table")
+    assert len(table) == len(tables[True])
+    assert not xmldoc.getElementsByTagName("Array")
+
+
+@pytest.mark.parametrize("path", COINC_PATHS + SNR_PATHS)
+def test_ilwdchar_tokenizer_matches_strip_ilwdchar(path):
+    xmldoc = ligo.lw.utils.load_filename(
+        path, contenthandler=ILWDCharCompatContentHandler
+    )
+    expected = strip_ilwdchar(
+        ligo.lw.utils.load_filename(path, contenthandler=LIGOLWContentHandler)
+    )
+    for elem, other in zip(
+        xmldoc.getElementsByTagName("Table"), expected.getElementsByTagName("Table")
+    ):
+        assert elem.columnnames == other.columnnames
+        assert elem.columntypes == other.columntypes
+        assert "ilwd:char" not in elem.columntypes
+        for name in elem.columnnames:
+            assert list(elem.getColumnByName(name)) == list(other.getColumnByName(name))
+
+    params = [
+        (elem.Name, elem.Type, elem.value)
+        for elem in xmldoc.getElementsByTagName("Param")
+    ]
+    assert params == [
+        (elem.Name, elem.Type, elem.value)
+        for elem in expected.getElementsByTagName("Param")
+    ]
+
+
+def test_psd_loaders_match_load_ligolw_frequency_series():
+    pytest.importorskip("gwpy")
+    psds = load_ligolw_psds(COINC_PATHS[0])
+    frequencies, arrays = load_ligolw_psd_arrays([COINC_PATHS[0]] * 2, psds.columns)
+    assert arrays.shape == (2, len(psds.columns), len(psds))
+    for i, ifo in enumerate(psds.columns):
+        expected = load_ligolw_frequency_series(COINC_PATHS[0], instrument=ifo)
+        np.testing.assert_array_equal(psds.index, expected.index)
+        np.testing.assert_array_equal(psds[ifo], expected)
+        np.testing.assert_array_equal(frequencies, expected.index)
+        np.testing.assert_array_equal(arrays[:, i], [expected, expected])
+
+
+def test_snr_tensor_matches_load_all_ligolw_snr_series():
+    ifos = ["H1", "L1", "V1", "K1"]
+    tensor = load_ligolw_snr_tensor(SNR_PATHS * 2, ifos)
+    assert tensor.snr.shape[:2] == (2 * len(SNR_PATHS), len(ifos))
+    delta_t = tensor.times[1]
+    for i, path in enumerate(SNR_PATHS * 2):
+        expected = np.full(tensor.snr.shape[1:], np.nan, dtype=np.complex64)
+        for series in load_all_ligolw_snr_series(path).values():
+            start = int(np.rint((series.index[0] - tensor.epochs[i]) / delta_t))
+            expected[ifos.index(series.name), start:start + len(series)] = series
+        np.testing.assert_array_equal(tensor.snr[i], expected)
+
+
+@pytest.mark.parametrize("ilwdchar_compat", [True, False])
+def test_snr_array_matches_load_all_ligolw_snr_series(ilwdchar_compat):
+    data = load_ligolw_snr_array(SNR_PATHS[0], ilwdchar_compat=ilwdchar_compat)
+    expected = load_all_ligolw_snr_series(SNR_PATHS[0], ilwdchar_compat=ilwdchar_compat)
+    assert data.event_ids.tolist() == list(expected)
+    for i, series in enumerate(expected.values()):
+        length = data.lengths[i]
+        assert data.ifos[i] == series.name
+        assert length == len(series)
+        np.testing.assert_allclose(data.epochs[i] + data.times[:length], series.index)
+        np.testing.assert_array_equal(data.snr[i, :length], series)
+        assert np.isnan(data.snr[i, length:]).all()
+
+
+def test_multi_tables_match_single_table_loads_and_join_by_file():
+    paths = COINC_PATHS + SNR_PATHS
+    tables = ["postcoh", "coinc_inspiral", "coinc_event_map", "sngl_inspiral"]
+    frames = load_ligolw_multi_tables(paths, tables)
+    for table in tables:
+        expected = load_ligolw_tables(paths, table)
+        df = frames[table].drop(columns="file_index")
+        pd.testing.assert_frame_equal(df, expected[df.columns])
+
+    # every sngl_inspiral row is joined to the coinc and postcoh rows of its file
+    joined = load_ligolw_multi_tables(paths, tables, join=True)
+    assert len(joined) == len(frames["sngl_inspiral"])
+    for file_index, path in enumerate(paths):
+        rows = joined[joined["file_index"] == file_index]
+        sngl = load_ligolw_tables(path, "sngl_inspiral").set_index("event_id")
+        postcoh = load_ligolw_tables(path, "postcoh")
+        coinc = load_ligolw_tables(path, "coinc_inspiral")
+        ifos = sngl.loc[rows["event_id"], "ifo"]
+        assert rows["sngl_inspiral:ifo"].tolist() == ifos.tolist()
+        assert (rows["postcoh:cohsnr"] == postcoh["cohsnr"].iloc[0]).all()
+        assert (rows["coinc_inspiral:snr"] == coinc["snr"].iloc[0]).all()
+
+
+def test_compact_tables_fuse_nanoseconds_and_categorize_strings():
+    df = load_ligolw_tables(COINC_PATHS, "postcoh")
+    compact = load_ligolw_tables(COINC_PATHS, "postcoh", compact=True)
+    for seconds, nanoseconds in [
+        ("end_time", "end_time_ns"), ("end_time_sngl_H1", "end_time_ns_sngl_H1")
+    ]:
+        expected = df[seconds].astype(np.int64) * 1_000_000_000 + df[nanoseconds]
+        assert seconds not in compact.columns
+        assert compact[nanoseconds].dtype == np.int64
+        assert compact[nanoseconds].tolist() == expected.tolist()
+    for name in ("ifos", "pivotal_ifo", "skymap_fname"):
+        assert isinstance(compact[name].dtype, pd.CategoricalDtype)
+        assert compact[name].astype(object).tolist() == df[name].tolist()
+    assert compact["cohsnr"].dtype == np.float32
+
+    # only <prefix>_ns[_<suffix>] columns are fused with their seconds column
+    data = {name: np.arange(3) for name in ("t", "t_nsec", "tec", "x_ns_y", "x_y")}
+    compact = get_compact_table_columns(data, "unknown")
+    assert list(compact) == ["t", "t_nsec", "tec", "x_ns_y"]
+    np.testing.assert_array_equal(compact["x_ns_y"], np.arange(3) * 1_000_000_001)
+
+
+@pytest.mark.parametrize("prefetch", [0, 1])
+def test_iter_tables_chunks_concatenate_to_load_tables(tmp_path, prefetch):
+    # a document of 5 rows spans multiple chunks, and chunks span multiple documents
+    df = load_ligolw_tables(COINC_PATHS[0], "postcoh")
+    df = df.loc[df.index.repeat(5)].reset_index(drop=True)
+    df["event_id"] = np.arange(5)
+    path = tmp_path / "H1L1_1186642820_5.xml"
+    write_ligolw_tables(path, {"postcoh": df})
+    paths = COINC_PATHS + [str(path)] + COINC_PATHS
+
+    expected = load_ligolw_tables(paths, "postcoh")
+    chunks = list(iter_ligolw_tables(paths, "postcoh", chunk_rows=3, prefetch=prefetch))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 3]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+
+    arrays = iter_ligolw_tables(paths, "postcoh", chunk_rows=4, df=False)
+    array = np.concatenate(list(arrays))
+    assert list(array.dtype.names) == list(expected.columns)
+    for name in expected.columns:
+        np.testing.assert_array_equal(array[name], expected[name].to_numpy())
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+@pytest.mark.parametrize("max_concurrency", [1, 2])
+def test_aload_tables_matches_load_tables(ordered, max_concurrency):
+    paths = (COINC_PATHS + SNR_PATHS) * 3
+    consumed = []
+
+    def iter_paths():
+        for path in paths:
+            consumed.append(path)
+            yield path
+
+    async def load():
+        results = []
+        async for path, df in aload_ligolw_tables(
+            iter_paths(), "postcoh", ordered=ordered, max_concurrency=max_concurrency
+        ):
+            # paths are only consumed as the window of pending files is refilled
+            assert len(consumed) <= len(results) + max_concurrency + 1
+            results.append((path, df))
+        return results
+
+    results = asyncio.run(load())
+    if ordered:
+        assert [path for path, _ in results] == paths
+    assert sorted(path for path, _ in results) == sorted(paths)
+    for path, df in results:
+        pd.testing.assert_frame_equal(df, load_ligolw_tables(path, "postcoh"))
+
+
+@pytest.mark.parametrize("ilwdchar_compat", [True, False])
+@pytest.mark.parametrize("suffix", [".xml", ".xml.gz"])
+def test_write_tables_round_trip(tmp_path, suffix, ilwdchar_compat):
+    names = ["process", "postcoh", "sngl_inspiral", "coinc_event_map", "coinc_inspiral"]
+    tables = {name: load_ligolw_tables(COINC_PATHS[0], name) for name in names}
+    path = tmp_path / f"H1L1_1186642820_1{suffix}"
+    write_ligolw_tables(path, tables, ilwdchar_compat=ilwdchar_compat)
+
+    with open(path, "rb") as f:
+        assert (f.read(2) == b"\x1f\x8b") == suffix.endswith(".gz")
+    with (gzip.open if suffix.endswith(".gz") else open)(path, "rb") as f:
+        assert (b'"postcoh:event_id:' in f.read()) == ilwdchar_compat
+
+    # documents are valid LIGO_LW and read back to the same tables
+    ligo.lw.utils.load_filename(str(path), contenthandler=LIGOLWContentHandler)
+    for name, df in tables.items():
+        pd.testing.assert_frame_equal(load_ligolw_tables(path, name), df)
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from spiir.io import TriggerDatabase
+from spiir.io.ligolw import load_ligolw_tables, write_ligolw_tables
+
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "share" / "data"
+COINC_PATH = DATA_DIR / "coinc" / "H1L1_1186642820_386_38.xml"
+
+
+@pytest.fixture(scope="module")
+def postcoh(tmp_path_factory):
+    # a postcoh table of 200 rows with distinct event_ids, fars and ifos
+    df = load_ligolw_tables(COINC_PATH, "postcoh")
+    df = df.loc[df.index.repeat(200)].reset_index(drop=True)
+    df["event_id"] = np.arange(200)
+    df["far"] = np.logspace(-10, -2, 200)
+    df["ifos"] = np.where(np.arange(200) % 3, "H1L1", "H1L1V1")
+    path = tmp_path_factory.mktemp("postcoh") / "H1L1_1186642820_200.xml"
+    write_ligolw_tables(path, {"postcoh": df})
+    return str(path), load_ligolw_tables(path, "postcoh")
+
+
+def test_database_queries_match_load_ligolw_tables(tmp_path, postcoh):
+    path, df = postcoh
+    # python floats that round to a stored float32 far, but are not equal to it
+    far = float(df["far"].iloc[100])
+    above, below = float(np.nextafter(far, 1)), float(np.nextafter(far, 0))
+    assert np.float32(above) == np.float32(below) == df["far"].iloc[100]
+    wheres = [
+        [("far", "<", above)],
+        [("far", "<=", below)],
+        [("far", "==", above)],
+        [("far", "in", [far, 1.])],
+        [("far", ">", np.float64(below))],
+        [("ifos", "==", "H1L1V1"), ("far", ">=", 1e-6)],
+        [("event_id", "not in", [0, 1, 2])],
+    ]
+
+    with TriggerDatabase(tmp_path / "triggers.sqlite", ["postcoh"]) as db:
+        assert db.ingest(path) == 1
+        assert db.ingest(path) == 0
+        assert db.count("postcoh") == len(df)
+        for where in wheres:
+            expected = load_ligolw_tables(path, "postcoh", where=where)
+            result = db.query("postcoh", where=where, order_by="event_id")
+            assert len(result) == len(expected) > 0, where
+            pd.testing.assert_frame_equal(
+                result[expected.columns], expected, check_dtype=False
+            )
+
+    # indexes are created with their tables, and the database can be reopened
+    with TriggerDatabase(tmp_path / "triggers.sqlite", ["postcoh"]) as db:
+        indexes = db.sql("SELECT name FROM sqlite_master WHERE type = 'index'")
+        assert set(indexes["name"]) >= {
+            "postcoh_file_id_index", "postcoh_far_index", "postcoh_end_time_index"
+        }
+        assert db.count("postcoh") == len(df)